@@ -15,6 +15,7 @@ This script:
 import os
 import sys
 import logging
+import threading
 from pathlib import Path
 
 
@@ -65,6 +66,21 @@ def create_directories(project_root: Path) -> None:
         logging.debug(f"Config directory exists: {config_dir}")
 
 
+def preload_in_background() -> None:
+    """
+    Import the lazily loaded forms and warm the anomaly detection kernel.
+
+    Runs on a daemon thread started once the first screen is idle, so neither
+    the imports nor the kernel's first run (a JIT compile with Numba) land on
+    the UI thread when the user opens a form. Never touches Tk.
+    """
+    from src.gui import forms
+    from src.services.anomaly_detector import AnomalyDetector
+
+    forms.preload()
+    AnomalyDetector.warm_up()
+
+
 def main():
     """
     Main application entry point.
@@ -95,6 +111,11 @@ def main():
         logging.info("Launching client selection screen...")
         app.show_form(ClientSelectionForm)
 
+        # Warm the lazily loaded forms and kernels off the UI thread once the first screen is up
+        app.after_idle(
+            lambda: threading.Thread(target=preload_in_background, name='form-preload', daemon=True).start()
+        )
+
         # Start GUI event loop
         logging.info("Application ready - starting event loop")
         app.mainloop()
@@ -4,12 +4,35 @@ Base Excel writer providing shared workbook management and formatting utilities.
 All sheet-specific writers inherit from BaseExcelWriter to access consistent
 formatting methods for currency, percentages, borders, headers, and auto-sizing.
 """
-from typing import Any, Dict, Optional, Tuple, Generator
+from typing import Any, Dict, List, Optional, Tuple, Generator
+
+import numpy as np
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
 
+# Shared style objects so formatting helpers don't allocate a new style per cell
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+BOLD_FONT = Font(bold=True)
+
+# Header formatting registered once per workbook and assigned by name
+HEADER_STYLE_NAME = 'bold_header'
+
+# Forecast bound keys with their row label suffix, in display order
+FORECAST_BOUND_LABELS = (
+    ('lower_bound', 'Lower'),
+    ('projected', 'Projected'),
+    ('upper_bound', 'Upper'),
+)
+
+
 class BaseExcelWriter:
     """
     Base class for Excel export functionality with reusable formatting utilities.
@@ -26,6 +49,23 @@ class BaseExcelWriter:
         if 'Sheet' in self.workbook.sheetnames:
             del self.workbook['Sheet']
 
+    def _ensure_header_style(self) -> str:
+        """
+        Register the shared header NamedStyle on the workbook if not already present.
+
+        Returns:
+            Name of the header style, for assignment via cell.style
+        """
+        if HEADER_STYLE_NAME not in self.workbook.named_styles:
+            self.workbook.add_named_style(NamedStyle(
+                name=HEADER_STYLE_NAME,
+                font=Font(bold=True, size=11),
+                fill=PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid'),
+                border=THIN_BORDER,
+                alignment=Alignment(horizontal='center', vertical='center')
+            ))
+        return HEADER_STYLE_NAME
+
     def apply_header_style(self, ws: Worksheet, cell_range: str) -> None:
         """
         Apply header styling to cell or range (bold font, fill color, border).
@@ -47,17 +87,10 @@ class BaseExcelWriter:
             # Single cell like 'A1'
             cells = [ws[cell_range]]
 
-        # Apply styles to each cell
+        # Apply named header style to each cell
+        style_name = self._ensure_header_style()
         for cell in cells:
-            cell.font = Font(bold=True, size=11)
-            cell.fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+            cell.style = style_name
 
     def format_currency(self, ws: Worksheet, cell_range: str) -> None:
         """
@@ -127,15 +160,8 @@ class BaseExcelWriter:
                 cells = list(cells)
 
         # Apply borders
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
         for cell in cells:
-            cell.border = thin_border
+            cell.border = THIN_BORDER
 
     def auto_adjust_column_widths(self, ws: Worksheet) -> None:
         """
@@ -165,6 +191,38 @@ class BaseExcelWriter:
                 adjusted_width = max(max_length * 1.2, 10)  # Minimum width of 10
                 ws.column_dimensions[column_letter].width = adjusted_width
 
+    def track_column_widths(self, col_widths: List[int], row: List[Any]) -> None:
+        """
+        Update per-column max content lengths with the values of one row.
+
+        Lets writers that build rows sequentially size columns without re-scanning
+        the sheet afterwards (see apply_column_widths).
+
+        Args:
+            col_widths: Max content length per column, index 0 is column A
+            row: Row values starting at column A (None for empty cells)
+        """
+        for idx, value in enumerate(row):
+            if value is not None:
+                length = len(str(value))
+                if length > col_widths[idx]:
+                    col_widths[idx] = length
+
+    def apply_column_widths(self, ws: Worksheet, col_widths: List[int]) -> None:
+        """
+        Set column widths from collected max content lengths.
+
+        Uses the same sizing rule as auto_adjust_column_widths().
+
+        Args:
+            ws: Worksheet to adjust
+            col_widths: Max content length per column, index 0 is column A
+        """
+        for col_idx, max_length in enumerate(col_widths, 1):
+            # Set adjusted width (multiply by 1.2 for padding)
+            adjusted_width = max(max_length * 1.2, 10)  # Minimum width of 10
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+
     def traverse_hierarchy(
         self,
         hierarchy: Dict[str, Any],
@@ -210,6 +268,101 @@ class BaseExcelWriter:
         for child in children:
             yield from self.traverse_hierarchy(child, indent_level + 1, forecast)
 
+    def _to_soa(self, node: Dict[str, Any], horizon: int) -> Dict[str, np.ndarray]:
+        """
+        Convert a forecast node's month-keyed value dicts into parallel arrays.
+
+        Each of 'projected', 'lower_bound', 'upper_bound' becomes a float64 array of
+        shape (horizon,) where index i holds month i + 1. Missing months are NaN.
+
+        Args:
+            node: Forecast node or calculated row with month-keyed value dicts
+            horizon: Number of forecast months
+
+        Returns:
+            Dict mapping bound key to its value array
+        """
+        soa = {}
+        for key in ('projected', 'lower_bound', 'upper_bound'):
+            values = node.get(key) or {}
+            months = (values.get(month) for month in range(1, horizon + 1))
+            soa[key] = np.fromiter(
+                (np.nan if value is None else value for value in months),
+                dtype=np.float64,
+                count=horizon
+            )
+        return soa
+
+    def _soa_row(self, label: str, values: np.ndarray) -> List[Any]:
+        """
+        Build a worksheet row from a label and a value array (NaN becomes an empty cell).
+
+        Args:
+            label: Text for column A
+            values: Value array from _to_soa()
+
+        Returns:
+            List suitable for Worksheet.append()
+        """
+        return [label] + np.where(np.isnan(values), None, values).tolist()
+
+    def _emit_bound_rows(
+        self,
+        ws: Worksheet,
+        row_idx: int,
+        name: str,
+        nodes: List[Dict[str, Any]],
+        horizon: int,
+        is_percentage: bool = False,
+        indent_level: int = 0,
+        col_widths: Optional[List[int]] = None
+    ) -> int:
+        """
+        Append Lower, Projected and Upper rows for one forecast metric.
+
+        Each node in ``nodes`` contributes ``horizon`` columns, laid out side-by-side
+        (one node per scenario). The Projected row is bolded and value cells receive
+        percentage or currency formatting.
+
+        Args:
+            ws: Worksheet to append to (rows must be written sequentially)
+            row_idx: Row index the Lower row will land on
+            name: Metric name used for the row labels
+            nodes: Per-scenario dicts with 'projected', 'lower_bound', 'upper_bound'
+            horizon: Number of forecast months per scenario
+            is_percentage: Format values as percentages instead of currency
+            indent_level: Indentation applied to the label cell
+            col_widths: Optional per-column max lengths, updated with each row written
+
+        Returns:
+            Row index following the last row written
+        """
+        soas = [self._to_soa(node, horizon) for node in nodes]
+        last_col_letter = get_column_letter(horizon * len(nodes) + 1)
+
+        for bound, suffix in FORECAST_BOUND_LABELS:
+            values = np.concatenate([soa[bound] for soa in soas])
+            row = self._soa_row(f'{name} ({suffix})', values)
+            ws.append(row)
+            if col_widths is not None:
+                self.track_column_widths(col_widths, row)
+            if indent_level:
+                ws.cell(row=row_idx, column=1).alignment = Alignment(indent=indent_level)
+
+            value_range = f'B{row_idx}:{last_col_letter}{row_idx}'
+            if bound == 'projected':
+                self.format_bold(ws, f'A{row_idx}')
+                self.format_bold(ws, value_range)
+
+            if is_percentage:
+                self.format_percentage(ws, value_range)
+            else:
+                self.format_currency(ws, value_range)
+
+            row_idx += 1
+
+        return row_idx
+
     def apply_trend_indicator(self, ws: Worksheet, cell: str, growth_rate: Optional[float]) -> None:
         """
         Apply trend indicator symbol and color to a cell based on growth rate.
@@ -282,7 +435,7 @@ class BaseExcelWriter:
 
         # Apply bold font to each cell
         for cell in cells:
-            cell.font = Font(bold=True)
+            cell.font = BOLD_FONT
 
     def save(self, file_path: str) -> None:
         """
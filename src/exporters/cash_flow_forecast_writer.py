@@ -5,8 +5,9 @@ Generates Cash Flow Forecast sheet with variable-horizon projections (6 or 12 mo
 showing Lower Bound, Projected, and Upper Bound as three consecutive rows per metric.
 Supports multi-scenario side-by-side display.
 """
+from typing import List
+
 from .base_writer import BaseExcelWriter
-from openpyxl.styles import Alignment
 from openpyxl.utils import get_column_letter
 
 
@@ -20,6 +21,12 @@ class CashFlowForecastReportWriter(BaseExcelWriter):
     Projected row is bolded. Supports multi-scenario side-by-side comparison.
     """
 
+    # Cash flow calculated rows in display order: (key, label, is_percentage)
+    CALCULATED_ROWS = [
+        ('beginning_cash', 'Beginning Cash', False),
+        ('ending_cash', 'Ending Cash', False),
+    ]
+
     def write(self, forecast_model) -> None:
         """
         Generate Cash Flow Forecast sheet from CashFlowForecastModel or MultiScenarioForecastResult.
@@ -39,31 +46,35 @@ class CashFlowForecastReportWriter(BaseExcelWriter):
         )
 
         if is_multi_scenario:
-            self._write_multi_scenario(ws, forecast_model)
+            col_widths = self._write_multi_scenario(ws, forecast_model)
         else:
-            self._write_single_scenario(ws, forecast_model)
+            col_widths = self._write_single_scenario(ws, forecast_model)
 
-        # Auto-adjust column widths
-        self.auto_adjust_column_widths(ws)
+        # Size columns from lengths collected while writing
+        self.apply_column_widths(ws, col_widths)
 
-    def _write_single_scenario(self, ws, forecast_model) -> None:
+    def _write_single_scenario(self, ws, forecast_model) -> List[int]:
         """
         Write single scenario Cash Flow Forecast.
 
         Args:
             ws: Worksheet to write to
             forecast_model: CashFlowForecastModel instance
+
+        Returns:
+            Max content length per column, for apply_column_widths()
         """
         # Get forecast horizon from metadata
         forecast_horizon = forecast_model.metadata.get('forecast_horizon', 6)
 
         # Write header row: Account | Month 1 | Month 2 | ... | Month N
-        ws.cell(row=1, column=1, value='Account')
-        for month in range(1, forecast_horizon + 1):
-            ws.cell(row=1, column=month + 1, value=f'Month {month}')
+        header = ['Account'] + [f'Month {month}' for month in range(1, forecast_horizon + 1)]
+        ws.append(header)
+        col_widths = [0] * len(header)
+        self.track_column_widths(col_widths, header)
 
         # Apply header style
-        last_col_letter = get_column_letter(forecast_horizon + 1)
+        last_col_letter = get_column_letter(len(header))
         self.apply_header_style(ws, f'A1:{last_col_letter}1')
 
         # Track current row
@@ -75,91 +86,43 @@ class CashFlowForecastReportWriter(BaseExcelWriter):
             for indent_level, name, projected, lower_bound, upper_bound in self.traverse_hierarchy(
                 section_node, indent_level=0, forecast=True
             ):
-                # Write Lower Bound row
-                cell = ws.cell(row=current_row, column=1, value=f'{name} (Lower)')
-                cell.alignment = Alignment(indent=indent_level)
-                for month in range(1, forecast_horizon + 1):
-                    value = lower_bound.get(month)
-                    if value is not None:
-                        ws.cell(row=current_row, column=month + 1, value=value)
-                current_row += 1
-
-                # Write Projected row (bolded)
-                cell = ws.cell(row=current_row, column=1, value=f'{name} (Projected)')
-                cell.alignment = Alignment(indent=indent_level)
-                self.format_bold(ws, f'A{current_row}')
-                for month in range(1, forecast_horizon + 1):
-                    value = projected.get(month)
-                    if value is not None:
-                        ws.cell(row=current_row, column=month + 1, value=value)
-                # Bold the entire projected row
-                self.format_bold(ws, f'B{current_row}:{last_col_letter}{current_row}')
-                current_row += 1
-
-                # Write Upper Bound row
-                cell = ws.cell(row=current_row, column=1, value=f'{name} (Upper)')
-                cell.alignment = Alignment(indent=indent_level)
-                for month in range(1, forecast_horizon + 1):
-                    value = upper_bound.get(month)
-                    if value is not None:
-                        ws.cell(row=current_row, column=month + 1, value=value)
-                current_row += 1
+                node = {'projected': projected, 'lower_bound': lower_bound, 'upper_bound': upper_bound}
+                current_row = self._emit_bound_rows(
+                    ws, current_row, name, [node], forecast_horizon,
+                    indent_level=indent_level, col_widths=col_widths
+                )
 
         # Write calculated rows (Beginning Cash, Ending Cash) if available
         if forecast_model.calculated_rows:
             # Add blank row for separation
             current_row += 1
+            ws.append([])
 
-            for calc_key in ['beginning_cash', 'ending_cash']:
+            for calc_key, calc_name, is_percentage in self.CALCULATED_ROWS:
                 if calc_key in forecast_model.calculated_rows:
-                    calc_row_data = forecast_model.calculated_rows[calc_key]
-                    calc_name = 'Beginning Cash' if calc_key == 'beginning_cash' else 'Ending Cash'
-
-                    projected = calc_row_data.get('projected', {})
-                    lower_bound = calc_row_data.get('lower_bound', {})
-                    upper_bound = calc_row_data.get('upper_bound', {})
-
-                    # Lower Bound
-                    ws.cell(row=current_row, column=1, value=f'{calc_name} (Lower)')
-                    for month in range(1, forecast_horizon + 1):
-                        value = lower_bound.get(month)
-                        if value is not None:
-                            ws.cell(row=current_row, column=month + 1, value=value)
-                    current_row += 1
-
-                    # Projected (bolded)
-                    ws.cell(row=current_row, column=1, value=f'{calc_name} (Projected)')
-                    self.format_bold(ws, f'A{current_row}')
-                    for month in range(1, forecast_horizon + 1):
-                        value = projected.get(month)
-                        if value is not None:
-                            ws.cell(row=current_row, column=month + 1, value=value)
-                    self.format_bold(ws, f'B{current_row}:{last_col_letter}{current_row}')
-                    current_row += 1
-
-                    # Upper Bound
-                    ws.cell(row=current_row, column=1, value=f'{calc_name} (Upper)')
-                    for month in range(1, forecast_horizon + 1):
-                        value = upper_bound.get(month)
-                        if value is not None:
-                            ws.cell(row=current_row, column=month + 1, value=value)
-                    current_row += 1
-
-        # Apply currency formatting to all value columns
-        if current_row > 2:
-            self.format_currency(ws, f'B2:{last_col_letter}{current_row - 1}')
+                    current_row = self._emit_bound_rows(
+                        ws, current_row, calc_name,
+                        [forecast_model.calculated_rows[calc_key]],
+                        forecast_horizon,
+                        is_percentage=is_percentage, col_widths=col_widths
+                    )
 
         # Apply borders to entire table
         if current_row > 1:
             self.apply_borders(ws, f'A1:{last_col_letter}{current_row - 1}')
 
-    def _write_multi_scenario(self, ws, multi_scenario_result) -> None:
+        return col_widths
+
+    def _write_multi_scenario(self, ws, multi_scenario_result) -> List[int]:
         """
         Write multi-scenario Cash Flow Forecast with scenarios side-by-side.
 
         Args:
             ws: Worksheet to write to
             multi_scenario_result: MultiScenarioForecastResult instance with scenarios list
+
+        Returns:
+            Max content length per column, for apply_column_widths()
         """
         scenarios = multi_scenario_result.scenarios
 
@@ -167,17 +130,17 @@ class CashFlowForecastReportWriter(BaseExcelWriter):
         forecast_horizon = scenarios[0].metadata.get('forecast_horizon', 6)
 
         # Write header row: Account | Scenario1 - Month 1 | Scenario1 - Month 2 | ... | Scenario2 - Month 1 | ...
-        ws.cell(row=1, column=1, value='Account')
-        col_idx = 2
-
+        header = ['Account']
         for scenario in scenarios:
             scenario_name = scenario.metadata.get('scenario_name', 'Scenario')
             for month in range(1, forecast_horizon + 1):
-                ws.cell(row=1, column=col_idx, value=f'{scenario_name} - Month {month}')
-                col_idx += 1
+                header.append(f'{scenario_name} - Month {month}')
+        ws.append(header)
+        col_widths = [0] * len(header)
+        self.track_column_widths(col_widths, header)
 
         # Apply header style
-        last_col_letter = get_column_letter(col_idx - 1)
+        last_col_letter = get_column_letter(len(header))
         self.apply_header_style(ws, f'A1:{last_col_letter}1')
 
         # Track current row
@@ -192,108 +155,40 @@ class CashFlowForecastReportWriter(BaseExcelWriter):
             for indent_level, name, _, _, _ in self.traverse_hierarchy(
                 section_node, indent_level=0, forecast=True
             ):
-                # Write Lower Bound row
-                cell = ws.cell(row=current_row, column=1, value=f'{name} (Lower)')
-                cell.alignment = Alignment(indent=indent_level)
-                col_idx = 2
-                for scenario in scenarios:
-                    # Find matching metric in this scenario's hierarchy
-                    lower_bound = self._find_metric_values(scenario.hierarchy, name, 'lower_bound')
-                    for month in range(1, forecast_horizon + 1):
-                        value = lower_bound.get(month) if lower_bound else None
-                        if value is not None:
-                            ws.cell(row=current_row, column=col_idx, value=value)
-                        col_idx += 1
-                current_row += 1
-
-                # Write Projected row (bolded)
-                cell = ws.cell(row=current_row, column=1, value=f'{name} (Projected)')
-                cell.alignment = Alignment(indent=indent_level)
-                self.format_bold(ws, f'A{current_row}')
-                col_idx = 2
-                for scenario in scenarios:
-                    # Find matching metric in this scenario's hierarchy
-                    projected = self._find_metric_values(scenario.hierarchy, name, 'projected')
-                    for month in range(1, forecast_horizon + 1):
-                        value = projected.get(month) if projected else None
-                        if value is not None:
-                            ws.cell(row=current_row, column=col_idx, value=value)
-                        col_idx += 1
-                self.format_bold(ws, f'B{current_row}:{last_col_letter}{current_row}')
-                current_row += 1
-
-                # Write Upper Bound row
-                cell = ws.cell(row=current_row, column=1, value=f'{name} (Upper)')
-                cell.alignment = Alignment(indent=indent_level)
-                col_idx = 2
-                for scenario in scenarios:
-                    # Find matching metric in this scenario's hierarchy
-                    upper_bound = self._find_metric_values(scenario.hierarchy, name, 'upper_bound')
-                    for month in range(1, forecast_horizon + 1):
-                        value = upper_bound.get(month) if upper_bound else None
-                        if value is not None:
-                            ws.cell(row=current_row, column=col_idx, value=value)
-                        col_idx += 1
-                current_row += 1
+                # Find matching metric in each scenario's hierarchy
+                nodes = [
+                    {
+                        value_type: self._find_metric_values(scenario.hierarchy, name, value_type)
+                        for value_type in ('projected', 'lower_bound', 'upper_bound')
+                    }
+                    for scenario in scenarios
+                ]
+                current_row = self._emit_bound_rows(
+                    ws, current_row, name, nodes, forecast_horizon,
+                    indent_level=indent_level, col_widths=col_widths
+                )
 
         # Write calculated rows if available
         if first_scenario.calculated_rows:
             # Add blank row for separation
             current_row += 1
+            ws.append([])
 
-            for calc_key in ['beginning_cash', 'ending_cash']:
+            for calc_key, calc_name, is_percentage in self.CALCULATED_ROWS:
                 if calc_key in first_scenario.calculated_rows:
-                    calc_name = 'Beginning Cash' if calc_key == 'beginning_cash' else 'Ending Cash'
-
-                    # Lower Bound
-                    ws.cell(row=current_row, column=1, value=f'{calc_name} (Lower)')
-                    col_idx = 2
-                    for scenario in scenarios:
-                        calc_row_data = scenario.calculated_rows.get(calc_key, {})
-                        lower_bound = calc_row_data.get('lower_bound', {})
-                        for month in range(1, forecast_horizon + 1):
-                            value = lower_bound.get(month)
-                            if value is not None:
-                                ws.cell(row=current_row, column=col_idx, value=value)
-                            col_idx += 1
-                    current_row += 1
-
-                    # Projected (bolded)
-                    ws.cell(row=current_row, column=1, value=f'{calc_name} (Projected)')
-                    self.format_bold(ws, f'A{current_row}')
-                    col_idx = 2
-                    for scenario in scenarios:
-                        calc_row_data = scenario.calculated_rows.get(calc_key, {})
-                        projected = calc_row_data.get('projected', {})
-                        for month in range(1, forecast_horizon + 1):
-                            value = projected.get(month)
-                            if value is not None:
-                                ws.cell(row=current_row, column=col_idx, value=value)
-                            col_idx += 1
-                    self.format_bold(ws, f'B{current_row}:{last_col_letter}{current_row}')
-                    current_row += 1
-
-                    # Upper Bound
-                    ws.cell(row=current_row, column=1, value=f'{calc_name} (Upper)')
-                    col_idx = 2
-                    for scenario in scenarios:
-                        calc_row_data = scenario.calculated_rows.get(calc_key, {})
-                        upper_bound = calc_row_data.get('upper_bound', {})
-                        for month in range(1, forecast_horizon + 1):
-                            value = upper_bound.get(month)
-                            if value is not None:
-                                ws.cell(row=current_row, column=col_idx, value=value)
-                            col_idx += 1
-                    current_row += 1
-
-        # Apply currency formatting to all value columns
-        if current_row > 2:
-            self.format_currency(ws, f'B2:{last_col_letter}{current_row - 1}')
+                    current_row = self._emit_bound_rows(
+                        ws, current_row, calc_name,
+                        [scenario.calculated_rows.get(calc_key, {}) for scenario in scenarios],
+                        forecast_horizon,
+                        is_percentage=is_percentage, col_widths=col_widths
+                    )
 
         # Apply borders to entire table
         if current_row > 1:
             self.apply_borders(ws, f'A1:{last_col_letter}{current_row - 1}')
 
+        return col_widths
+
     def _find_metric_values(self, hierarchy: dict, metric_name: str, value_type: str) -> dict:
         """
         Find a specific metric's values in hierarchy by name.
@@ -1,12 +1,19 @@
 """
 Reusable GUI components for form fields.
 
-Provides labeled entry, numeric entry with validation, and dropdown components.
+Provides labeled entry, numeric entry with validation, and dropdown components,
+plus shared named fonts and chart pixel to Tk image conversion.
 """
 from .form_fields import LabeledEntry, NumericEntry, LabeledDropdown
+from .fonts import get_font
+from .images import png_to_photo_image, rgba_to_photo_image, rgba_to_png
 
 __all__ = [
     'LabeledEntry',
     'NumericEntry',
     'LabeledDropdown',
+    'get_font',
+    'rgba_to_photo_image',
+    'rgba_to_png',
+    'png_to_photo_image',
 ]
@@ -0,0 +1,41 @@
+"""
+Shared named fonts for form widgets.
+
+Tk fonts belong to one interpreter, so fonts are created on first use per Tk
+root and reused by every widget under that root instead of each widget parsing
+its own font tuple.
+"""
+import tkinter as tk
+from tkinter import font as tkfont
+from typing import Dict, Tuple
+from weakref import WeakKeyDictionary
+
+FONT_FAMILY = 'Arial'
+
+# Tk root -> {(size, weight): Font}; the Font objects must stay referenced,
+# because Tk deletes a named font when its Python object is collected
+_fonts: 'WeakKeyDictionary[tk.Misc, Dict[Tuple[int, str], tkfont.Font]]' = WeakKeyDictionary()
+
+
+def get_font(widget: tk.Misc, size: int, weight: str = 'normal') -> tkfont.Font:
+    """
+    Get the shared Arial font of the given size and weight for a widget's Tk root.
+
+    Args:
+        widget: Any widget (or the root) the font will be used under
+        size: Point size
+        weight: 'normal' or 'bold' (default: 'normal')
+
+    Returns:
+        Named Font object to pass as a widget's font option
+    """
+    root = widget._root()
+    fonts = _fonts.get(root)
+    if fonts is None:
+        fonts = _fonts[root] = {}
+
+    key = (size, weight)
+    font = fonts.get(key)
+    if font is None:
+        font = fonts[key] = tkfont.Font(root=root, family=FONT_FAMILY, size=size, weight=weight)
+    return font
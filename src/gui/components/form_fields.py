@@ -17,6 +17,12 @@ class LabeledEntry(tk.Frame):
     interface for data binding.
     """
 
+    # tk.Frame still carries a __dict__; slots give the field widgets fast attribute access
+    __slots__ = ('label', 'entry')
+
+    LABEL_WIDTH = 25
+    ENTRY_WIDTH = 30
+
     def __init__(self, parent: tk.Widget, label_text: str, default_value: str = ""):
         """
         Initialize labeled entry field.
@@ -29,11 +35,11 @@ class LabeledEntry(tk.Frame):
         super().__init__(parent)
 
         # Create label widget
-        self.label = tk.Label(self, text=label_text, width=25, anchor='w')
+        self.label = tk.Label(self, text=label_text, width=self.LABEL_WIDTH, anchor='w')
         self.label.pack(side=tk.LEFT, padx=5, pady=5)
 
         # Create entry widget
-        self.entry = tk.Entry(self, width=30)
+        self.entry = tk.Entry(self, width=self.ENTRY_WIDTH)
         self.entry.pack(side=tk.LEFT, padx=5, pady=5)
 
         # Set default value
@@ -68,6 +74,8 @@ class NumericEntry(LabeledEntry):
     Validation occurs on retrieval, not on keystroke, to avoid disrupting user input.
     """
 
+    __slots__ = ('value_type',)
+
     def __init__(self, parent: tk.Widget, label_text: str, default_value: Union[str, float, int] = "", value_type: type = float):
         """
         Initialize numeric entry field.
@@ -120,6 +128,11 @@ class LabeledDropdown(tk.Frame):
     interface for data binding.
     """
 
+    __slots__ = ('label', 'selected_value', 'dropdown')
+
+    LABEL_WIDTH = 25
+    DROPDOWN_WIDTH = 27
+
     def __init__(self, parent: tk.Widget, label_text: str, options: List[str], default_value: str = None):
         """
         Initialize labeled dropdown field.
@@ -133,7 +146,7 @@ class LabeledDropdown(tk.Frame):
         super().__init__(parent)
 
         # Create label widget
-        self.label = tk.Label(self, text=label_text, width=25, anchor='w')
+        self.label = tk.Label(self, text=label_text, width=self.LABEL_WIDTH, anchor='w')
         self.label.pack(side=tk.LEFT, padx=5, pady=5)
 
         # Create StringVar to track selected value
@@ -147,7 +160,7 @@ class LabeledDropdown(tk.Frame):
 
         # Create dropdown widget using OptionMenu
         self.dropdown = tk.OptionMenu(self, self.selected_value, *options)
-        self.dropdown.config(width=27)
+        self.dropdown.config(width=self.DROPDOWN_WIDTH)
         self.dropdown.pack(side=tk.LEFT, padx=5, pady=5)
 
     def get_value(self) -> str:
@@ -0,0 +1,83 @@
+"""
+Conversion of rendered matplotlib pixels into Tk images.
+
+Charts drawn on an Agg canvas (possibly on a worker thread) are shown as plain
+tk.PhotoImage objects. The pixels are handed to Tk as binary PPM data, which
+PhotoImage reads natively, so no private matplotlib backend API is needed.
+Charts kept for later are stored as PNG, which Tk also reads natively.
+"""
+import io
+import tkinter as tk
+
+import numpy as np
+
+
+def rgba_to_ppm(buffer: np.ndarray) -> bytes:
+    """
+    Encode an RGBA pixel buffer as binary PPM (P6) image data.
+
+    PPM has no alpha channel; chart figures are drawn on an opaque background,
+    so the alpha channel is dropped.
+
+    Args:
+        buffer: (height, width, 4) uint8 RGBA array, e.g. from buffer_rgba()
+
+    Returns:
+        PPM bytes (header followed by packed RGB rows)
+    """
+    height, width = buffer.shape[:2]
+    header = f'P6 {width} {height} 255\n'.encode('ascii')
+    return header + np.ascontiguousarray(buffer[..., :3], dtype=np.uint8).tobytes()
+
+
+def rgba_to_photo_image(buffer: np.ndarray, master: tk.Misc) -> tk.PhotoImage:
+    """
+    Create a Tk photo image showing an RGBA pixel buffer.
+
+    Must be called on the Tk thread. Callers keep a reference to the result;
+    Tk does not, and the image disappears if it is garbage collected.
+
+    Args:
+        buffer: (height, width, 4) uint8 RGBA array
+        master: Widget the image belongs to
+
+    Returns:
+        PhotoImage of the buffer's size
+    """
+    return tk.PhotoImage(master=master, data=rgba_to_ppm(buffer), format='PPM')
+
+
+def rgba_to_png(buffer: np.ndarray) -> bytes:
+    """
+    Encode an RGBA pixel buffer as compressed PNG image data.
+
+    Matplotlib is imported on first use, so importing this module stays cheap.
+
+    Args:
+        buffer: (height, width, 4) uint8 RGBA array, e.g. from buffer_rgba()
+
+    Returns:
+        PNG bytes
+    """
+    from matplotlib.image import imsave
+
+    output = io.BytesIO()
+    imsave(output, buffer, format='png')
+    return output.getvalue()
+
+
+def png_to_photo_image(data: bytes, master: tk.Misc) -> tk.PhotoImage:
+    """
+    Create a Tk photo image from PNG data.
+
+    Must be called on the Tk thread. Callers keep a reference to the result;
+    Tk does not, and the image disappears if it is garbage collected.
+
+    Args:
+        data: PNG bytes, e.g. from rgba_to_png()
+        master: Widget the image belongs to
+
+    Returns:
+        PhotoImage of the PNG's size
+    """
+    return tk.PhotoImage(master=master, data=data, format='PNG')
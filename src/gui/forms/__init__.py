@@ -2,13 +2,37 @@
 Parameter configuration forms.
 
 Provides sample parameter form and will include budget/forecast forms in future sprints.
+
+Startup-critical forms are imported eagerly; the rest are imported lazily on first
+attribute access (PEP 562), so importing this package (or one form submodule) does
+not load every other form module.
+Set the EAGER_IMPORT environment variable to import all forms up front
+(e.g. for frozen/PyInstaller builds that need to see every import).
 """
+import importlib
+import importlib.util
+import os
+import sys
+from typing import TYPE_CHECKING
+
+# Form triage (measure with `python -X importtime`, after src.gui.app is imported):
+# - Eager: cheap to import (~2 ms) and opened from the main menu in most sessions,
+#   so lazy loading would only move the cost to the first click.
+# - Lazy: rarely opened or pulls in heavier dependencies (matplotlib canvases for
+#   the anomaly forms). New forms default to lazy unless measurement says otherwise.
 from .sample_params_form import SampleParamsForm
 from .budget_params_form import BudgetParamsForm
-from .scenario_list_form import ScenarioListForm
-from .forecast_params_form import ForecastParamsForm
-from .anomaly_review_form import AnomalyReviewForm
-from .anomaly_annotation_form import AnomalyAnnotationForm
+
+# Lazily exported form class -> submodule that defines it
+_LAZY = {
+    'ScenarioListForm': '.scenario_list_form',
+    'ForecastParamsForm': '.forecast_params_form',
+    'AnomalyReviewForm': '.anomaly_review_form',
+    'AnomalyAnnotationForm': '.anomaly_annotation_form',
+}
+
+# Submodules reachable as package attributes (forms.sample_params_form.SampleParamsForm)
+_SUBMODULES = frozenset(path.lstrip('.') for path in _LAZY.values())
 
 __all__ = [
     'SampleParamsForm',
@@ -18,3 +42,108 @@ __all__ = [
     'AnomalyReviewForm',
     'AnomalyAnnotationForm',
 ]
+
+# PEP 810 (Python 3.15+): imports of these modules are lazy proxies resolved by the
+# interpreter on first use, so the plain imports below cost nothing up front and
+# skip __getattr__ entirely. Older Pythons ignore this list and use __getattr__;
+# static type checkers and IDEs always see the imports.
+__lazy_modules__ = [f'{__name__}{path}' for path in _LAZY.values()]
+
+if TYPE_CHECKING or sys.version_info >= (3, 15):
+    from .scenario_list_form import ScenarioListForm
+    from .forecast_params_form import ForecastParamsForm
+    from .anomaly_review_form import AnomalyReviewForm
+    from .anomaly_annotation_form import AnomalyAnnotationForm
+
+
+def __getattr__(name):
+    """
+    Import the submodule defining a form class on first access.
+
+    The resolved class is cached in the module namespace, so later lookups are
+    plain attribute access and never reach this function again. Form submodules
+    can also be reached by name; the import system binds them on the package.
+
+    Args:
+        name: Attribute being looked up on the package
+
+    Returns:
+        Form class or form submodule named by ``name``
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily exported form or submodule
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def load(submodule: str):
+    """
+    Return a form submodule whose body runs on first attribute access.
+
+    Uses importlib.util.LazyLoader: the module object is registered in sys.modules
+    immediately, but its top-level code (and any side effects such as widget
+    class setup) only executes when an attribute is first read. Modules that are
+    already imported are returned as-is.
+
+    Args:
+        submodule: Submodule name relative to this package (e.g. 'sample_params_form')
+
+    Returns:
+        Module object (a lazy proxy until first attribute access)
+
+    Raises:
+        ModuleNotFoundError: If no such submodule exists
+    """
+    fullname = f'{__name__}.{submodule}'
+    if fullname in sys.modules:
+        return sys.modules[fullname]
+
+    spec = importlib.util.find_spec(fullname)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {fullname!r}", name=fullname)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    loader.exec_module(module)
+    return module
+
+
+def preload(*names: str) -> None:
+    """
+    Resolve lazily exported forms ahead of first use.
+
+    Intended to run during idle time (e.g. from a background thread started via
+    ``after_idle``) so opening a form later does not block on its import.
+
+    Args:
+        *names: Form class names to resolve (default: all lazily exported forms)
+    """
+    module = sys.modules[__name__]
+    for name in names or _LAZY:
+        getattr(module, name)
+
+
+def __dir__():
+    """
+    List package attributes including form classes not yet imported.
+
+    Returns:
+        Sorted attribute names, so dir() and REPL/IDE completion see every form
+    """
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.environ.get('EAGER_IMPORT', ''):
+    for _name in _LAZY:
+        __getattr__(_name)
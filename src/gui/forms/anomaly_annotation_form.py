@@ -4,16 +4,22 @@ Anomaly annotation form for integrated detection and manual annotation entry.
 Combines detected anomaly review (from Sprint 1.6) with manual date range annotation
 entry for external events. Provides visual feedback with shaded annotation ranges.
 """
+import hashlib
 import tkinter as tk
-from tkinter import messagebox, Listbox, Scrollbar
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import messagebox, ttk, Listbox, Scrollbar
 from typing import Dict, List, Tuple
 
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-from ...models.anomaly_annotation import AnomalyAnnotationModel
+from ...models.parameters import ParameterModel
 from ...services.anomaly_detector import AnomalyDetector
 from ...services.time_series_visualizer import TimeSeriesVisualizer
 from ...gui.components.form_fields import LabeledEntry, LabeledDropdown
+from ...gui.components.images import rgba_to_photo_image
 
 
 class AnomalyAnnotationForm(tk.Frame):
@@ -25,7 +31,38 @@ class AnomalyAnnotationForm(tk.Frame):
     on chart to show excluded periods.
     """
 
-    CONFIG_FILEPATH = 'config/anomaly_annotations.json'
+    CASH_FLOW_FILEPATH = 'config/cash_flow_model.json'
+    PL_FILEPATH = 'config/pl_model.json'
+    ANOMALY_CACHE_FILEPATH = 'config/.anomaly_cache.json'
+    ANOMALY_CACHE_SIZE = 32
+    ANOMALY_CACHE_VERSION = 1  # Bump when the detection result format changes
+    CHART_POLL_MS = 50  # Interval for checking background chart renders
+    CHART_REFRESH_DEBOUNCE_MS = 150  # Clicks within this window share one chart redraw
+    SCROLLREGION_DEBOUNCE_MS = 100  # Resizes within this window share one scrollregion update
+
+    # Saved annotations table columns: (column id, heading, width in pixels)
+    SAVED_ANNOTATION_COLUMNS = (
+        ('start', 'Start', 110),
+        ('end', 'End', 110),
+        ('reason', 'Reason', 300),
+        ('exclude', 'Exclude', 90),
+        ('status', 'Status', 90),
+    )
+
+    # Row layout of anomalies_data; labels are object columns so long period labels
+    # (e.g. 'Nov 1 - Nov 30 2025') are never truncated
+    ANOMALY_DTYPE = np.dtype([
+        ('metric', object),
+        ('period', object),
+        ('idx', np.int64),
+        ('value', np.float64),
+        ('dev', np.float64),
+    ])
+
+    # Detected anomalies keyed by content hash of (periods, values), most recent last.
+    # Shared across form instances; persisted to ANOMALY_CACHE_FILEPATH between sessions.
+    _anomaly_cache: 'OrderedDict[str, List[Tuple[int, float, float]]]' = OrderedDict()
+    _anomaly_cache_loaded = False
 
     def __init__(self, parent):
         """
@@ -36,20 +73,29 @@ class AnomalyAnnotationForm(tk.Frame):
         """
         super().__init__(parent)
         self.parent = parent
+        self._config_mgr = parent.get_config_manager()
 
         # Initialize services
         self.detector = AnomalyDetector()
         self.visualizer = TimeSeriesVisualizer()
 
         # Data storage
-        self.anomalies_data = []  # List of (metric_name, period_label, period_idx, value, deviation)
+        # Structured array of (metric, period, idx, value, dev) rows, see ANOMALY_DTYPE
+        self.anomalies_data = np.empty(0, dtype=self.ANOMALY_DTYPE)
         self.annotation_model = None
         self.cash_flow_model = None
         self.pl_model = None
         self.current_metric_name = None
         self.current_periods = None
-        self.current_values = None
+        self._period_index = {}  # current_periods label -> index, for O(1) lookups
+        self.current_values = None  # np.ndarray of the charted metric's values
         self.current_anomaly_indices = None
+        self._anomaly_cache_dirty = False
+        self.chart_photos = []  # PhotoImages of background-rendered charts
+        self._saved_annotation_items = None  # Rows last shown in saved annotations table
+        self._refresh_after_id = None  # Pending debounced chart refresh
+        self._scrollregion_after_id = None  # Pending debounced scrollregion update
+        self._render_poll_after_ids: Dict[Future, str] = {}  # Pending chart render polls
 
         # Configure grid layout
         self.grid_columnconfigure(0, weight=1)
@@ -57,6 +103,9 @@ class AnomalyAnnotationForm(tk.Frame):
         # Create scrollable container for entire form
         self.create_scrollable_container()
 
+        # Release chart figures and images when the form is closed
+        self.bind('<Destroy>', self.on_destroy)
+
         # Load data and build form
         self.load_data_and_build_form()
 
@@ -69,10 +118,9 @@ class AnomalyAnnotationForm(tk.Frame):
         scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = tk.Frame(self.canvas)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Size changes after the form is built (chart placeholders replaced,
+        # lists refreshed) are coalesced; the initial build sets it once
+        self.scrollable_frame.bind("<Configure>", self.schedule_scrollregion_update)
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar.set)
@@ -89,35 +137,23 @@ class AnomalyAnnotationForm(tk.Frame):
         Load financial models, annotation model, and build form sections.
         """
         try:
-            # Load ConfigManager
-            config_mgr = self.parent.get_config_manager()
+            # Load financial models (skip the loader for missing files; load_config
+            # would write a default model in their place)
+            self.cash_flow_model = None
+            if self._config_mgr.config_exists(self.CASH_FLOW_FILEPATH):
+                self.cash_flow_model = self._config_mgr.load_config(self.CASH_FLOW_FILEPATH)
 
-            # Load financial models
-            try:
-                self.cash_flow_model = config_mgr.load_config('config/cash_flow_model.json')
-            except:
-                self.cash_flow_model = None
-
-            try:
-                self.pl_model = config_mgr.load_config('config/pl_model.json')
-            except:
-                self.pl_model = None
+            self.pl_model = None
+            if self._config_mgr.config_exists(self.PL_FILEPATH):
+                self.pl_model = self._config_mgr.load_config(self.PL_FILEPATH)
 
             # Check if financial data exists
             if self.cash_flow_model is None and self.pl_model is None:
                 self.display_error("Financial data not found. Please import data first.")
                 return
 
-            # Load annotation model
-            try:
-                loaded_model = config_mgr.load_config(self.CONFIG_FILEPATH)
-                if isinstance(loaded_model, AnomalyAnnotationModel):
-                    self.annotation_model = loaded_model
-                else:
-                    # Convert if it's a generic ParameterModel
-                    self.annotation_model = AnomalyAnnotationModel(parameters=loaded_model.parameters)
-            except:
-                self.annotation_model = AnomalyAnnotationModel()
+            # Load annotation model, including changes logged since it was last written
+            self.annotation_model = self._config_mgr.load_anomaly_annotations()
 
             # Build form sections
             self.build_form_sections()
@@ -125,6 +161,32 @@ class AnomalyAnnotationForm(tk.Frame):
         except Exception as e:
             self.display_error(f"Error loading data: {str(e)}")
 
+        # Lay out all sections once, then size the scroll area to them
+        self.update_scrollregion()
+
+    def schedule_scrollregion_update(self, event=None) -> None:
+        """
+        Update the canvas scrollregion once after a burst of frame resizes.
+
+        Args:
+            event: Tk Configure event from the scrollable frame (unused)
+        """
+        if self._scrollregion_after_id is None:
+            self._scrollregion_after_id = self.after(
+                self.SCROLLREGION_DEBOUNCE_MS, self.update_scrollregion
+            )
+
+    def update_scrollregion(self) -> None:
+        """
+        Size the canvas scrollregion to the laid-out form content.
+        """
+        if self._scrollregion_after_id is not None:
+            self.after_cancel(self._scrollregion_after_id)
+            self._scrollregion_after_id = None
+
+        self.scrollable_frame.update_idletasks()
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def build_form_sections(self) -> None:
         """
         Build all form sections: title, detected anomalies, manual entry, saved annotations.
@@ -185,31 +247,43 @@ class AnomalyAnnotationForm(tk.Frame):
         """
         charts_frame = tk.Frame(self.scrollable_frame)
         charts_frame.grid(row=chart_row, column=0, pady=10, sticky='nsew')
+
+        # Static (non-refreshed) charts are rendered in the background
+        self._render_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='chart-render')
         charts_frame.grid_columnconfigure(0, weight=1)
 
+        # One reference to the model's annotation list, shared by both charts
+        annotation_ranges = self.annotation_model.annotations
+
         current_chart_row = 0
 
         # Detect anomalies in Cash Flow: "Net Cash Provided by Operating Activities"
         if self.cash_flow_model is not None:
             try:
                 periods = self.cash_flow_model.get_periods()
-                operating = self.cash_flow_model.get_operating()
-
-                # Find "Net Cash Provided by Operating Activities"
+                # Find "Net Cash Provided by Operating Activities" (cached on the model)
                 net_cash_values = None
-                for item in operating:
-                    if 'account_name' in item and 'Net Cash Provided by Operating Activities' in item['account_name']:
-                        if 'values' in item:
-                            net_cash_values = [item['values'].get(p, 0) for p in periods]
-                            break
-
-                if net_cash_values and len(net_cash_values) >= 3:
-                    anomalies = self.detector.detect_anomalies(net_cash_values)
+                item = self.cash_flow_model.get_row_by_name_substring(
+                    'Net Cash Provided by Operating Activities'
+                )
+                if item is not None and 'values' in item:
+                    values_map = item['values']
+                    net_cash_values = np.fromiter(
+                        (values_map.get(p, 0.0) for p in periods),
+                        dtype=np.float64,
+                        count=len(periods)
+                    )
+
+                if net_cash_values is not None and len(net_cash_values) >= 3:
+                    anomalies = self.detect_anomalies_cached(periods, net_cash_values)
                     metric_name = "Net Cash Provided by Operating Activities"
 
                     # Store anomaly data
-                    for idx, value, deviation in anomalies:
-                        self.anomalies_data.append((metric_name, periods[idx], idx, value, deviation))
+                    metric_anomalies = np.array(
+                        [(metric_name, periods[idx], idx, value, deviation) for idx, value, deviation in anomalies],
+                        dtype=self.ANOMALY_DTYPE
+                    )
+                    self.anomalies_data = np.concatenate((self.anomalies_data, metric_anomalies))
 
                     # Store data for manual entry validation
                     self.current_metric_name = metric_name
@@ -217,14 +291,15 @@ class AnomalyAnnotationForm(tk.Frame):
                     self.current_values = net_cash_values
 
                     # Create chart with annotation ranges
-                    anomaly_indices = [idx for idx, _, _ in anomalies]
-                    annotation_ranges = self.annotation_model.get_annotations()
+                    anomaly_indices = metric_anomalies['idx']
                     fig = self.visualizer.create_chart_with_annotation_ranges(
                         periods, net_cash_values, metric_name, anomaly_indices, annotation_ranges
                     )
 
-                    # Embed chart in tkinter
+                    # Embed chart in tkinter; annotation shading and anomaly markers
+                    # are blitted over a saved background on refresh
                     self.chart_canvas = FigureCanvasTkAgg(fig, master=charts_frame)
+                    self.init_chart_blitting(fig)
                     self.chart_canvas.draw()
                     self.chart_canvas.get_tk_widget().grid(row=current_chart_row, column=0, pady=10)
                     current_chart_row += 1
@@ -236,23 +311,27 @@ class AnomalyAnnotationForm(tk.Frame):
         if self.pl_model is not None:
             try:
                 periods = self.pl_model.get_periods()
-                calculated_rows = self.pl_model.calculated_rows
-
-                # Find "Net Income" from calculated rows
+                # Find "Net Income" from calculated rows (cached on the model)
                 net_income_values = None
-                for row in calculated_rows:
-                    if 'account_name' in row and 'Net Income' in row['account_name']:
-                        if 'values' in row:
-                            net_income_values = [row['values'].get(p, 0) for p in periods]
-                            break
-
-                if net_income_values and len(net_income_values) >= 3:
-                    anomalies = self.detector.detect_anomalies(net_income_values)
+                row = self.pl_model.get_row_by_name_substring('Net Income')
+                if row is not None and 'values' in row:
+                    values_map = row['values']
+                    net_income_values = np.fromiter(
+                        (values_map.get(p, 0.0) for p in periods),
+                        dtype=np.float64,
+                        count=len(periods)
+                    )
+
+                if net_income_values is not None and len(net_income_values) >= 3:
+                    anomalies = self.detect_anomalies_cached(periods, net_income_values)
                     metric_name = "Net Income"
 
                     # Store anomaly data
-                    for idx, value, deviation in anomalies:
-                        self.anomalies_data.append((metric_name, periods[idx], idx, value, deviation))
+                    metric_anomalies = np.array(
+                        [(metric_name, periods[idx], idx, value, deviation) for idx, value, deviation in anomalies],
+                        dtype=self.ANOMALY_DTYPE
+                    )
+                    self.anomalies_data = np.concatenate((self.anomalies_data, metric_anomalies))
 
                     # Update current data if not already set
                     if self.current_metric_name is None:
@@ -260,25 +339,180 @@ class AnomalyAnnotationForm(tk.Frame):
                         self.current_periods = periods
                         self.current_values = net_income_values
 
-                    # Create chart with annotation ranges
-                    anomaly_indices = [idx for idx, _, _ in anomalies]
-                    annotation_ranges = self.annotation_model.get_annotations()
-                    fig = self.visualizer.create_chart_with_annotation_ranges(
-                        periods, net_income_values, metric_name, anomaly_indices, annotation_ranges
+                    # Render static chart off the Tk thread; a placeholder holds its
+                    # grid slot until the pixels are ready
+                    anomaly_indices = metric_anomalies['idx']
+                    # Worker gets a snapshot, since clicks may add annotations mid-render
+                    future = self._render_executor.submit(
+                        self.render_chart_buffer,
+                        periods, net_income_values, metric_name, anomaly_indices, list(annotation_ranges)
                     )
 
-                    # Embed chart in tkinter
-                    canvas = FigureCanvasTkAgg(fig, master=charts_frame)
-                    canvas.draw()
-                    canvas.get_tk_widget().grid(row=current_chart_row, column=0, pady=10)
+                    placeholder = tk.Label(
+                        charts_frame,
+                        text=f"Rendering {metric_name} chart...",
+                        font=('Arial', 10),
+                        fg='#666'
+                    )
+                    placeholder.grid(row=current_chart_row, column=0, pady=10)
+                    self._render_poll_after_ids[future] = self.after(
+                        self.CHART_POLL_MS, self.poll_chart_render, future, placeholder
+                    )
                     current_chart_row += 1
 
             except Exception as e:
                 print(f"Error processing P&L data: {e}")
 
+        # No more renders to submit; worker threads exit once pending charts finish
+        self._render_executor.shutdown(wait=False)
+
+        # Period label -> index for manual entry validation and span positions
+        self._period_index = {period: idx for idx, period in enumerate(self.current_periods or ())}
+
+        # Persist any newly detected results for the next session
+        if self._anomaly_cache_dirty:
+            self.save_anomaly_cache()
+
         # Display anomaly listbox
         self.display_anomaly_list(chart_row + 1)
 
+    def detect_anomalies_cached(self, periods: List[str], values: np.ndarray) -> List[Tuple[int, float, float]]:
+        """
+        Detect anomalies, reusing the cached result when the series is unchanged.
+
+        Results are keyed by a hash of the period labels, values, detection threshold
+        and cache format version, so edits to the imported financial data, a changed
+        threshold or a new result format miss the cache and are detected afresh.
+
+        Args:
+            periods: Period labels for the series
+            values: Series values (float64 ndarray)
+
+        Returns:
+            List of (period_index, value, deviation_magnitude) tuples
+        """
+        cache = AnomalyAnnotationForm._anomaly_cache
+        if not AnomalyAnnotationForm._anomaly_cache_loaded:
+            self.load_anomaly_cache()
+
+        key = hashlib.blake2b(
+            f'{self.ANOMALY_CACHE_VERSION}:{self.detector.SIGMA_THRESHOLD!r}:'.encode()
+            + np.ascontiguousarray(values, dtype=np.float64).tobytes()
+            + repr(list(periods)).encode(),
+            digest_size=16
+        ).hexdigest()
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        anomalies = self.detector.detect_anomalies(values)
+        cache[key] = anomalies
+        while len(cache) > self.ANOMALY_CACHE_SIZE:
+            cache.popitem(last=False)
+        self._anomaly_cache_dirty = True
+        return anomalies
+
+    def load_anomaly_cache(self) -> None:
+        """
+        Load persisted anomaly detection results into the shared cache.
+
+        A missing or unreadable cache file leaves the cache empty; it is only an
+        optimization, so detection simply runs again.
+        """
+        AnomalyAnnotationForm._anomaly_cache_loaded = True
+        try:
+            # load_config would write an empty default cache file in its place
+            if not self._config_mgr.config_exists(self.ANOMALY_CACHE_FILEPATH):
+                return
+            entries = self._config_mgr.load_config(self.ANOMALY_CACHE_FILEPATH).parameters.get('entries', {})
+            for key, anomalies in entries.items():
+                AnomalyAnnotationForm._anomaly_cache[key] = [
+                    (int(idx), float(value), float(deviation)) for idx, value, deviation in anomalies
+                ]
+        except Exception:
+            AnomalyAnnotationForm._anomaly_cache.clear()
+
+    def save_anomaly_cache(self) -> None:
+        """
+        Persist the shared anomaly cache so later sessions skip detection.
+        """
+        try:
+            model = ParameterModel({'entries': dict(AnomalyAnnotationForm._anomaly_cache)})
+            self._config_mgr.save_config(model, self.ANOMALY_CACHE_FILEPATH)
+            self._anomaly_cache_dirty = False
+        except Exception as e:
+            print(f"Error saving anomaly cache: {e}")
+
+    def render_chart_buffer(
+        self,
+        periods: List[str],
+        values: np.ndarray,
+        metric_name: str,
+        anomaly_indices: np.ndarray,
+        annotation_ranges: List[Dict]
+    ) -> np.ndarray:
+        """
+        Render a chart to an RGBA pixel buffer (runs on a worker thread).
+
+        The figure is standalone and drawn on an Agg canvas, so no Tk calls are
+        made here; only the finished pixels are handed back to the Tk thread.
+
+        Args:
+            periods: Period labels for x-axis
+            values: Series values
+            metric_name: Chart title
+            anomaly_indices: Indices to mark as anomalies
+            annotation_ranges: Snapshot of annotation dicts to shade
+
+        Returns:
+            (height, width, 4) uint8 RGBA array
+        """
+        fig = self.visualizer.create_chart_with_annotation_ranges(
+            periods, values, metric_name, anomaly_indices, annotation_ranges
+        )
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba())
+
+    def poll_chart_render(self, future: Future, placeholder: tk.Label) -> None:
+        """
+        Swap a chart placeholder for the rendered image once its render finishes.
+
+        The chart is static, so it is shown as a plain tk.PhotoImage on a tk.Canvas
+        rather than a FigureCanvasTkAgg, which would keep the figure and its
+        resize/redraw handlers alive for the life of the form.
+
+        Args:
+            future: Future returned by submitting render_chart_buffer
+            placeholder: Label occupying the chart's grid slot
+        """
+        if not future.done():
+            self._render_poll_after_ids[future] = self.after(
+                self.CHART_POLL_MS, self.poll_chart_render, future, placeholder
+            )
+            return
+
+        del self._render_poll_after_ids[future]
+
+        try:
+            buffer = future.result()
+        except Exception as e:
+            placeholder.config(text=f"Error rendering chart: {e}", fg='#F44336')
+            return
+
+        # Hand the RGBA pixels to a Tk photo image (no live figure canvas)
+        height, width = buffer.shape[:2]
+        photo = rgba_to_photo_image(buffer, placeholder.master)
+
+        chart = tk.Canvas(placeholder.master, width=width, height=height, highlightthickness=0)
+        chart.create_image(0, 0, anchor='nw', image=photo)
+        chart.grid(row=placeholder.grid_info()['row'], column=0, pady=10)
+        placeholder.destroy()
+
+        # Keep a reference; Tk does not, and the image disappears if it is collected
+        self.chart_photos.append(photo)
+
     def display_anomaly_list(self, list_row: int) -> None:
         """
         Display list of detected anomalies with confirm/dismiss buttons.
@@ -286,7 +520,7 @@ class AnomalyAnnotationForm(tk.Frame):
         Args:
             list_row: Grid row number for list
         """
-        if not self.anomalies_data:
+        if len(self.anomalies_data) == 0:
             # No anomalies detected
             message_label = tk.Label(
                 self.scrollable_frame,
@@ -322,10 +556,12 @@ class AnomalyAnnotationForm(tk.Frame):
         self.anomaly_listbox.pack(side=tk.LEFT, fill=tk.BOTH)
         scrollbar.config(command=self.anomaly_listbox.yview)
 
-        # Populate listbox
-        for metric_name, period_label, idx, value, deviation in self.anomalies_data:
-            item_text = f"{metric_name} | {period_label} | Value: {value:,.2f} | Deviation: {deviation:.2f}σ"
-            self.anomaly_listbox.insert(tk.END, item_text)
+        # Populate listbox with a single batched insert
+        items = tuple(
+            f"{metric_name} | {period_label} | Value: {value:,.2f} | Deviation: {deviation:.2f}σ"
+            for metric_name, period_label, idx, value, deviation in self.anomalies_data
+        )
+        self.anomaly_listbox.insert(tk.END, *items)
 
         # Buttons frame
         buttons_frame = tk.Frame(self.scrollable_frame)
@@ -448,24 +684,28 @@ class AnomalyAnnotationForm(tk.Frame):
         )
         section_label.grid(row=start_row + 1, column=0, pady=(10, 5), sticky='w', padx=20)
 
-        # Create listbox with scrollbar
+        # Create table with scrollbar (row iid = annotation index)
         list_frame = tk.Frame(self.scrollable_frame)
         list_frame.grid(row=start_row + 2, column=0, pady=10, padx=20)
 
         scrollbar = Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.saved_annotations_listbox = Listbox(
+        self.saved_annotations_tree = ttk.Treeview(
             list_frame,
-            width=90,
+            columns=[column for column, _, _ in self.SAVED_ANNOTATION_COLUMNS],
+            show='headings',
             height=8,
-            yscrollcommand=scrollbar.set,
-            font=('Courier', 9)
+            selectmode='browse',
+            yscrollcommand=scrollbar.set
         )
-        self.saved_annotations_listbox.pack(side=tk.LEFT, fill=tk.BOTH)
-        scrollbar.config(command=self.saved_annotations_listbox.yview)
+        for column, heading, width in self.SAVED_ANNOTATION_COLUMNS:
+            self.saved_annotations_tree.heading(column, text=heading)
+            self.saved_annotations_tree.column(column, width=width, anchor='w')
+        self.saved_annotations_tree.pack(side=tk.LEFT, fill=tk.BOTH)
+        scrollbar.config(command=self.saved_annotations_tree.yview)
 
-        # Populate listbox with saved annotations
+        # Populate table with saved annotations
         self.refresh_saved_annotations_list()
 
         # Buttons frame
@@ -486,21 +726,37 @@ class AnomalyAnnotationForm(tk.Frame):
 
     def refresh_saved_annotations_list(self) -> None:
         """
-        Refresh the saved annotations listbox with current data.
-        """
-        self.saved_annotations_listbox.delete(0, tk.END)
+        Refresh the saved annotations table with current data.
 
+        Only rows that changed are touched: rows up to the shorter of the old and new
+        lists are updated in place with item(), then extra rows are deleted or new rows
+        inserted. Adding an annotation therefore inserts a single row.
+        """
         annotations = self.annotation_model.get_annotations()
-        for annotation in annotations:
-            start = annotation.get('start_date', 'N/A')
-            end = annotation.get('end_date', 'N/A')
-            reason = annotation.get('reason', 'N/A')
-            exclude_from = annotation.get('exclude_from', 'both')
-            confirmed = annotation.get('confirmed', False)
-            status = "Confirmed" if confirmed else "Dismissed"
+        rows = tuple(
+            (
+                annotation.get('start_date', 'N/A'),
+                annotation.get('end_date', 'N/A'),
+                annotation.get('reason', 'N/A')[:40],
+                annotation.get('exclude_from', 'both'),
+                'Confirmed' if annotation.get('confirmed', False) else 'Dismissed'
+            )
+            for annotation in annotations
+        )
+
+        previous = self._saved_annotation_items or ()
+        self._saved_annotation_items = rows
+
+        # Update changed rows in place
+        for idx in range(min(len(previous), len(rows))):
+            if rows[idx] != previous[idx]:
+                self.saved_annotations_tree.item(str(idx), values=rows[idx])
 
-            item_text = f"{start} to {end} | {reason[:40]} | Exclude: {exclude_from} | {status}"
-            self.saved_annotations_listbox.insert(tk.END, item_text)
+        # Drop rows past the new end, or add rows past the old end
+        if len(previous) > len(rows):
+            self.saved_annotations_tree.delete(*(str(idx) for idx in range(len(rows), len(previous))))
+        for idx in range(len(previous), len(rows)):
+            self.saved_annotations_tree.insert('', 'end', iid=str(idx), values=rows[idx])
 
     def on_confirm_clicked(self) -> None:
         """
@@ -512,7 +768,7 @@ class AnomalyAnnotationForm(tk.Frame):
             return
 
         idx = selected_indices[0]
-        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[idx]
+        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[idx].item()
 
         # Create annotation dict with exclude_from field
         annotation = {
@@ -529,7 +785,7 @@ class AnomalyAnnotationForm(tk.Frame):
 
         # Remove from list
         self.anomaly_listbox.delete(idx)
-        del self.anomalies_data[idx]
+        self.anomalies_data = np.delete(self.anomalies_data, idx)
 
         # Refresh saved annotations list and chart
         self.refresh_saved_annotations_list()
@@ -547,7 +803,7 @@ class AnomalyAnnotationForm(tk.Frame):
             return
 
         idx = selected_indices[0]
-        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[idx]
+        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[idx].item()
 
         # Create annotation dict with exclude_from field
         annotation = {
@@ -564,7 +820,7 @@ class AnomalyAnnotationForm(tk.Frame):
 
         # Remove from list
         self.anomaly_listbox.delete(idx)
-        del self.anomalies_data[idx]
+        self.anomalies_data = np.delete(self.anomalies_data, idx)
 
         # Refresh saved annotations list
         self.refresh_saved_annotations_list()
@@ -594,17 +850,16 @@ class AnomalyAnnotationForm(tk.Frame):
                 return
 
             # Validate period labels exist in loaded data
-            valid_periods = self.current_periods if self.current_periods else []
-            if start_date not in valid_periods:
+            if start_date not in self._period_index:
                 messagebox.showerror(
                     "Validation Error",
-                    f"Start Date '{start_date}' not found in financial data periods.\nValid periods: {', '.join(valid_periods)}"
+                    f"Start Date '{start_date}' not found in financial data periods.\nValid periods: {', '.join(self.current_periods or [])}"
                 )
                 return
-            if end_date not in valid_periods:
+            if end_date not in self._period_index:
                 messagebox.showerror(
                     "Validation Error",
-                    f"End Date '{end_date}' not found in financial data periods.\nValid periods: {', '.join(valid_periods)}"
+                    f"End Date '{end_date}' not found in financial data periods.\nValid periods: {', '.join(self.current_periods or [])}"
                 )
                 return
 
@@ -646,12 +901,12 @@ class AnomalyAnnotationForm(tk.Frame):
         """
         Handle Delete Selected button click - remove annotation from model.
         """
-        selected_indices = self.saved_annotations_listbox.curselection()
-        if not selected_indices:
+        selected_iids = self.saved_annotations_tree.selection()
+        if not selected_iids:
             messagebox.showwarning("No Selection", "Please select an annotation to delete")
             return
 
-        idx = selected_indices[0]
+        idx = int(selected_iids[0])
 
         # Confirm deletion
         result = messagebox.askyesno(
@@ -665,11 +920,10 @@ class AnomalyAnnotationForm(tk.Frame):
             # Remove annotation from model
             annotations = self.annotation_model.get_annotations()
             if 0 <= idx < len(annotations):
-                del annotations[idx]
+                annotation = annotations.pop(idx)
 
-                # Save updated model
-                config_mgr = self.parent.get_config_manager()
-                config_mgr.save_config(self.annotation_model, self.CONFIG_FILEPATH)
+                # Log deletion by value, so it stays valid if the file is rewritten
+                self._config_mgr.append_anomaly_annotation_records([{'__delete__': annotation}])
 
                 # Refresh list and chart
                 self.refresh_saved_annotations_list()
@@ -688,39 +942,160 @@ class AnomalyAnnotationForm(tk.Frame):
             annotation: Annotation dict to save
         """
         try:
-            # Add annotation and save
+            # Add annotation and append it to the log (O(1) instead of rewriting all annotations)
             self.annotation_model.add_annotation(annotation)
 
-            config_mgr = self.parent.get_config_manager()
-            config_mgr.save_config(self.annotation_model, self.CONFIG_FILEPATH)
+            self._config_mgr.append_anomaly_annotation_records([annotation])
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save annotation: {str(e)}")
 
+    def init_chart_blitting(self, fig) -> None:
+        """
+        Keep the refreshable chart's figure and mark its changing artists as animated.
+
+        Animated artists (annotation spans, value line, anomaly markers) are left out
+        of full canvas draws. Each full draw saves the static background (axes, ticks,
+        labels) and then draws the animated artists on top, so _do_refresh_chart() only
+        has to restore that background and blit the artists.
+
+        Args:
+            fig: Figure embedded in self.chart_canvas
+        """
+        self._fig = fig
+        self._ax = fig.axes[0]
+        self._bg = None
+
+        # Spans drawn by the visualizer come first, followed by the value line.
+        # The visualizer skips annotations outside current_periods, so key the
+        # spans by the annotations it actually drew.
+        period_labels = frozenset(self.current_periods)
+        self._annotation_spans = list(self._ax.patches)
+        self._annotation_span_keys = [
+            self.annotation_span_key(annotation)
+            for annotation in self.annotation_model.get_annotations()
+            if annotation.get('start_date') in period_labels
+            and annotation.get('end_date') in period_labels
+        ]
+        self._value_line = self._ax.lines[0]
+
+        # Always keep a marker collection so anomalies can be updated in place
+        if self._ax.collections:
+            self._anomaly_markers = self._ax.collections[0]
+        else:
+            self._anomaly_markers = self._ax.scatter(
+                [], [], color='red', s=150, marker='o', zorder=5
+            )
+
+        for artist in self._annotation_spans + [self._value_line, self._anomaly_markers]:
+            artist.set_animated(True)
+
+        # Re-capture background after every full draw (first draw, resize)
+        self.chart_canvas.mpl_connect('draw_event', self.on_chart_draw)
+
+    def on_chart_draw(self, event) -> None:
+        """
+        Save the static chart background and draw animated artists over it.
+
+        Args:
+            event: matplotlib DrawEvent from a full canvas draw
+        """
+        self._bg = self.chart_canvas.copy_from_bbox(self._ax.bbox)
+        self.draw_animated_artists()
+
+    @staticmethod
+    def annotation_span_key(annotation: Dict) -> Tuple[str, str, str]:
+        """
+        Identify the shaded span drawn for an annotation.
+
+        Args:
+            annotation: Annotation dict
+
+        Returns:
+            (start_date, end_date, exclude_from) tuple; equal keys draw identical spans
+        """
+        return (
+            annotation.get('start_date'),
+            annotation.get('end_date'),
+            annotation.get('exclude_from', 'both')
+        )
+
+    def draw_animated_artists(self) -> None:
+        """
+        Draw annotation spans, value line, and anomaly markers in z-order.
+        """
+        for artist in self._annotation_spans + [self._value_line, self._anomaly_markers]:
+            self._ax.draw_artist(artist)
+
     def refresh_chart(self) -> None:
+        """
+        Schedule a chart refresh, collapsing rapid successive requests into one.
+
+        Each call restarts a CHART_REFRESH_DEBOUNCE_MS timer, so a burst of
+        confirm/dismiss/add/delete clicks redraws the chart once, after the last click.
+        """
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(self.CHART_REFRESH_DEBOUNCE_MS, self._do_refresh_chart)
+
+    def _do_refresh_chart(self) -> None:
         """
         Refresh the chart to show updated annotation ranges.
+
+        Updates annotation spans and anomaly markers on the existing axes and blits
+        them over the saved background, instead of rebuilding the whole figure.
+        Spans for unchanged annotation ranges are kept as-is.
         """
-        if self.current_periods and self.current_values and self.current_metric_name:
-            # Get current anomaly indices (from remaining anomalies_data)
-            anomaly_indices = [period_idx for _, _, period_idx, _, _ in self.anomalies_data]
+        self._refresh_after_id = None
 
-            # Get annotation ranges
-            annotation_ranges = self.annotation_model.get_annotations()
+        # Form was closed while the refresh was pending
+        if not self.winfo_exists():
+            return
 
-            # Create new chart
-            fig = self.visualizer.create_chart_with_annotation_ranges(
-                self.current_periods,
-                self.current_values,
-                self.current_metric_name,
-                anomaly_indices,
-                annotation_ranges
-            )
+        if not (self.current_periods and self.current_values is not None and self.current_metric_name):
+            return
+        if getattr(self, '_bg', None) is None:
+            return
+
+        # Restore static background (axes, ticks, labels) saved at last full draw
+        self.chart_canvas.restore_region(self._bg)
+
+        # Diff annotation ranges against drawn spans: reuse spans for unchanged
+        # ranges, add spans for new ranges, remove spans for deleted ranges
+        unused = {}
+        for key, span in zip(self._annotation_span_keys, self._annotation_spans):
+            unused.setdefault(key, []).append(span)
+
+        spans, span_keys = [], []
+        for annotation in self.annotation_model.get_annotations():
+            key = self.annotation_span_key(annotation)
+            if unused.get(key):
+                added = [unused[key].pop(0)]
+            else:
+                added = self.visualizer.add_annotation_spans(
+                    self._ax, self.current_periods, [annotation], animated=True,
+                    period_index=self._period_index
+                )
+            spans.extend(added)
+            span_keys.extend([key] * len(added))
+
+        for stale_spans in unused.values():
+            for span in stale_spans:
+                span.remove()
+
+        self._annotation_spans = spans
+        self._annotation_span_keys = span_keys
+
+        # Get current anomaly indices (from remaining anomalies_data)
+        anomaly_indices = self.anomalies_data['idx'][
+            self.anomalies_data['metric'] == self.current_metric_name
+        ]
+        self._anomaly_markers.set_offsets(
+            np.column_stack((anomaly_indices, self.current_values[anomaly_indices]))
+        )
 
-            # Update chart canvas
-            if hasattr(self, 'chart_canvas'):
-                self.chart_canvas.figure = fig
-                self.chart_canvas.draw()
+        self.draw_animated_artists()
+        self.chart_canvas.blit(self._ax.bbox)
 
     def display_error(self, message: str) -> None:
         """
@@ -749,6 +1124,39 @@ class AnomalyAnnotationForm(tk.Frame):
         )
         back_btn.grid(row=2, column=0, pady=10)
 
+    def on_destroy(self, event) -> None:
+        """
+        Release chart resources when the form is destroyed.
+
+        Cancels pending chart render polls and debounced refresh and scrollregion
+        updates, and drops the persistent figure, its saved background, and the static
+        chart images, so a lingering reference to the form does not keep their RGBA
+        buffers alive.
+
+        Args:
+            event: Tk Destroy event
+        """
+        if event.widget is not self:
+            return
+
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+        if self._scrollregion_after_id is not None:
+            self.after_cancel(self._scrollregion_after_id)
+            self._scrollregion_after_id = None
+
+        for after_id in self._render_poll_after_ids.values():
+            self.after_cancel(after_id)
+        self._render_poll_after_ids.clear()
+
+        self.chart_photos.clear()
+        if getattr(self, '_fig', None) is not None:
+            self._fig.clear()
+            self._fig = None
+            self._bg = None
+
     def on_back_to_menu_clicked(self) -> None:
         """
         Handle Back to Menu button click - navigate to MainMenuForm.
@@ -3,16 +3,20 @@ Anomaly review form for visualizing and confirming/dismissing detected anomalies
 
 Provides time-series charts with statistical anomaly highlighting, allowing users
 to confirm genuine anomalies for exclusion from baseline calculations.
+
+The detection/chart services are imported when the form loads its data, and the
+matplotlib Tk backend when a chart is first drawn, so importing this module does
+not pull them in.
 """
 import tkinter as tk
+from collections import OrderedDict
+from operator import itemgetter
 from tkinter import messagebox, Listbox, Scrollbar
 from typing import Dict, List, Tuple
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
 
-from ...models.anomaly_annotation import AnomalyAnnotationModel
-from ...services.anomaly_detector import AnomalyDetector
-from ...services.time_series_visualizer import TimeSeriesVisualizer
+from ..components.images import png_to_photo_image, rgba_to_png
 
 
 class AnomalyReviewForm(tk.Frame):
@@ -23,7 +27,14 @@ class AnomalyReviewForm(tk.Frame):
     displays charts with anomaly markers, and provides confirm/dismiss functionality.
     """
 
-    CONFIG_FILEPATH = 'config/anomaly_annotations.json'
+    CASH_FLOW_FILEPATH = 'config/cash_flow_model.json'
+    PL_FILEPATH = 'config/pl_model.json'
+    CHART_CACHE_SIZE = 8
+
+    # Rendered charts as PNG bytes keyed by (metric, periods, values bytes, anomaly
+    # indices), shared across form instances so re-opening the form skips matplotlib
+    # entirely. PNG keeps each entry to tens of KB instead of a multi-MB RGBA buffer.
+    _chart_cache: 'OrderedDict[tuple, bytes]' = OrderedDict()
 
     def __init__(self, parent):
         """
@@ -34,10 +45,11 @@ class AnomalyReviewForm(tk.Frame):
         """
         super().__init__(parent)
         self.parent = parent
+        self._config_mgr = parent.get_config_manager()
 
-        # Initialize services
-        self.detector = AnomalyDetector()
-        self.visualizer = TimeSeriesVisualizer()
+        # Services are created in load_and_detect, on first use
+        self.detector = None
+        self.visualizer = None
 
         # Configure grid layout
         self.grid_columnconfigure(0, weight=1)
@@ -50,8 +62,14 @@ class AnomalyReviewForm(tk.Frame):
         )
         title.grid(row=0, column=0, pady=20)
 
+        # Tk photo images for cached charts (Tk does not keep its own reference)
+        self.chart_photos = []
+
         # Load data and detect anomalies
-        self.anomalies_data = []  # List of (metric_name, period_label, period_idx, value, deviation)
+        # Anomalies keyed by a stable id (insertion order = listbox order), so removing
+        # one is a dict pop rather than shifting tuples; anomaly_ids maps listbox rows to ids
+        self.anomalies_data: Dict[int, Tuple[str, str, int, float, float]] = {}
+        self.anomaly_ids: List[int] = []
         self.load_and_detect()
 
     def load_and_detect(self) -> None:
@@ -59,18 +77,30 @@ class AnomalyReviewForm(tk.Frame):
         Load financial models, run anomaly detection, and display results.
         """
         try:
-            # Load CashFlowModel and PLModel from ConfigManager
-            config_mgr = self.parent.get_config_manager()
-
-            try:
-                cash_flow_model = config_mgr.load_config('config/cash_flow_model.json')
-            except:
-                cash_flow_model = None
-
-            try:
-                pl_model = config_mgr.load_config('config/pl_model.json')
-            except:
-                pl_model = None
+            # Import and create services on first use (pulls in numpy kernels and matplotlib)
+            from ...services.anomaly_detector import AnomalyDetector
+            from ...services.time_series_visualizer import TimeSeriesVisualizer
+
+            self.detector = AnomalyDetector()
+            self.visualizer = TimeSeriesVisualizer()
+
+            # Load CashFlowModel and PLModel from ConfigManager (skip the loader for
+            # missing files; load_config would raise or save a default in their place)
+            config_mgr = self._config_mgr
+
+            cash_flow_model = None
+            if config_mgr.config_exists(self.CASH_FLOW_FILEPATH):
+                try:
+                    cash_flow_model = config_mgr.load_config(self.CASH_FLOW_FILEPATH)
+                except Exception:
+                    cash_flow_model = None
+
+            pl_model = None
+            if config_mgr.config_exists(self.PL_FILEPATH):
+                try:
+                    pl_model = config_mgr.load_config(self.PL_FILEPATH)
+                except Exception:
+                    pl_model = None
 
             # Check if financial data exists
             if cash_flow_model is None and pl_model is None:
@@ -97,75 +127,20 @@ class AnomalyReviewForm(tk.Frame):
 
         chart_row = 0
 
-        # Detect anomalies in Cash Flow: "Net Cash Provided by Operating Activities"
-        if cash_flow_model is not None:
-            try:
-                periods = cash_flow_model.get_periods()
-                operating = cash_flow_model.get_operating()
-
-                # Find "Net Cash Provided by Operating Activities"
-                net_cash_values = None
-                for item in operating:
-                    if 'account_name' in item and 'Net Cash Provided by Operating Activities' in item['account_name']:
-                        if 'values' in item:
-                            net_cash_values = [item['values'].get(p, 0) for p in periods]
-                            break
-
-                if net_cash_values and len(net_cash_values) >= 3:
-                    anomalies = self.detector.detect_anomalies(net_cash_values)
-                    metric_name = "Net Cash Provided by Operating Activities"
-
-                    # Store anomaly data
-                    for idx, value, deviation in anomalies:
-                        self.anomalies_data.append((metric_name, periods[idx], idx, value, deviation))
-
-                    # Create chart
-                    anomaly_indices = [idx for idx, _, _ in anomalies]
-                    fig = self.visualizer.create_chart(periods, net_cash_values, metric_name, anomaly_indices)
-
-                    # Embed chart in tkinter
-                    canvas = FigureCanvasTkAgg(fig, master=charts_frame)
-                    canvas.draw()
-                    canvas.get_tk_widget().grid(row=chart_row, column=0, pady=10)
-                    chart_row += 1
-
-            except Exception as e:
-                print(f"Error processing cash flow data: {e}")
+        # (model, metric account name, label for error messages)
+        metrics = (
+            (cash_flow_model, "Net Cash Provided by Operating Activities", "cash flow"),
+            (pl_model, "Net Income", "P&L"),
+        )
 
-        # Detect anomalies in P&L: "Net Income"
-        if pl_model is not None:
+        for model, metric_name, source in metrics:
+            if model is None:
+                continue
             try:
-                periods = pl_model.get_periods()
-                calculated_rows = pl_model.calculated_rows
-
-                # Find "Net Income" from calculated rows
-                net_income_values = None
-                for row in calculated_rows:
-                    if 'account_name' in row and 'Net Income' in row['account_name']:
-                        if 'values' in row:
-                            net_income_values = [row['values'].get(p, 0) for p in periods]
-                            break
-
-                if net_income_values and len(net_income_values) >= 3:
-                    anomalies = self.detector.detect_anomalies(net_income_values)
-                    metric_name = "Net Income"
-
-                    # Store anomaly data
-                    for idx, value, deviation in anomalies:
-                        self.anomalies_data.append((metric_name, periods[idx], idx, value, deviation))
-
-                    # Create chart
-                    anomaly_indices = [idx for idx, _, _ in anomalies]
-                    fig = self.visualizer.create_chart(periods, net_income_values, metric_name, anomaly_indices)
-
-                    # Embed chart in tkinter
-                    canvas = FigureCanvasTkAgg(fig, master=charts_frame)
-                    canvas.draw()
-                    canvas.get_tk_widget().grid(row=chart_row, column=0, pady=10)
+                if self.detect_metric(model, metric_name, charts_frame, chart_row):
                     chart_row += 1
-
             except Exception as e:
-                print(f"Error processing P&L data: {e}")
+                print(f"Error processing {source} data: {e}")
 
         # Display anomaly list or "No anomalies detected" message
         if not self.anomalies_data:
@@ -173,6 +148,139 @@ class AnomalyReviewForm(tk.Frame):
         else:
             self.display_anomaly_list()
 
+    def detect_metric(self, model, metric_name: str, charts_frame: tk.Frame, chart_row: int) -> bool:
+        """
+        Detect anomalies in one metric row, record them, and schedule its chart.
+
+        Args:
+            model: CashFlowModel or PLModel holding the metric row
+            metric_name: Account name of the metric row (also the chart title)
+            charts_frame: Frame holding the charts
+            chart_row: Grid row to use for this metric's chart
+
+        Returns:
+            True if a chart was scheduled (the row exists with at least 3 periods)
+        """
+        periods = model.get_periods()
+
+        # Indexed lookup on the model
+        row = model.get_row_by_name_substring(metric_name)
+        if row is None or 'values' not in row:
+            return False
+
+        values = self.period_values(row['values'], periods)
+        if len(values) < 3:
+            return False
+
+        anomalies = self.detector.detect_anomalies(values)
+
+        # Store anomaly data
+        for idx, value, deviation in anomalies:
+            self.anomalies_data[len(self.anomalies_data)] = (metric_name, periods[idx], idx, value, deviation)
+
+        # Create chart once the form is idle, so the anomaly list shows first
+        anomaly_indices = [idx for idx, _, _ in anomalies]
+        self.after_idle(
+            self.render_chart, charts_frame, chart_row,
+            periods, values, metric_name, anomaly_indices
+        )
+        return True
+
+    @staticmethod
+    def period_values(values: Dict[str, float], periods: List[str]) -> np.ndarray:
+        """
+        Pick a row's values for the given periods as a float64 array.
+
+        Uses a single itemgetter call (dict lookups done in C) when every period
+        is present, falling back to a per-period .get with 0.0 for missing ones.
+
+        Args:
+            values: Period label -> value dict from a model row
+            periods: Period labels in display order
+
+        Returns:
+            1-D float64 array aligned with periods
+        """
+        try:
+            # itemgetter with one key returns the bare value, not a tuple
+            picked = itemgetter(*periods)(values) if len(periods) > 1 else [values[p] for p in periods]
+        except KeyError:
+            picked = [values.get(p, 0.0) for p in periods]
+        return np.array(picked, dtype=np.float64)
+
+    def render_chart(self, charts_frame: tk.Frame, chart_row: int, periods: List[str],
+                     values: np.ndarray, metric_name: str, anomaly_indices: List[int]) -> None:
+        """
+        Build a metric chart and embed it in the charts frame (runs from after_idle).
+
+        A chart already rendered for the same data is shown from the class-level
+        PNG cache as a tk.PhotoImage, without creating a matplotlib figure.
+
+        Args:
+            charts_frame: Frame holding the charts
+            chart_row: Grid row reserved for this chart
+            periods: Period labels for the x-axis
+            values: Metric values for the y-axis
+            metric_name: Chart title
+            anomaly_indices: Indices of anomalous periods to highlight
+        """
+        # Form may have been closed before the idle callback ran
+        if not charts_frame.winfo_exists():
+            return
+
+        key = (
+            metric_name,
+            tuple(periods),
+            np.ascontiguousarray(values, dtype=np.float64).tobytes(),
+            tuple(anomaly_indices)
+        )
+        cache = AnomalyReviewForm._chart_cache
+
+        if key in cache:
+            cache.move_to_end(key)
+
+            # Tk decodes the cached PNG into a photo image
+            photo = png_to_photo_image(cache[key], charts_frame)
+
+            chart = tk.Canvas(
+                charts_frame, width=photo.width(), height=photo.height(), highlightthickness=0
+            )
+            chart.create_image(0, 0, anchor='nw', image=photo)
+            chart.grid(row=chart_row, column=0, pady=10)
+            self.chart_photos.append(photo)
+            return
+
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        fig = self.visualizer.create_chart(periods, values, metric_name, anomaly_indices)
+
+        canvas = FigureCanvasTkAgg(fig, master=charts_frame)
+
+        # Cache the first completed draw as PNG for the next visit
+        def on_first_draw(event):
+            canvas.mpl_disconnect(cid)
+            self.store_chart_png(key, rgba_to_png(np.asarray(event.canvas.buffer_rgba())))
+
+        cid = canvas.mpl_connect('draw_event', on_first_draw)
+
+        # Embed chart in tkinter; draw_idle defers the Agg render to the next idle pass
+        canvas.draw_idle()
+        canvas.get_tk_widget().grid(row=chart_row, column=0, pady=10)
+
+    def store_chart_png(self, key: tuple, png: bytes) -> None:
+        """
+        Add a rendered chart to the class-level cache, evicting the oldest entry.
+
+        Args:
+            key: Cache key built by render_chart
+            png: PNG bytes of the chart
+        """
+        cache = AnomalyReviewForm._chart_cache
+        cache[key] = png
+        cache.move_to_end(key)
+        while len(cache) > self.CHART_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def display_no_anomalies(self) -> None:
         """
         Display message when no anomalies are detected.
@@ -226,10 +334,13 @@ class AnomalyReviewForm(tk.Frame):
         self.anomaly_listbox.pack(side=tk.LEFT, fill=tk.BOTH)
         scrollbar.config(command=self.anomaly_listbox.yview)
 
-        # Populate listbox
-        for metric_name, period_label, idx, value, deviation in self.anomalies_data:
-            item_text = f"{metric_name} | {period_label} | Value: {value:,.2f} | Deviation: {deviation:.2f}σ"
-            self.anomaly_listbox.insert(tk.END, item_text)
+        # Populate listbox with a single batched insert
+        items = tuple(
+            f"{metric_name} | {period_label} | Value: {value:,.2f} | Deviation: {deviation:.2f}σ"
+            for metric_name, period_label, idx, value, deviation in self.anomalies_data.values()
+        )
+        self.anomaly_ids = list(self.anomalies_data)
+        self.anomaly_listbox.insert(tk.END, *items)
 
         # Buttons frame
         buttons_frame = tk.Frame(self)
@@ -290,7 +401,8 @@ class AnomalyReviewForm(tk.Frame):
             return
 
         idx = selected_indices[0]
-        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[idx]
+        anomaly_id = self.anomaly_ids[idx]
+        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[anomaly_id]
 
         # Create annotation dict
         annotation = {
@@ -308,7 +420,8 @@ class AnomalyReviewForm(tk.Frame):
         # Update status and remove from list
         self.status_label.config(text=f"Anomaly confirmed and saved: {metric_name} - {period_label}", fg='#4CAF50')
         self.anomaly_listbox.delete(idx)
-        del self.anomalies_data[idx]
+        del self.anomaly_ids[idx]
+        del self.anomalies_data[anomaly_id]
 
         messagebox.showinfo("Success", "Anomaly confirmed and saved")
 
@@ -322,7 +435,8 @@ class AnomalyReviewForm(tk.Frame):
             return
 
         idx = selected_indices[0]
-        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[idx]
+        anomaly_id = self.anomaly_ids[idx]
+        metric_name, period_label, period_idx, value, deviation = self.anomalies_data[anomaly_id]
 
         # Create annotation dict
         annotation = {
@@ -340,32 +454,24 @@ class AnomalyReviewForm(tk.Frame):
         # Update status and remove from list
         self.status_label.config(text=f"Anomaly dismissed: {metric_name} - {period_label}", fg='#2196F3')
         self.anomaly_listbox.delete(idx)
-        del self.anomalies_data[idx]
+        del self.anomaly_ids[idx]
+        del self.anomalies_data[anomaly_id]
 
         messagebox.showinfo("Success", "Anomaly dismissed")
 
     def save_annotation(self, annotation: Dict) -> None:
         """
-        Save anomaly annotation to config file.
+        Save anomaly annotation to the annotation log.
+
+        Appends one record to the annotation log (O(1)) instead of loading and
+        rewriting every saved annotation; ConfigManager.load_anomaly_annotations
+        folds it in for every consumer.
 
         Args:
             annotation: Annotation dict to save
         """
         try:
-            config_mgr = self.parent.get_config_manager()
-
-            # Load existing annotations or create new model
-            try:
-                model = config_mgr.load_config(self.CONFIG_FILEPATH)
-                if not isinstance(model, AnomalyAnnotationModel):
-                    # Convert if it's a generic ParameterModel
-                    model = AnomalyAnnotationModel(parameters=model.parameters)
-            except:
-                model = AnomalyAnnotationModel()
-
-            # Add annotation and save
-            model.add_annotation(annotation)
-            config_mgr.save_config(model, self.CONFIG_FILEPATH)
+            self._config_mgr.append_anomaly_annotation_records([annotation])
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save annotation: {str(e)}")
@@ -56,7 +56,6 @@ class BudgetParamsForm(tk.Frame):
 
         # Create scrollable container for sections
         container = tk.Frame(self)
-        container.grid(row=1, column=0, sticky='nsew', padx=20)
 
         # Revenue section
         self._create_revenue_section(container, defaults)
@@ -67,6 +66,10 @@ class BudgetParamsForm(tk.Frame):
         # Account overrides section (placeholder)
         self._create_overrides_section(container)
 
+        # Grid the container only once its sections exist, so the whole subtree
+        # is laid out in a single geometry pass when it is first mapped
+        container.grid(row=1, column=0, sticky='nsew', padx=20)
+
         # Create buttons container
         buttons_frame = tk.Frame(self)
         buttons_frame.grid(row=2, column=0, pady=20)
@@ -183,17 +186,23 @@ class BudgetParamsForm(tk.Frame):
             )
             category_label.pack(pady=(10, 5))
 
-            # Create field for each category
-            for category_name, default_rate in category_rates.items():
+            # Category fields live in their own grid (revenue_section is managed by pack)
+            categories_frame = tk.Frame(revenue_section)
+            categories_frame.grid_columnconfigure(0, weight=1)
+
+            # Create field for each category in its own grid row
+            for row, (category_name, default_rate) in enumerate(category_rates.items()):
                 category_field = NumericEntry(
-                    revenue_section,
+                    categories_frame,
                     label_text=f"  {category_name}:",
                     default_value=default_rate,
                     value_type=float
                 )
-                category_field.pack(pady=3)
+                category_field.grid(row=row, column=0, pady=3)
                 self.category_fields[category_name] = category_field
 
+            categories_frame.pack(fill=tk.X)
+
     def _create_expense_section(self, parent: tk.Frame, defaults: Dict[str, Any]) -> None:
         """
         Create expense section with adjustment factor field.
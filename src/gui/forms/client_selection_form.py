@@ -5,7 +5,33 @@ Provides CRUD operations for client folders with list view, creation dialog,
 selection, and deletion. Acts as prerequisite flow before main menu access.
 """
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox, simpledialog
+from typing import Callable, List, Optional, Tuple
+
+from ..components.fonts import get_font
+
+# Widget options shared by the form's action buttons
+_BUTTON_OPTIONS = {'width': 18, 'fg': 'black'}
+
+_MainMenuForm = None
+
+
+def _get_main_menu_form() -> type:
+    """
+    Resolve MainMenuForm on first navigation and reuse it afterwards.
+
+    Imported on first use: main_menu_form pulls in the report pipeline and
+    imports this module back to navigate here.
+
+    Returns:
+        MainMenuForm class
+    """
+    global _MainMenuForm
+    if _MainMenuForm is None:
+        from .main_menu_form import MainMenuForm
+        _MainMenuForm = MainMenuForm
+    return _MainMenuForm
 
 
 class ClientSelectionForm(tk.Frame):
@@ -16,6 +42,8 @@ class ClientSelectionForm(tk.Frame):
     and navigates to MainMenuForm after client selection.
     """
 
+    SCAN_POLL_MS = 50  # Interval for checking the background client folder scan
+
     def __init__(self, parent):
         """
         Initialize client selection form.
@@ -25,6 +53,18 @@ class ClientSelectionForm(tk.Frame):
         """
         super().__init__(parent)
         self.parent = parent
+        self._client_mgr = parent.get_client_manager()
+
+        # Client folders are scanned, created and deleted off the Tk thread; results
+        # are polled with after(). One worker keeps folder changes and scans in order.
+        self._client_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='client-io')
+        self._scan_future: Optional[Future] = None
+        self._scan_poll_after: Optional[str] = None
+        self._op_future: Optional[Future] = None
+        self._op_poll_after: Optional[str] = None
+        self._scan_status: Optional[Tuple[str, str]] = None
+        self._rescan_pending = False
+        self.bind('<Destroy>', self.on_destroy)
 
         # Configure grid layout
         self.grid_columnconfigure(0, weight=1)
@@ -34,7 +74,7 @@ class ClientSelectionForm(tk.Frame):
         title = tk.Label(
             self,
             text="Client Selection",
-            font=('Arial', 16, 'bold')
+            font=get_font(self, 16, 'bold')
         )
         title.grid(row=0, column=0, columnspan=2, pady=20)
 
@@ -42,7 +82,7 @@ class ClientSelectionForm(tk.Frame):
         subtitle = tk.Label(
             self,
             text="Select a client to work with, or create a new client",
-            font=('Arial', 12),
+            font=get_font(self, 12),
             fg='#666'
         )
         subtitle.grid(row=1, column=0, columnspan=2, pady=(0, 20))
@@ -57,7 +97,7 @@ class ClientSelectionForm(tk.Frame):
         list_frame = tk.LabelFrame(
             container,
             text="Available Clients",
-            font=('Arial', 12, 'bold'),
+            font=get_font(self, 12, 'bold'),
             padx=10,
             pady=10
         )
@@ -67,74 +107,60 @@ class ClientSelectionForm(tk.Frame):
         scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Listbox widget
+        # Listbox widget, backed by a Tcl list variable holding all client names
+        # (Listbox only draws the visible rows; the whole list is replaced in one set())
+        self._clients: List[str] = []
+        self._clients_var = tk.StringVar(master=self, value=())
         self.client_listbox = tk.Listbox(
             list_frame,
             width=30,
             height=15,
-            font=('Arial', 10),
+            font=get_font(self, 10),
+            listvariable=self._clients_var,
             yscrollcommand=scrollbar.set
         )
         self.client_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.client_listbox.yview)
 
+        # Double-click or Enter on a client selects it, same as the Select Client button
+        self.client_listbox.bind('<Double-Button-1>', self.on_listbox_activate)
+        self.client_listbox.bind('<Return>', self.on_listbox_activate)
+
         # Create buttons frame (right side)
         buttons_frame = tk.Frame(container)
         buttons_frame.grid(row=0, column=1, sticky='n')
 
-        # Create Client button
-        create_btn = tk.Button(
-            buttons_frame,
-            text="Create Client",
-            command=self.on_create_clicked,
-            width=18,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        create_btn.pack(pady=5)
-
-        # Select Client button
-        select_btn = tk.Button(
-            buttons_frame,
-            text="Select Client",
-            command=self.on_select_clicked,
-            width=18,
-            bg='#2196F3',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        select_btn.pack(pady=5)
-
-        # Delete Client button
-        delete_btn = tk.Button(
-            buttons_frame,
-            text="Delete Client",
-            command=self.on_delete_clicked,
-            width=18,
-            bg='#F44336',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        delete_btn.pack(pady=5)
-
-        # Exit button
-        exit_btn = tk.Button(
-            buttons_frame,
-            text="Exit",
-            command=self.on_exit_clicked,
-            width=18,
-            bg='#9E9E9E',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        exit_btn.pack(pady=5)
+        # Create/Select/Delete/Exit buttons: (text, command, background)
+        buttons = []
+        button_font = get_font(self, 10, 'bold')
+        for text, command, bg in (
+            ("Create Client", self.on_create_clicked, '#4CAF50'),
+            ("Select Client", self.on_select_clicked, '#2196F3'),
+            ("Delete Client", self.on_delete_clicked, '#F44336'),
+            ("Exit", self.on_exit_clicked, '#9E9E9E'),
+        ):
+            button = tk.Button(
+                buttons_frame,
+                text=text,
+                command=command,
+                bg=bg,
+                font=button_font,
+                **_BUTTON_OPTIONS
+            )
+            button.pack(pady=5)
+            buttons.append(button)
+
+        # Create/Select/Delete are disabled while a client folder is being created or deleted
+        self._action_buttons = tuple(buttons[:3])
+
+        # Last (text, fg) applied to the status label, so unchanged updates skip the Tcl call
+        self._shown_status: Optional[Tuple[str, str]] = None
 
         # Status message label
         self.status_label = tk.Label(
             self,
             text="",
-            font=('Arial', 10),
+            font=get_font(self, 10),
             fg='#666'
         )
         self.status_label.grid(row=3, column=0, columnspan=2, pady=10)
@@ -142,41 +168,216 @@ class ClientSelectionForm(tk.Frame):
         # Load clients on initialization
         self.refresh_list()
 
-    def refresh_list(self) -> None:
+    def refresh_list(self, status: Optional[Tuple[str, str]] = None) -> None:
         """
         Refresh listbox with current clients from filesystem.
 
-        Clears listbox and repopulates with discovered client names.
+        Starts discover_clients on a worker thread so a slow disk does not block
+        the UI; poll_client_scan applies the result on the Tk thread. A refresh
+        requested while a scan is running is coalesced into one rescan after it.
+
+        Args:
+            status: Optional (text, color) to show once the list is loaded, instead
+                   of the client count (e.g. the result of a create/delete)
         """
-        # Clear listbox
-        self.client_listbox.delete(0, tk.END)
+        self._scan_status = status
+
+        if self._scan_future is not None:
+            self._rescan_pending = True
+            return
+
+        if status is None:
+            self._set_status("Loading clients...", '#666')
 
-        # Discover clients
         try:
-            client_mgr = self.parent.get_client_manager()
-            clients = client_mgr.discover_clients(self.parent.project_root)
+            self._scan_future = self._client_executor.submit(
+                self._client_mgr.discover_clients, self.parent.project_root
+            )
+        except Exception as e:
+            self.show_scan_error(e)
+            return
 
-            # Add client names to listbox
-            for client in clients:
-                self.client_listbox.insert(tk.END, client)
+        self._scan_poll_after = self.after(self.SCAN_POLL_MS, self.poll_client_scan)
 
-            # Update status
-            count = len(clients)
-            if count > 0:
-                self.status_label.config(text=f"{count} client(s) found", fg='#4CAF50')
-            else:
-                self.status_label.config(text="No clients yet. Create your first client!", fg='#666')
+    def poll_client_scan(self) -> None:
+        """
+        Apply the background client scan once it finishes (runs on the Tk thread).
+        """
+        self._scan_poll_after = None
+        future = self._scan_future
+        if future is None:
+            return
 
+        if not future.done():
+            self._scan_poll_after = self.after(self.SCAN_POLL_MS, self.poll_client_scan)
+            return
+
+        self._scan_future = None
+
+        # Folders changed while this scan ran; scan again before showing anything
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self.refresh_list(self._scan_status)
+            return
+
+        try:
+            self.display_clients(future.result())
         except Exception as e:
-            self.status_label.config(text=f"Error loading clients: {str(e)}", fg='#F44336')
-            messagebox.showerror("Error", f"Failed to load clients: {str(e)}")
+            self.show_scan_error(e)
+
+    @staticmethod
+    def single_edit_index(old: List[str], new: List[str]) -> Optional[int]:
+        """
+        Find where one name was inserted into or removed from a client list.
+
+        Args:
+            old: Client names currently displayed
+            new: Client names from the latest scan
+
+        Returns:
+            Index of the inserted (new is longer) or removed (new is shorter) name,
+            or None if the lists do not differ by exactly one name
+        """
+        if abs(len(new) - len(old)) != 1:
+            return None
+
+        longer, shorter = (new, old) if len(new) > len(old) else (old, new)
+        idx = next(
+            (i for i, (a, b) in enumerate(zip(longer, shorter)) if a != b),
+            len(shorter)
+        )
+        if longer[idx + 1:] != shorter[idx:]:
+            return None
+        return idx
+
+    def display_clients(self, clients: List[str]) -> None:
+        """
+        Update the listbox contents to the discovered client names.
+
+        Leaves the listbox untouched when the names are unchanged (keeping the
+        selection) and patches a single added/removed row in place; any other
+        change replaces all rows with one list variable assignment.
+
+        Args:
+            clients: Client folder names in display order
+        """
+        old = self._clients
+        if clients != old:
+            idx = self.single_edit_index(old, clients)
+            if idx is None:
+                self._clients_var.set(clients)
+            elif len(clients) > len(old):
+                self.client_listbox.insert(idx, clients[idx])
+            else:
+                self.client_listbox.delete(idx)
+
+        # discover_clients already returns a fresh list, so it is kept as-is
+        self._clients = clients
+
+        # Update status
+        if self._scan_status is not None:
+            text, color = self._scan_status
+            self._set_status(text, color)
+            return
+
+        count = len(clients)
+        if count > 0:
+            self._set_status(f"{count} client(s) found", '#4CAF50')
+        else:
+            self._set_status("No clients yet. Create your first client!", '#666')
+
+    def _set_status(self, text: str, fg: str) -> None:
+        """
+        Show a status message, skipping the widget update if it is already shown.
+
+        Args:
+            text: Status message
+            fg: Text color
+        """
+        if (text, fg) != self._shown_status:
+            self.status_label.config(text=text, fg=fg)
+            self._shown_status = (text, fg)
+
+    def show_scan_error(self, error: Exception) -> None:
+        """
+        Report a failed client scan.
+
+        Args:
+            error: Exception raised while discovering clients
+        """
+        self._set_status(f"Error loading clients: {str(error)}", '#F44336')
+        messagebox.showerror("Error", f"Failed to load clients: {str(error)}")
+
+    def on_destroy(self, event) -> None:
+        """
+        Stop the client folder executor and cancel pending polls when the form is destroyed.
+
+        Args:
+            event: Tk <Destroy> event
+        """
+        if event.widget is self:
+            if self._scan_poll_after is not None:
+                self.after_cancel(self._scan_poll_after)
+                self._scan_poll_after = None
+            if self._op_poll_after is not None:
+                self.after_cancel(self._op_poll_after)
+                self._op_poll_after = None
+            self._client_executor.shutdown(wait=False)
+
+    def run_client_operation(
+        self,
+        operation: Callable[..., None],
+        args: Tuple,
+        busy_text: str,
+        on_done: Callable[[Optional[BaseException]], None]
+    ) -> None:
+        """
+        Run a client folder operation on the worker thread.
+
+        Create/Select/Delete are disabled until poll_client_operation hands the
+        outcome to on_done on the Tk thread.
+
+        Args:
+            operation: ClientManager method to run (create_client or delete_client)
+            args: Positional arguments for operation
+            busy_text: Status shown while the operation runs
+            on_done: Called with the raised exception, or None on success
+        """
+        for button in self._action_buttons:
+            button.config(state='disabled')
+        self._set_status(busy_text, '#666')
+
+        self._op_future = self._client_executor.submit(operation, *args)
+        self._op_poll_after = self.after(self.SCAN_POLL_MS, self.poll_client_operation, on_done)
+
+    def poll_client_operation(self, on_done: Callable[[Optional[BaseException]], None]) -> None:
+        """
+        Finish the running client folder operation once it completes (runs on the Tk thread).
+
+        Args:
+            on_done: Callback given to run_client_operation
+        """
+        self._op_poll_after = None
+        future = self._op_future
+        if future is None:
+            return
+
+        if not future.done():
+            self._op_poll_after = self.after(self.SCAN_POLL_MS, self.poll_client_operation, on_done)
+            return
+
+        self._op_future = None
+
+        for button in self._action_buttons:
+            button.config(state='normal')
+        on_done(future.exception())
 
     def on_create_clicked(self) -> None:
         """
         Handle Create Client button click with validation.
 
-        Opens dialog for client name, validates input, creates client folder,
-        and refreshes list.
+        Opens dialog for client name, validates input, creates client folder
+        on the worker thread, and refreshes list when done.
         """
         # Get client name from user
         name = simpledialog.askstring(
@@ -199,8 +400,7 @@ class ClientSelectionForm(tk.Frame):
 
         # Validate and create client
         try:
-            client_mgr = self.parent.get_client_manager()
-            validated_name = client_mgr.validate_client_name(name)
+            validated_name = self._client_mgr.validate_client_name(name)
 
             # Confirm if name was changed by validation
             if validated_name != name:
@@ -211,26 +411,59 @@ class ClientSelectionForm(tk.Frame):
                 )
 
             # Create client
-            client_mgr.create_client(validated_name, self.parent.project_root)
-
-            self.refresh_list()
-            messagebox.showinfo(
-                "Success",
-                f"Client '{validated_name}' created successfully."
-            )
-
-            # Update status
-            self.status_label.config(
-                text=f"Client '{validated_name}' created",
-                fg='#4CAF50'
+            self.run_client_operation(
+                self._client_mgr.create_client,
+                (validated_name, self.parent.project_root),
+                f"Creating client '{validated_name}'...",
+                lambda error: self.finish_create(validated_name, error)
             )
 
         except ValueError as e:
             messagebox.showerror("Invalid Client Name", str(e))
-            self.status_label.config(text="Create failed", fg='#F44336')
+            self._set_status("Create failed", '#F44336')
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create client: {e}")
-            self.status_label.config(text=f"Create failed: {str(e)}", fg='#F44336')
+            self._set_status(f"Create failed: {str(e)}", '#F44336')
+
+    def finish_create(self, client_name: str, error: Optional[BaseException]) -> None:
+        """
+        Report the outcome of a client folder creation.
+
+        Args:
+            client_name: Validated client name
+            error: Exception raised by create_client, or None on success
+        """
+        if isinstance(error, ValueError):
+            messagebox.showerror("Invalid Client Name", str(error))
+            self._set_status("Create failed", '#F44336')
+            return
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to create client: {error}")
+            self._set_status(f"Create failed: {str(error)}", '#F44336')
+            return
+
+        # Update status (kept once the refreshed list is loaded)
+        status = (f"Client '{client_name}' created", '#4CAF50')
+        self._set_status(*status)
+        self.refresh_list(status)
+
+        messagebox.showinfo(
+            "Success",
+            f"Client '{client_name}' created successfully."
+        )
+
+    def on_listbox_activate(self, event) -> None:
+        """
+        Select the activated client (double-click or Enter in the listbox).
+
+        Ignored while a client folder is being created or deleted, when the
+        Select Client button is disabled.
+
+        Args:
+            event: Tk <Double-Button-1> or <Return> event
+        """
+        if self._op_future is None:
+            self.on_select_clicked()
 
     def on_select_clicked(self) -> None:
         """
@@ -246,22 +479,20 @@ class ClientSelectionForm(tk.Frame):
             return
 
         # Get client name at selected index
-        selected_index = selection[0]
-        client_name = self.client_listbox.get(selected_index)
+        client_name = self._clients[selection[0]]
 
         # Set selected client in parent app
         self.parent.selected_client = client_name
 
         # Navigate to main menu
-        from .main_menu_form import MainMenuForm
-        self.parent.show_form(MainMenuForm)
+        self.parent.show_form(_get_main_menu_form())
 
     def on_delete_clicked(self) -> None:
         """
         Handle Delete Client button click.
 
-        Shows confirmation dialog, validates selection, deletes client folder,
-        and refreshes list.
+        Shows confirmation dialog, validates selection, deletes client folder
+        on the worker thread, and refreshes list when done.
         """
         # Get selected index
         selection = self.client_listbox.curselection()
@@ -270,8 +501,7 @@ class ClientSelectionForm(tk.Frame):
             return
 
         # Get client name at selected index
-        selected_index = selection[0]
-        client_name = self.client_listbox.get(selected_index)
+        client_name = self._clients[selection[0]]
 
         # Confirm deletion
         confirm = messagebox.askyesno(
@@ -284,28 +514,42 @@ class ClientSelectionForm(tk.Frame):
 
         # Delete client
         try:
-            client_mgr = self.parent.get_client_manager()
-            client_mgr.delete_client(client_name, self.parent.project_root)
+            self.run_client_operation(
+                self._client_mgr.delete_client,
+                (client_name, self.parent.project_root),
+                f"Deleting client '{client_name}'...",
+                lambda error: self.finish_delete(client_name, error)
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete client: {e}")
+            self._set_status(f"Delete failed: {str(e)}", '#F44336')
 
-            self.refresh_list()
+    def finish_delete(self, client_name: str, error: Optional[BaseException]) -> None:
+        """
+        Report the outcome of a client folder deletion.
 
-            # Update status
-            self.status_label.config(
-                text=f"Client '{client_name}' deleted",
-                fg='#4CAF50'
-            )
+        Args:
+            client_name: Deleted client name
+            error: Exception raised by delete_client, or None on success
+        """
+        if isinstance(error, ValueError):
+            messagebox.showerror("Error", str(error))
+            self._set_status("Delete failed", '#F44336')
+            return
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to delete client: {error}")
+            self._set_status(f"Delete failed: {str(error)}", '#F44336')
+            return
 
-            messagebox.showinfo(
-                "Success",
-                f"Client '{client_name}' deleted successfully."
-            )
+        # Update status (kept once the refreshed list is loaded)
+        status = (f"Client '{client_name}' deleted", '#4CAF50')
+        self._set_status(*status)
+        self.refresh_list(status)
 
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-            self.status_label.config(text="Delete failed", fg='#F44336')
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete client: {e}")
-            self.status_label.config(text=f"Delete failed: {str(e)}", fg='#F44336')
+        messagebox.showinfo(
+            "Success",
+            f"Client '{client_name}' deleted successfully."
+        )
 
     def on_exit_clicked(self) -> None:
         """
@@ -5,9 +5,50 @@ Provides file picker dialogs for the 4 required QuickBooks input files
 (Balance Sheet, Profit & Loss, Cash Flow Statement, Historical Data CSV).
 Validates all 4 files are selected before proceeding to main menu.
 """
+import os
 import tkinter as tk
 from tkinter import filedialog
-from pathlib import Path
+from typing import Optional
+
+from ..components.fonts import get_font
+
+# File dialog filter shared by all input file pickers
+_CSV_TYPES = (("CSV files", "*.csv"), ("All files", "*.*"))
+
+# File picker rows: (App attribute holding the path, row caption, dialog title)
+_FILE_ROWS = (
+    ('selected_balance_sheet', "Balance Sheet (.csv):", "Select Balance Sheet"),
+    ('selected_profit_loss', "Profit & Loss (.csv):", "Select Profit & Loss"),
+    ('selected_cash_flow', "Cash Flow Statement (.csv):", "Select Cash Flow Statement"),
+    ('selected_historical_data', "Historical Data (.csv):", "Select Historical Data"),
+)
+
+# Widget options shared by the form's buttons and file picker row cells
+_BUTTON_OPTIONS = {'width': 18, 'fg': 'black'}
+_ROW_CELL_GRID = {'sticky': 'w', 'pady': 10, 'padx': (0, 10)}
+
+# App attributes holding the selected input file paths
+_FILE_ATTRS = tuple(row[0] for row in _FILE_ROWS)
+
+
+_MainMenuForm = None
+
+
+def _get_main_menu_form() -> type:
+    """
+    Resolve MainMenuForm on first navigation and reuse it afterwards.
+
+    Imported on first use: main_menu_form pulls in the report pipeline and
+    imports this module back to navigate here.
+
+    Returns:
+        MainMenuForm class
+    """
+    global _MainMenuForm
+    if _MainMenuForm is None:
+        from .main_menu_form import MainMenuForm
+        _MainMenuForm = MainMenuForm
+    return _MainMenuForm
 
 
 class FileSelectionForm(tk.Frame):
@@ -28,6 +69,10 @@ class FileSelectionForm(tk.Frame):
         super().__init__(parent)
         self.parent = parent
 
+        # Pending after_idle validation; browse selections are revalidated once per idle pass
+        self._validate_after: Optional[str] = None
+        self.bind('<Destroy>', self.on_destroy)
+
         # Configure grid layout
         self.grid_columnconfigure(0, weight=1)
 
@@ -35,7 +80,7 @@ class FileSelectionForm(tk.Frame):
         title = tk.Label(
             self,
             text="File Selection",
-            font=('Arial', 16, 'bold')
+            font=get_font(self, 16, 'bold')
         )
         title.grid(row=0, column=0, pady=20)
 
@@ -43,7 +88,7 @@ class FileSelectionForm(tk.Frame):
         subtitle = tk.Label(
             self,
             text="Select the 4 required QuickBooks input files",
-            font=('Arial', 12),
+            font=get_font(self, 12),
             fg='#666'
         )
         subtitle.grid(row=1, column=0, pady=(0, 20))
@@ -52,120 +97,49 @@ class FileSelectionForm(tk.Frame):
         container = tk.LabelFrame(
             self,
             text="Required Input Files",
-            font=('Arial', 12, 'bold'),
+            font=get_font(self, 12, 'bold'),
             padx=20,
             pady=20
         )
         container.grid(row=2, column=0, sticky='nsew', padx=20, pady=10)
         container.grid_columnconfigure(1, weight=1)
 
-        # Balance Sheet row
-        tk.Label(
-            container,
-            text="Balance Sheet (.csv):",
-            font=('Arial', 10),
-            anchor='w'
-        ).grid(row=0, column=0, sticky='w', pady=10, padx=(0, 10))
-
-        self.balance_sheet_label = tk.Label(
-            container,
-            text="No file selected",
-            font=('Arial', 10),
-            fg='#666',
-            anchor='w'
-        )
-        self.balance_sheet_label.grid(row=0, column=1, sticky='w', pady=10, padx=(0, 10))
-
-        tk.Button(
-            container,
-            text="Browse...",
-            command=self._on_browse_balance_sheet,
-            width=18,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        ).grid(row=0, column=2, pady=10)
-
-        # Profit & Loss row
-        tk.Label(
-            container,
-            text="Profit & Loss (.csv):",
-            font=('Arial', 10),
-            anchor='w'
-        ).grid(row=1, column=0, sticky='w', pady=10, padx=(0, 10))
-
-        self.profit_loss_label = tk.Label(
-            container,
-            text="No file selected",
-            font=('Arial', 10),
-            fg='#666',
-            anchor='w'
-        )
-        self.profit_loss_label.grid(row=1, column=1, sticky='w', pady=10, padx=(0, 10))
-
-        tk.Button(
-            container,
-            text="Browse...",
-            command=self._on_browse_profit_loss,
-            width=18,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        ).grid(row=1, column=2, pady=10)
-
-        # Cash Flow Statement row
-        tk.Label(
-            container,
-            text="Cash Flow Statement (.csv):",
-            font=('Arial', 10),
-            anchor='w'
-        ).grid(row=2, column=0, sticky='w', pady=10, padx=(0, 10))
-
-        self.cash_flow_label = tk.Label(
-            container,
-            text="No file selected",
-            font=('Arial', 10),
-            fg='#666',
-            anchor='w'
-        )
-        self.cash_flow_label.grid(row=2, column=1, sticky='w', pady=10, padx=(0, 10))
-
-        tk.Button(
-            container,
-            text="Browse...",
-            command=self._on_browse_cash_flow,
-            width=18,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        ).grid(row=2, column=2, pady=10)
-
-        # Historical Data row
-        tk.Label(
-            container,
-            text="Historical Data (.csv):",
-            font=('Arial', 10),
-            anchor='w'
-        ).grid(row=3, column=0, sticky='w', pady=10, padx=(0, 10))
-
-        self.historical_data_label = tk.Label(
-            container,
-            text="No file selected",
-            font=('Arial', 10),
-            fg='#666',
-            anchor='w'
-        )
-        self.historical_data_label.grid(row=3, column=1, sticky='w', pady=10, padx=(0, 10))
-
-        tk.Button(
-            container,
-            text="Browse...",
-            command=self._on_browse_historical_data,
-            width=18,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        ).grid(row=3, column=2, pady=10)
+        # One caption / filename label / Browse button row per input file;
+        # filename labels are keyed by the App attribute they display
+        self._labels = {}
+        body_font = get_font(self, 10)
+        button_font = get_font(self, 10, 'bold')
+        for row, (attr, caption, title) in enumerate(_FILE_ROWS):
+            tk.Label(
+                container,
+                text=caption,
+                font=body_font,
+                anchor='w'
+            ).grid(row=row, column=0, **_ROW_CELL_GRID)
+
+            label = tk.Label(
+                container,
+                text="No file selected",
+                font=body_font,
+                fg='#666',
+                anchor='w'
+            )
+            label.grid(row=row, column=1, **_ROW_CELL_GRID)
+            self._labels[attr] = label
+
+            tk.Button(
+                container,
+                text="Browse...",
+                command=lambda attr=attr, title=title: self._browse(title, attr),
+                bg='#4CAF50',
+                font=button_font,
+                **_BUTTON_OPTIONS
+            ).grid(row=row, column=2, pady=10)
+
+        self.balance_sheet_label = self._labels['selected_balance_sheet']
+        self.profit_loss_label = self._labels['selected_profit_loss']
+        self.cash_flow_label = self._labels['selected_cash_flow']
+        self.historical_data_label = self._labels['selected_historical_data']
 
         # Create buttons frame
         buttons_frame = tk.Frame(self)
@@ -176,11 +150,10 @@ class FileSelectionForm(tk.Frame):
             buttons_frame,
             text="Proceed",
             command=self._on_proceed,
-            width=18,
             bg='#2196F3',
-            fg='black',
-            font=('Arial', 10, 'bold'),
-            state='disabled'
+            font=button_font,
+            state='disabled',
+            **_BUTTON_OPTIONS
         )
         self.proceed_btn.pack(side=tk.LEFT, padx=5)
 
@@ -189,18 +162,21 @@ class FileSelectionForm(tk.Frame):
             buttons_frame,
             text="Clear Selections",
             command=self._on_clear_selections,
-            width=18,
             bg='#9E9E9E',
-            fg='black',
-            font=('Arial', 10, 'bold')
+            font=button_font,
+            **_BUTTON_OPTIONS
         )
         clear_btn.pack(side=tk.LEFT, padx=5)
 
+        # Last (text, fg) / (state, bg) applied, so unchanged updates skip the Tcl call
+        self._shown_status = None
+        self._proceed_state = None
+
         # Status message label
         self.status_label = tk.Label(
             self,
             text="",
-            font=('Arial', 10),
+            font=body_font,
             fg='#666'
         )
         self.status_label.grid(row=4, column=0, pady=10)
@@ -208,49 +184,89 @@ class FileSelectionForm(tk.Frame):
         # Initialize UI based on current state
         self._refresh_ui()
 
+    def _browse(self, title: str, attr: str) -> None:
+        """
+        Ask for an input file and record it on the App.
+
+        Args:
+            title: File dialog title
+            attr: App attribute that stores the selected path (e.g. 'selected_cash_flow')
+        """
+        filepath = filedialog.askopenfilename(title=title, filetypes=_CSV_TYPES)
+        if filepath:
+            setattr(self.parent, attr, filepath)
+            self._labels[attr].config(text=os.path.basename(filepath))
+            self._schedule_validate()
+
     def _on_browse_balance_sheet(self) -> None:
         """Handle Balance Sheet browse button click."""
-        filepath = filedialog.askopenfilename(
-            title="Select Balance Sheet",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-        )
-        if filepath:
-            self.parent.selected_balance_sheet = filepath
-            self.balance_sheet_label.config(text=Path(filepath).name)
-            self._validate_selections()
+        self._browse("Select Balance Sheet", 'selected_balance_sheet')
 
     def _on_browse_profit_loss(self) -> None:
         """Handle Profit & Loss browse button click."""
-        filepath = filedialog.askopenfilename(
-            title="Select Profit & Loss",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-        )
-        if filepath:
-            self.parent.selected_profit_loss = filepath
-            self.profit_loss_label.config(text=Path(filepath).name)
-            self._validate_selections()
+        self._browse("Select Profit & Loss", 'selected_profit_loss')
 
     def _on_browse_cash_flow(self) -> None:
         """Handle Cash Flow Statement browse button click."""
-        filepath = filedialog.askopenfilename(
-            title="Select Cash Flow Statement",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-        )
-        if filepath:
-            self.parent.selected_cash_flow = filepath
-            self.cash_flow_label.config(text=Path(filepath).name)
-            self._validate_selections()
+        self._browse("Select Cash Flow Statement", 'selected_cash_flow')
 
     def _on_browse_historical_data(self) -> None:
         """Handle Historical Data browse button click."""
-        filepath = filedialog.askopenfilename(
-            title="Select Historical Data",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-        )
-        if filepath:
-            self.parent.selected_historical_data = filepath
-            self.historical_data_label.config(text=Path(filepath).name)
-            self._validate_selections()
+        self._browse("Select Historical Data", 'selected_historical_data')
+
+    def _set_status(self, text: str, fg: str) -> None:
+        """
+        Show a status message, skipping the widget update if it is already shown.
+
+        Args:
+            text: Status message
+            fg: Text color
+        """
+        if (text, fg) != self._shown_status:
+            self.status_label.config(text=text, fg=fg)
+            self._shown_status = (text, fg)
+
+    def _set_proceed_state(self, state: str, bg: str) -> None:
+        """
+        Enable or disable the Proceed button, skipping the update if unchanged.
+
+        Args:
+            state: Button state ('normal' or 'disabled')
+            bg: Button background color
+        """
+        if (state, bg) != self._proceed_state:
+            self.proceed_btn.config(state=state, bg=bg)
+            self._proceed_state = (state, bg)
+
+    def _all_selected(self) -> bool:
+        """Return True when every input file path attribute on the App is set."""
+        parent = self.parent
+        return all(getattr(parent, attr) is not None for attr in _FILE_ATTRS)
+
+    def _schedule_validate(self) -> None:
+        """
+        Revalidate selections on the next idle pass.
+
+        Several selections made before Tk goes idle share one validation.
+        """
+        if self._validate_after is None:
+            self._validate_after = self.after_idle(self._run_scheduled_validate)
+
+    def _run_scheduled_validate(self) -> None:
+        """Run the validation queued by _schedule_validate."""
+        self._validate_after = None
+        self._validate_selections()
+
+    def on_destroy(self, event) -> None:
+        """
+        Cancel a pending validation when the form is destroyed.
+
+        Args:
+            event: Tk <Destroy> event
+        """
+        if event.widget is self and self._validate_after is not None:
+            self.after_cancel(self._validate_after)
+            self._validate_after = None
 
     def _validate_selections(self) -> None:
         """
@@ -258,19 +274,21 @@ class FileSelectionForm(tk.Frame):
 
         Enables proceed button only when all 4 file path attributes are not None.
         """
-        all_selected = (
-            self.parent.selected_balance_sheet is not None and
-            self.parent.selected_profit_loss is not None and
-            self.parent.selected_cash_flow is not None and
-            self.parent.selected_historical_data is not None
-        )
+        self._show_validation(self._all_selected())
 
+    def _show_validation(self, all_selected: bool) -> None:
+        """
+        Update the proceed button and status for the validation result.
+
+        Args:
+            all_selected: Whether all 4 file path attributes are set
+        """
         if all_selected:
-            self.proceed_btn.config(state='normal', bg='#2196F3')
-            self.status_label.config(text="All files selected - ready to proceed", fg='#4CAF50')
+            self._set_proceed_state('normal', '#2196F3')
+            self._set_status("All files selected - ready to proceed", '#4CAF50')
         else:
-            self.proceed_btn.config(state='disabled', bg='#CCCCCC')
-            self.status_label.config(text="", fg='#666')
+            self._set_proceed_state('disabled', '#CCCCCC')
+            self._set_status("", '#666')
 
     def _on_clear_selections(self) -> None:
         """
@@ -278,18 +296,12 @@ class FileSelectionForm(tk.Frame):
 
         Resets all 4 file path attributes to None and updates UI.
         """
-        self.parent.selected_balance_sheet = None
-        self.parent.selected_profit_loss = None
-        self.parent.selected_cash_flow = None
-        self.parent.selected_historical_data = None
-
-        self.balance_sheet_label.config(text="No file selected")
-        self.profit_loss_label.config(text="No file selected")
-        self.cash_flow_label.config(text="No file selected")
-        self.historical_data_label.config(text="No file selected")
+        for attr, label in self._labels.items():
+            setattr(self.parent, attr, None)
+            label.config(text="No file selected")
 
         self._validate_selections()
-        self.status_label.config(text="Selections cleared", fg='#666')
+        self._set_status("Selections cleared", '#666')
 
     def _on_proceed(self) -> None:
         """
@@ -299,20 +311,12 @@ class FileSelectionForm(tk.Frame):
         to MainMenuForm.
         """
         # Defensive validation check
-        all_selected = (
-            self.parent.selected_balance_sheet is not None and
-            self.parent.selected_profit_loss is not None and
-            self.parent.selected_cash_flow is not None and
-            self.parent.selected_historical_data is not None
-        )
-
-        if not all_selected:
-            self.status_label.config(text="Please select all 4 required files", fg='#F44336')
+        if not self._all_selected():
+            self._set_status("Please select all 4 required files", '#F44336')
             return
 
         # Navigate to main menu
-        from .main_menu_form import MainMenuForm
-        self.parent.show_form(MainMenuForm)
+        self.parent.show_form(_get_main_menu_form())
 
     def _refresh_ui(self) -> None:
         """
@@ -320,21 +324,14 @@ class FileSelectionForm(tk.Frame):
 
         Updates filename labels and validation status based on App state.
         """
-        # Update Balance Sheet label
-        if self.parent.selected_balance_sheet:
-            self.balance_sheet_label.config(text=Path(self.parent.selected_balance_sheet).name)
-
-        # Update Profit & Loss label
-        if self.parent.selected_profit_loss:
-            self.profit_loss_label.config(text=Path(self.parent.selected_profit_loss).name)
-
-        # Update Cash Flow label
-        if self.parent.selected_cash_flow:
-            self.cash_flow_label.config(text=Path(self.parent.selected_cash_flow).name)
-
-        # Update Historical Data label
-        if self.parent.selected_historical_data:
-            self.historical_data_label.config(text=Path(self.parent.selected_historical_data).name)
-
-        # Validate selections to update proceed button state
-        self._validate_selections()
+        # Labels and validation come from the same single read of each attribute
+        all_selected = True
+        for attr, label in self._labels.items():
+            filepath = getattr(self.parent, attr)
+            if filepath:
+                label.config(text=os.path.basename(filepath))
+            if filepath is None:
+                all_selected = False
+
+        # Update proceed button state
+        self._show_validation(all_selected)
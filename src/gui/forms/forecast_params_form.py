@@ -5,13 +5,47 @@ Provides hierarchical sections for revenue growth rates, expense trend adjustmen
 cash flow timing parameters, and major cash events. Loads specific scenario by ID
 and saves changes back to scenarios collection.
 """
+import re
 import tkinter as tk
-from tkinter import messagebox
-from typing import Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from tkinter import messagebox, ttk
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..components.form_fields import NumericEntry, LabeledEntry, LabeledDropdown
 from ...models.forecast_scenario import ForecastScenariosCollection
 
+# Widget options shared by every parameter section
+_SECTION_OPTIONS = {'font': ('Arial', 12, 'bold'), 'padx': 10, 'pady': 10}
+_HELP_LABEL_OPTIONS = {'font': ('Arial', 9, 'italic'), 'fg': '#666'}
+_BUTTON_FONT = ('Arial', 10, 'bold')
+_EVENT_BUTTON_FONT = ('Arial', 9, 'bold')
+
+# Listbox row for an external event dict (filled with str.format_map)
+_EVENT_DISPLAY_FORMAT = 'Month {month} | {impact_type} | {magnitude}% | {description}'
+
+# Comma separator together with the whitespace around it
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+# Resolved on first back navigation (see _get_scenario_list_form)
+_ScenarioListForm = None
+
+
+def _get_scenario_list_form() -> type:
+    """
+    Resolve ScenarioListForm on first navigation and reuse it afterwards.
+
+    Imported on first use: scenario_list_form imports this module back to open
+    the parameters form.
+
+    Returns:
+        ScenarioListForm class
+    """
+    global _ScenarioListForm
+    if _ScenarioListForm is None:
+        from .scenario_list_form import ScenarioListForm
+        _ScenarioListForm = ScenarioListForm
+    return _ScenarioListForm
+
 
 class ForecastParamsForm(tk.Frame):
     """
@@ -22,6 +56,7 @@ class ForecastParamsForm(tk.Frame):
     """
 
     CONFIG_FILEPATH = 'config/forecast_scenarios.json'
+    SAVE_POLL_MS = 50  # Interval for checking the background save
 
     def __init__(self, parent, scenario_id: str):
         """
@@ -38,6 +73,12 @@ class ForecastParamsForm(tk.Frame):
         # Storage for field references (for easy value collection)
         self.fields: Dict[str, Any] = {}
 
+        # Scenario saves run off the Tk thread; results are polled with after()
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scenario-save')
+        self._save_future: Optional[Future] = None
+        self._save_poll_after: Optional[str] = None
+        self.bind('<Destroy>', self.on_destroy)
+
         # Load scenario from collection
         self.scenarios_collection = None
         self.current_scenario = None
@@ -55,35 +96,37 @@ class ForecastParamsForm(tk.Frame):
         )
         title.grid(row=0, column=0, pady=20)
 
-        # Create scrollable container for sections
-        canvas = tk.Canvas(self)
-        scrollbar = tk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.grid(row=1, column=0, sticky='nsew', padx=20)
-        scrollbar.grid(row=1, column=1, sticky='ns')
+        # One notebook tab per parameter section; only the first tab is built up
+        # front, the others are built the first time they are shown (or on save)
+        self.notebook = ttk.Notebook(self)
+        self.notebook.grid(row=1, column=0, sticky='nsew', padx=20)
         self.grid_rowconfigure(1, weight=1)
 
-        # Create parameter sections
+        # Tab widget name -> (section builder, section params) for tabs not built yet
+        self._pending_tabs: Dict[str, Tuple[Callable[[tk.Frame, Dict[str, Any]], None], Dict[str, Any]]] = {}
+
         if self.current_scenario:
             params = self.current_scenario.parameters
-            self._create_revenue_section(scrollable_frame, params.get('revenue_growth_rates', {}))
-            self._create_expense_section(scrollable_frame, params.get('expense_trend_adjustments', {}))
-            self._create_cash_flow_section(scrollable_frame, params.get('cash_flow_timing_params', {}))
-            self._create_major_events_section(scrollable_frame, params.get('major_cash_events', {}))
-            self._create_external_events_section(scrollable_frame, params.get('external_events', {}))
+            sections = (
+                ("Revenue", self._create_revenue_section, 'revenue_growth_rates'),
+                ("Expenses", self._create_expense_section, 'expense_trend_adjustments'),
+                ("Cash Flow", self._create_cash_flow_section, 'cash_flow_timing_params'),
+                ("Major Events", self._create_major_events_section, 'major_cash_events'),
+                ("External Events", self._create_external_events_section, 'external_events'),
+            )
+            for index, (tab_text, builder, params_key) in enumerate(sections):
+                tab = tk.Frame(self.notebook)
+                self.notebook.add(tab, text=tab_text)
+                if index == 0:
+                    builder(tab, params.get(params_key, {}))
+                else:
+                    self._pending_tabs[str(tab)] = (builder, params.get(params_key, {}))
+
+            self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_shown)
 
         # Create buttons container
         buttons_frame = tk.Frame(self)
-        buttons_frame.grid(row=2, column=0, columnspan=2, pady=20)
+        buttons_frame.grid(row=2, column=0, pady=20)
 
         # Save button
         save_btn = tk.Button(
@@ -93,7 +136,7 @@ class ForecastParamsForm(tk.Frame):
             width=20,
             bg='#4CAF50',
             fg='black',
-            font=('Arial', 10, 'bold')
+            font=_BUTTON_FONT
         )
         save_btn.pack(side=tk.LEFT, padx=10)
 
@@ -105,7 +148,7 @@ class ForecastParamsForm(tk.Frame):
             width=20,
             bg='#9E9E9E',
             fg='black',
-            font=('Arial', 10, 'bold')
+            font=_BUTTON_FONT
         )
         back_btn.pack(side=tk.LEFT, padx=10)
 
@@ -116,7 +159,7 @@ class ForecastParamsForm(tk.Frame):
             font=('Arial', 10),
             fg='#666'
         )
-        self.status_label.grid(row=3, column=0, columnspan=2, pady=10)
+        self.status_label.grid(row=3, column=0, pady=10)
 
     def _load_scenario(self) -> None:
         """
@@ -140,6 +183,34 @@ class ForecastParamsForm(tk.Frame):
             self.current_scenario = None
             messagebox.showerror("Error", f"Failed to load scenario: {str(e)}")
 
+    def _on_tab_shown(self, event) -> None:
+        """
+        Build the selected tab's section the first time the tab is shown.
+
+        Stops listening for tab changes once every section is built.
+
+        Args:
+            event: Tk <<NotebookTabChanged>> event
+        """
+        tab_name = self.notebook.select()
+        pending = self._pending_tabs.pop(tab_name, None)
+        if pending is not None:
+            builder, params = pending
+            builder(self.nametowidget(tab_name), params)
+            if not self._pending_tabs:
+                self.notebook.unbind('<<NotebookTabChanged>>')
+
+    def build_pending_sections(self) -> None:
+        """
+        Build every section whose tab has not been shown yet.
+
+        Called before saving so all fields exist to collect values from.
+        """
+        for tab_name, (builder, params) in list(self._pending_tabs.items()):
+            del self._pending_tabs[tab_name]
+            builder(self.nametowidget(tab_name), params)
+        self.notebook.unbind('<<NotebookTabChanged>>')
+
     def _create_revenue_section(self, parent: tk.Frame, params: Dict[str, Any]) -> None:
         """
         Create revenue growth rates section with fields.
@@ -151,9 +222,7 @@ class ForecastParamsForm(tk.Frame):
         revenue_section = tk.LabelFrame(
             parent,
             text="Revenue Growth Rates",
-            font=('Arial', 12, 'bold'),
-            padx=10,
-            pady=10
+            **_SECTION_OPTIONS
         )
         revenue_section.pack(fill=tk.X, expand=False, pady=10)
 
@@ -168,7 +237,7 @@ class ForecastParamsForm(tk.Frame):
         self.fields['monthly_rate'] = monthly_rate_field
 
         # Use averaged checkbox
-        use_averaged_var = tk.IntVar(value=1 if params.get('use_averaged', True) else 0)
+        use_averaged_var = tk.IntVar(self, value=1 if params.get('use_averaged', True) else 0)
         use_averaged_check = tk.Checkbutton(
             revenue_section,
             text="Use Averaged Growth Rate",
@@ -182,8 +251,7 @@ class ForecastParamsForm(tk.Frame):
         help_text = tk.Label(
             revenue_section,
             text="(Monthly rate as decimal: 0.05 = 5% growth)",
-            font=('Arial', 9, 'italic'),
-            fg='#666'
+            **_HELP_LABEL_OPTIONS
         )
         help_text.pack(pady=2)
 
@@ -198,9 +266,7 @@ class ForecastParamsForm(tk.Frame):
         expense_section = tk.LabelFrame(
             parent,
             text="Expense Trend Adjustments",
-            font=('Arial', 12, 'bold'),
-            padx=10,
-            pady=10
+            **_SECTION_OPTIONS
         )
         expense_section.pack(fill=tk.X, expand=False, pady=10)
 
@@ -228,8 +294,7 @@ class ForecastParamsForm(tk.Frame):
         help_text = tk.Label(
             expense_section,
             text="(Trend rate as decimal: 0.03 = 3% increase)",
-            font=('Arial', 9, 'italic'),
-            fg='#666'
+            **_HELP_LABEL_OPTIONS
         )
         help_text.pack(pady=2)
 
@@ -244,9 +309,7 @@ class ForecastParamsForm(tk.Frame):
         cash_flow_section = tk.LabelFrame(
             parent,
             text="Cash Flow Timing Parameters",
-            font=('Arial', 12, 'bold'),
-            padx=10,
-            pady=10
+            **_SECTION_OPTIONS
         )
         cash_flow_section.pack(fill=tk.X, expand=False, pady=10)
 
@@ -274,8 +337,7 @@ class ForecastParamsForm(tk.Frame):
         help_text = tk.Label(
             cash_flow_section,
             text="(Number of days for collections and payments)",
-            font=('Arial', 9, 'italic'),
-            fg='#666'
+            **_HELP_LABEL_OPTIONS
         )
         help_text.pack(pady=2)
 
@@ -290,9 +352,7 @@ class ForecastParamsForm(tk.Frame):
         events_section = tk.LabelFrame(
             parent,
             text="Major Cash Events",
-            font=('Arial', 12, 'bold'),
-            padx=10,
-            pady=10
+            **_SECTION_OPTIONS
         )
         events_section.pack(fill=tk.X, expand=False, pady=10)
 
@@ -324,8 +384,7 @@ class ForecastParamsForm(tk.Frame):
         help_text = tk.Label(
             events_section,
             text="(Comma-separated values for planned events)",
-            font=('Arial', 9, 'italic'),
-            fg='#666'
+            **_HELP_LABEL_OPTIONS
         )
         help_text.pack(pady=2)
 
@@ -340,9 +399,7 @@ class ForecastParamsForm(tk.Frame):
         events_section = tk.LabelFrame(
             parent,
             text="External Economic Events",
-            font=('Arial', 12, 'bold'),
-            padx=10,
-            pady=10
+            **_SECTION_OPTIONS
         )
         events_section.pack(fill=tk.X, expand=False, pady=10)
 
@@ -350,10 +407,9 @@ class ForecastParamsForm(tk.Frame):
         help_text = tk.Label(
             events_section,
             text="(Forward-looking external events: tariffs, policy changes, economic shocks - distinct from internal major cash events)",
-            font=('Arial', 9, 'italic'),
-            fg='#666',
             wraplength=600,
-            justify=tk.LEFT
+            justify=tk.LEFT,
+            **_HELP_LABEL_OPTIONS
         )
         help_text.pack(pady=(0, 10))
 
@@ -415,7 +471,7 @@ class ForecastParamsForm(tk.Frame):
             width=15,
             bg='#4CAF50',
             fg='black',
-            font=('Arial', 9, 'bold')
+            font=_EVENT_BUTTON_FONT
         )
         add_btn.pack(side=tk.LEFT, padx=5)
 
@@ -427,7 +483,7 @@ class ForecastParamsForm(tk.Frame):
             width=15,
             bg='#F44336',
             fg='black',
-            font=('Arial', 9, 'bold')
+            font=_EVENT_BUTTON_FONT
         )
         delete_btn.pack(side=tk.LEFT, padx=5)
 
@@ -448,27 +504,22 @@ class ForecastParamsForm(tk.Frame):
         self.external_events_listbox.pack(side=tk.LEFT, fill=tk.BOTH)
         scrollbar.config(command=self.external_events_listbox.yview)
 
-        # Initialize events list storage
-        self.external_events_list = []
+        # Initialize events list storage with existing events from params
+        self.external_events_list = list(params.get('events', []))
 
-        # Load existing events from params
-        existing_events = params.get('events', [])
-        for event in existing_events:
-            self.external_events_list.append(event)
-
-        # Refresh display
+        # Display all loaded events (single Listbox insert)
         self._refresh_external_events_listbox()
 
     def _on_add_external_event_clicked(self) -> None:
         """
         Handle add external event button click.
 
-        Validates fields, appends to events list, refreshes display, and clears form.
+        Validates fields, appends to events list and listbox, and clears form.
         """
         try:
             # Get and validate month (1-12)
             month = self.external_event_month_field.get_value()
-            if month < 1 or month > 12:
+            if not 1 <= month <= 12:
                 messagebox.showerror(
                     "Invalid Input",
                     "Month must be between 1 and 12 (forecast periods)."
@@ -495,11 +546,9 @@ class ForecastParamsForm(tk.Frame):
                 'description': description
             }
 
-            # Add to list
+            # Add to list and listbox
             self.external_events_list.append(event)
-
-            # Refresh listbox
-            self._refresh_external_events_listbox()
+            self._append_to_listbox(event)
 
             # Clear form fields
             self.external_event_month_field.set_value("")
@@ -513,7 +562,7 @@ class ForecastParamsForm(tk.Frame):
         """
         Handle delete external event button click.
 
-        Removes selected event from list after confirmation and refreshes display.
+        Removes selected event from list and listbox after confirmation.
         """
         # Get selected index
         selection = self.external_events_listbox.curselection()
@@ -529,116 +578,252 @@ class ForecastParamsForm(tk.Frame):
         if not confirm:
             return
 
-        # Remove from list
+        # Remove from list and listbox
         index = selection[0]
         del self.external_events_list[index]
+        self._remove_from_listbox(index)
 
-        # Refresh listbox
-        self._refresh_external_events_listbox()
+    def _append_to_listbox(self, event: Dict[str, Any]) -> None:
+        """
+        Append one event to the end of the external events listbox.
+
+        Args:
+            event: Event dict just appended to external_events_list
+        """
+        self.external_events_listbox.insert(tk.END, self.format_event(event))
+
+    def _remove_from_listbox(self, index: int) -> None:
+        """
+        Remove one event row from the external events listbox.
+
+        Args:
+            index: Row index (same as the event's index in external_events_list)
+        """
+        self.external_events_listbox.delete(index)
 
     def _refresh_external_events_listbox(self) -> None:
         """
-        Refresh external events listbox with current events list.
+        Refill external events listbox with current events list (initial load only).
 
-        Formats each event as: 'Month X | impact_type | magnitude% | description'
+        Adds and deletes update the listbox row by row instead.
         """
-        # Clear listbox
+        # Format display strings
+        display_strings = [self.format_event(event) for event in self.external_events_list]
+
+        # Clear listbox and add all events in one insert call
         self.external_events_listbox.delete(0, tk.END)
+        if display_strings:
+            self.external_events_listbox.insert(tk.END, *display_strings)
+
+    @staticmethod
+    def format_event(event: Dict[str, Any]) -> str:
+        """
+        Format an external event for the listbox.
 
-        # Add each event
-        for event in self.external_events_list:
-            month = event['month']
-            impact_type = event['impact_type']
-            magnitude = event['magnitude']
-            description = event['description']
+        Args:
+            event: Event dict with month, impact_type, magnitude and description
 
-            # Format display string
-            display_text = f"Month {month} | {impact_type} | {magnitude}% | {description}"
-            self.external_events_listbox.insert(tk.END, display_text)
+        Returns:
+            Display string: 'Month X | impact_type | magnitude% | description'
+        """
+        return _EVENT_DISPLAY_FORMAT.format_map(event)
+
+    @staticmethod
+    def split_comma_list(text: str) -> List[str]:
+        """
+        Split comma-separated entry text into stripped, non-empty items.
+
+        Args:
+            text: Entry text such as '100000, 50000'
+
+        Returns:
+            List of item strings
+        """
+        return [item for item in _CSV_SPLIT.split(text.strip()) if item]
 
     def on_save_clicked(self) -> None:
         """
         Handle save button click - collect field values and save to collection.
 
-        Collects values from all sections, updates scenario in collection,
-        and saves collection to config file.
+        Collects values from all sections on the Tk thread, then reloads the
+        collection, updates the scenario and saves it on the worker thread;
+        poll_save reports the outcome.
         """
+        # A save is already running; its result will be reported
+        if self._save_future is not None:
+            return
+
         try:
-            # Reload collection to prevent overwriting concurrent changes
+            # Sections of tabs never shown still hold their loaded values
+            self.build_pending_sections()
+            parameters = self.collect_parameters()
             config_mgr = self.parent.get_config_manager()
-            self.scenarios_collection = config_mgr.load_config(
-                self.CONFIG_FILEPATH,
-                model_class=ForecastScenariosCollection
+            self._save_future = self._save_executor.submit(
+                self.save_parameters, config_mgr, parameters
             )
+        except Exception as e:
+            self.show_save_error(e)
+            return
 
-            # Get current scenario from reloaded collection
-            scenario = self.scenarios_collection.get_scenario(self.scenario_id)
+        self.status_label.config(text="Saving...", fg='#666')
+        self._save_poll_after = self.after(self.SAVE_POLL_MS, self.poll_save)
 
-            # Collect revenue section values
-            revenue_params = {
-                'monthly_rate': self.fields['monthly_rate'].get_value(),
-                'use_averaged': bool(self.fields['use_averaged'].get())
-            }
+    def collect_parameters(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect parameter values from all section fields (runs on the Tk thread).
 
-            # Collect expense section values
-            expense_params = {
-                'cogs_trend': self.fields['cogs_trend'].get_value(),
-                'opex_trend': self.fields['opex_trend'].get_value()
-            }
+        Returns:
+            Scenario parameter dicts keyed by category name
 
-            # Collect cash flow section values
-            cash_flow_params = {
-                'collection_period_days': int(self.fields['collection_period_days'].get_value()),
-                'payment_terms_days': int(self.fields['payment_terms_days'].get_value())
-            }
+        Raises:
+            ValueError: If a numeric field holds an invalid value
+        """
+        # Collect revenue section values
+        revenue_params = {
+            'monthly_rate': self.fields['monthly_rate'].get_value(),
+            'use_averaged': bool(self.fields['use_averaged'].get())
+        }
+
+        # Collect expense section values
+        expense_params = {
+            'cogs_trend': self.fields['cogs_trend'].get_value(),
+            'opex_trend': self.fields['opex_trend'].get_value()
+        }
+
+        # Collect cash flow section values
+        cash_flow_params = {
+            'collection_period_days': int(self.fields['collection_period_days'].get_value()),
+            'payment_terms_days': int(self.fields['payment_terms_days'].get_value())
+        }
+
+        # Collect major events section values
+        capex_text = self.fields['planned_capex'].get_value()
+        debt_text = self.fields['debt_payments'].get_value()
+
+        # Parse comma-separated values (simple parsing for now)
+        planned_capex = self.split_comma_list(capex_text)
+        debt_payments = self.split_comma_list(debt_text)
+
+        major_events_params = {
+            'planned_capex': planned_capex,
+            'debt_payments': debt_payments
+        }
+
+        # Collect external events section values (copied; the worker saves it)
+        external_events_params = {
+            'events': list(self.external_events_list)
+        }
+
+        return {
+            'revenue_growth_rates': revenue_params,
+            'expense_trend_adjustments': expense_params,
+            'cash_flow_timing_params': cash_flow_params,
+            'major_cash_events': major_events_params,
+            'external_events': external_events_params,
+        }
+
+    def save_parameters(
+        self,
+        config_mgr,
+        parameters: Dict[str, Dict[str, Any]]
+    ) -> ForecastScenariosCollection:
+        """
+        Store parameters on the scenario and save the collection (runs on the worker thread).
+
+        Must not touch Tk widgets.
 
-            # Collect major events section values
-            capex_text = self.fields['planned_capex'].get_value()
-            debt_text = self.fields['debt_payments'].get_value()
+        Args:
+            config_mgr: ConfigManager to load and save the collection with
+            parameters: Parameter dicts from collect_parameters
+
+        Returns:
+            Saved scenarios collection
+        """
+        # Reload collection to prevent overwriting concurrent changes
+        collection = config_mgr.load_config(
+            self.CONFIG_FILEPATH,
+            model_class=ForecastScenariosCollection
+        )
 
-            # Parse comma-separated values (simple parsing for now)
-            planned_capex = [item.strip() for item in capex_text.split(',') if item.strip()]
-            debt_payments = [item.strip() for item in debt_text.split(',') if item.strip()]
+        # Update current scenario in reloaded collection
+        scenario = collection.get_scenario(self.scenario_id)
+        for name, value in parameters.items():
+            scenario.set_parameter(name, value)
 
-            major_events_params = {
-                'planned_capex': planned_capex,
-                'debt_payments': debt_payments
-            }
+        # Save collection to file
+        config_mgr.save_config(collection, self.CONFIG_FILEPATH)
+        return collection
 
-            # Collect external events section values
-            external_events_params = {
-                'events': self.external_events_list
-            }
+    def poll_save(self) -> None:
+        """
+        Report the background save once it finishes (runs on the Tk thread).
+        """
+        # Called directly by on_back_clicked while a poll may still be scheduled
+        if self._save_poll_after is not None:
+            self.after_cancel(self._save_poll_after)
+            self._save_poll_after = None
 
-            # Update scenario parameters
-            scenario.set_parameter('revenue_growth_rates', revenue_params)
-            scenario.set_parameter('expense_trend_adjustments', expense_params)
-            scenario.set_parameter('cash_flow_timing_params', cash_flow_params)
-            scenario.set_parameter('major_cash_events', major_events_params)
-            scenario.set_parameter('external_events', external_events_params)
+        future = self._save_future
+        if future is None:
+            return
 
-            # Save collection to file
-            config_mgr.save_config(self.scenarios_collection, self.CONFIG_FILEPATH)
+        if not future.done():
+            self._save_poll_after = self.after(self.SAVE_POLL_MS, self.poll_save)
+            return
 
-            # Display success message
-            self.status_label.config(text="Parameters saved successfully", fg='#4CAF50')
-            messagebox.showinfo("Success", "Forecast parameters saved successfully")
+        self._save_future = None
 
-        except ValueError as e:
+        try:
+            self.scenarios_collection = future.result()
+        except Exception as e:
+            self.show_save_error(e)
+            return
+
+        # Display success message
+        self.status_label.config(text="Parameters saved successfully", fg='#4CAF50')
+        messagebox.showinfo("Success", "Forecast parameters saved successfully")
+
+    def show_save_error(self, error: Exception) -> None:
+        """
+        Report a failed save.
+
+        Args:
+            error: Exception raised while collecting or saving parameters
+        """
+        if isinstance(error, ValueError):
             # Validation error from NumericEntry.get_value
             self.status_label.config(text="Validation error", fg='#F44336')
-            messagebox.showerror("Invalid Input", str(e))
-
-        except Exception as e:
+            messagebox.showerror("Invalid Input", str(error))
+        else:
             # File I/O or other errors
             self.status_label.config(text="Save failed", fg='#F44336')
-            messagebox.showerror("Error", f"Failed to save parameters: {str(e)}")
+            messagebox.showerror("Error", f"Failed to save parameters: {str(error)}")
+
+    def on_destroy(self, event) -> None:
+        """
+        Stop the save executor and cancel a pending save poll when the form is destroyed.
+
+        A save already running still finishes writing the file.
+
+        Args:
+            event: Tk <Destroy> event
+        """
+        if event.widget is self:
+            if self._save_poll_after is not None:
+                self.after_cancel(self._save_poll_after)
+                self._save_poll_after = None
+            self._save_executor.shutdown(wait=False)
 
     def on_back_clicked(self) -> None:
         """
         Handle back button click - navigate to scenario list form.
 
-        Returns to ScenarioListForm without saving changes.
+        Returns to ScenarioListForm without saving changes. A save still running
+        is waited for (and its outcome reported) first, so the scenario list never
+        loads the collection while the worker is between its reload and write.
         """
-        from .scenario_list_form import ScenarioListForm
-        self.parent.show_form(ScenarioListForm)
+        if self._save_future is not None:
+            wait([self._save_future])
+            self.poll_save()
+
+        self.parent.show_form(_get_scenario_list_form())
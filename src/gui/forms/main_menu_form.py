@@ -9,11 +9,15 @@ Provides central navigation hub to access all parameter configuration tools:
 import tkinter as tk
 from tkinter import messagebox
 
+from ..components.fonts import get_font
 from ...services.pipeline_orchestrator import PipelineOrchestrator
 from ...loaders.exceptions import FileLoaderError
 from ...metrics.exceptions import CalculationError
 from ...utils.error_mapper import ErrorMapper
 
+# Widget options shared by the navigation buttons
+_NAV_BUTTON_OPTIONS = {'width': 30, 'bg': '#4CAF50', 'fg': 'black'}
+
 
 class MainMenuForm(tk.Frame):
     """
@@ -40,7 +44,7 @@ class MainMenuForm(tk.Frame):
         title = tk.Label(
             self,
             text="QB-Assistant Parameter Configuration",
-            font=('Arial', 16, 'bold')
+            font=get_font(self, 16, 'bold')
         )
         title.grid(row=0, column=0, pady=20)
 
@@ -48,92 +52,37 @@ class MainMenuForm(tk.Frame):
         subtitle = tk.Label(
             self,
             text="Select a parameter configuration tool to begin",
-            font=('Arial', 12),
+            font=get_font(self, 12),
             fg='#666'
         )
         subtitle.grid(row=1, column=0, pady=(0, 20))
 
-        # Create client context section
-        self._create_client_context()
-
-        # Create forecast settings section
-        self._create_forecast_settings()
+        # Client context and forecast settings are built once the menu is idle,
+        # so the title and navigation buttons are laid out first
+        self._sections_after = self.after_idle(self._create_deferred_sections)
+        self.bind('<Destroy>', self.on_destroy)
 
         # Create navigation buttons container
         nav_frame = tk.Frame(self)
         nav_frame.grid(row=4, column=0, pady=20)
 
-        # Sample Parameters button
-        sample_btn = tk.Button(
-            nav_frame,
-            text="Sample Parameters",
-            command=self.on_sample_params_clicked,
-            width=30,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        sample_btn.pack(pady=10)
-
-        # Budget Parameters button
-        budget_btn = tk.Button(
-            nav_frame,
-            text="Budget Parameters",
-            command=self.on_budget_params_clicked,
-            width=30,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        budget_btn.pack(pady=10)
-
-        # Forecast Scenarios button
-        scenarios_btn = tk.Button(
-            nav_frame,
-            text="Forecast Scenarios",
-            command=self.on_forecast_scenarios_clicked,
-            width=30,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        scenarios_btn.pack(pady=10)
-
-        # Historical Data Anomaly Review button
-        anomaly_btn = tk.Button(
-            nav_frame,
-            text="Historical Data Anomaly Review",
-            command=self.on_anomaly_review_clicked,
-            width=30,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        anomaly_btn.pack(pady=10)
-
-        # Select Input Files button
-        file_selection_btn = tk.Button(
-            nav_frame,
-            text="Select Input Files",
-            command=self._on_file_selection,
-            width=30,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        file_selection_btn.pack(pady=10)
-
-        # Process Data button
-        process_data_btn = tk.Button(
-            nav_frame,
-            text="Process Data",
-            command=self._on_process_data,
-            width=30,
-            bg='#4CAF50',
-            fg='black',
-            font=('Arial', 10, 'bold')
-        )
-        process_data_btn.pack(pady=10)
+        # Navigation buttons: (text, command), all sharing one style and font
+        button_font = get_font(self, 10, 'bold')
+        for text, command in (
+            ("Sample Parameters", self.on_sample_params_clicked),
+            ("Budget Parameters", self.on_budget_params_clicked),
+            ("Forecast Scenarios", self.on_forecast_scenarios_clicked),
+            ("Historical Data Anomaly Review", self.on_anomaly_review_clicked),
+            ("Select Input Files", self._on_file_selection),
+            ("Process Data", self._on_process_data),
+        ):
+            tk.Button(
+                nav_frame,
+                text=text,
+                command=command,
+                font=button_font,
+                **_NAV_BUTTON_OPTIONS
+            ).pack(pady=10)
 
         # Status message label
         self.status_label = tk.Label(
@@ -144,6 +93,25 @@ class MainMenuForm(tk.Frame):
         )
         self.status_label.grid(row=5, column=0, pady=10)
 
+    def _create_deferred_sections(self) -> None:
+        """
+        Create the client context and forecast settings sections (grid rows 2 and 3).
+        """
+        self._sections_after = None
+        self._create_client_context()
+        self._create_forecast_settings()
+
+    def on_destroy(self, event) -> None:
+        """
+        Cancel deferred section creation if the menu is closed before it runs.
+
+        Args:
+            event: Tk <Destroy> event
+        """
+        if event.widget is self and self._sections_after is not None:
+            self.after_cancel(self._sections_after)
+            self._sections_after = None
+
     def _create_client_context(self) -> None:
         """
         Create client context section showing current client and change button.
@@ -60,14 +60,55 @@ class AnomalyAnnotationModel(ParameterModel):
 
         self._parameters['annotations'].append(annotation_dict)
 
+    def remove_annotation(self, annotation_dict: Dict[str, Any]) -> bool:
+        """
+        Remove the first annotation equal to annotation_dict.
+
+        Args:
+            annotation_dict: Annotation to remove (matched by value, not position)
+
+        Returns:
+            True if an annotation was removed, False if none matched
+        """
+        annotations = self.get_annotations()
+        for idx, annotation in enumerate(annotations):
+            if annotation == annotation_dict:
+                del annotations[idx]
+                return True
+        return False
+
+    def apply_log_record(self, record: Dict[str, Any]) -> None:
+        """
+        Apply one annotation log record: an annotation to add, or {'__delete__': annotation}.
+
+        Args:
+            record: Log record as written by ConfigManager.append_anomaly_annotation_records
+        """
+        if '__delete__' in record:
+            self.remove_annotation(record['__delete__'])
+        else:
+            self.add_annotation(record)
+
+    @property
+    def annotations(self) -> List[Dict[str, Any]]:
+        """
+        Get the stored annotation list itself (not a copy).
+
+        Returns:
+            List of annotation dicts (empty list if no annotations)
+        """
+        return self._parameters.setdefault('annotations', [])
+
     def get_annotations(self) -> List[Dict[str, Any]]:
         """
         Get all anomaly annotations.
 
+        Alias of the annotations property; returns the stored list without copying.
+
         Returns:
             List of annotation dicts (empty list if no annotations)
         """
-        return self._parameters.get('annotations', [])
+        return self.annotations
 
     def get_annotations_by_exclusion_type(self, exclusion_type: str) -> List[Dict[str, Any]]:
         """
@@ -42,6 +42,8 @@ class CashFlowModel(DataModel):
         self._hierarchy = hierarchy
         self._calculated_rows = calculated_rows
         self._metadata = metadata or {}
+        self._name_index = None  # Built on first get_row_by_name_substring call
+        self._substring_lookups = {}
 
     @property
     def hierarchy(self) -> Dict[str, List]:
@@ -100,6 +102,43 @@ class CashFlowModel(DataModel):
         """
         return self._hierarchy.get('FINANCING ACTIVITIES', [])
 
+    def get_row_by_name_substring(self, substring: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the first activity row or calculated row whose account name contains substring (case-insensitive).
+
+        The lowercase name index is built on first call and lookups are memoized,
+        so repeated lookups (e.g. on every anomaly form open) are O(1). The model
+        is treated as read-only after construction.
+
+        Args:
+            substring: Text to find in the account name (e.g., 'net cash provided by operating activities')
+
+        Returns:
+            Row dict, or None if not found
+        """
+        if self._name_index is None:
+            self._name_index = {}
+            for row in (
+                self.get_operating() + self.get_investing() + self.get_financing()
+                + self._calculated_rows
+            ):
+                # Hierarchy items are keyed by 'name', calculated rows by 'account_name'
+                name = row.get('account_name', row.get('name')) if isinstance(row, dict) else None
+                if isinstance(name, str):
+                    self._name_index.setdefault(name.lower(), row)
+            self._substring_lookups = {}
+
+        key = substring.lower()
+        if key not in self._substring_lookups:
+            row = self._name_index.get(key)
+            if row is None:
+                row = next(
+                    (row for name, row in self._name_index.items() if key in name),
+                    None
+                )
+            self._substring_lookups[key] = row
+        return self._substring_lookups[key]
+
     def get_periods(self) -> List[str]:
         """
         Get list of all period labels available in the dataset.
@@ -40,6 +40,8 @@ class PLModel(DataModel):
         super().__init__(df)
         self._hierarchy = hierarchy
         self._calculated_rows = calculated_rows
+        self._name_index = None  # Built on first get_row_by_name_substring call
+        self._substring_lookups = {}
 
     @property
     def hierarchy(self) -> Dict[str, Any]:
@@ -173,6 +175,38 @@ class PLModel(DataModel):
                 return row
         return None
 
+    def get_row_by_name_substring(self, substring: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the first calculated row whose account name contains substring (case-insensitive).
+
+        The lowercase name index is built on first call and lookups are memoized,
+        so repeated lookups (e.g. on every anomaly form open) are O(1). The model
+        is treated as read-only after construction.
+
+        Args:
+            substring: Text to find in the account name (e.g., 'net income')
+
+        Returns:
+            Row dict with 'account_name' and 'values', or None if not found
+        """
+        if self._name_index is None:
+            self._name_index = {}
+            for row in self._calculated_rows:
+                if isinstance(row, dict) and 'account_name' in row:
+                    self._name_index.setdefault(row['account_name'].lower(), row)
+            self._substring_lookups = {}
+
+        key = substring.lower()
+        if key not in self._substring_lookups:
+            row = self._name_index.get(key)
+            if row is None:
+                row = next(
+                    (row for name, row in self._name_index.items() if key in name),
+                    None
+                )
+            self._substring_lookups[key] = row
+        return self._substring_lookups[key]
+
     def get_account_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Search hierarchy tree for account by name.
@@ -3,18 +3,57 @@ Configuration manager for JSON-based parameter persistence.
 
 Handles save/load operations with comprehensive error handling and path validation
 to prevent directory traversal attacks.
+
+JSON is parsed with orjson when it is installed (optional dependency), falling back
+to the stdlib json module otherwise.
 """
 import json
+import logging
 import os
+import stat
+import tempfile
 from json.decoder import JSONDecodeError
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 # SECURITY: Import safe YAML functions only (never yaml.load)
 from yaml import safe_load, safe_dump
 
+try:
+    import orjson
+except ImportError:  # Optional dependency: fall back to stdlib json
+    orjson = None
+
+from ..models.anomaly_annotation import AnomalyAnnotationModel
 from ..models.parameters import ParameterModel
 
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(raw: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when available.
+
+    orjson rejects the NaN/Infinity literals that json.dump writes for non-finite
+    floats, so on an orjson error the stdlib parser gets the final say (and raises
+    the JSONDecodeError for genuinely invalid input).
+
+    Args:
+        raw: UTF-8 encoded JSON document
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        JSONDecodeError: If raw is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
 class ConfigManager:
     """
@@ -24,6 +63,11 @@ class ConfigManager:
     invalid JSON, and permission errors gracefully.
     """
 
+    ANOMALY_ANNOTATIONS_FILEPATH = 'config/anomaly_annotations.json'
+    # Append-only log of annotation adds/deletes since ANOMALY_ANNOTATIONS_FILEPATH was last written
+    ANOMALY_ANNOTATION_LOG_FILEPATH = 'config/anomaly_annotations.jsonl'
+    ANOMALY_ANNOTATION_LOG_COMPACT_THRESHOLD = 100
+
     def __init__(self, project_root: str):
         """
         Initialize config manager with project root directory.
@@ -115,25 +159,57 @@ class ConfigManager:
         # Determine format by file extension
         suffix = validated_path.suffix.lower()
 
-        # Write config with context manager for automatic cleanup
+        # Serialize to a string first: the indented encoder emits many small
+        # chunks, and a serialization error must not truncate the existing file
+        if suffix in ['.yaml', '.yml']:
+            # SECURITY: Use safe_dump to prevent code execution
+            # default_flow_style=False for readable nested structure
+            text = safe_dump(data, default_flow_style=False)
+        else:
+            # Default to JSON (backward compatibility)
+            text = json.dumps(data, indent=2)
+
+        # Keep the existing file's permissions (mkstemp creates files as 0600)
         try:
-            with open(validated_path, 'w') as f:
-                if suffix in ['.yaml', '.yml']:
-                    # SECURITY: Use safe_dump to prevent code execution
-                    # default_flow_style=False for readable nested structure
-                    safe_dump(data, f, default_flow_style=False)
-                else:
-                    # Default to JSON (backward compatibility)
-                    json.dump(data, f, indent=2)
+            mode = stat.S_IMODE(os.stat(validated_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+
+        # Write to a uniquely named temp file beside the config (concurrent saves
+        # from worker and Tk threads never share one), flush it to disk, then swap
+        # it in atomically so a failed, interrupted or power-lost write never
+        # leaves a truncated config behind
+        tmp_path = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(
+                dir=validated_path.parent, prefix=validated_path.name + '.', suffix='.tmp'
+            )
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, validated_path)
         except PermissionError:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             raise PermissionError(
                 f"Cannot write to {filepath}: permission denied"
             )
+        except OSError:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            raise
 
     def load_config(self, filepath: str, model_class=None, allow_external_path: bool = False) -> ParameterModel:
         """
         Load ParameterModel (or subclass) from JSON or YAML configuration file.
 
+        Each call reads and parses the file and returns a new model, so callers
+        may mutate the result freely. Nothing is cached: config files are small,
+        and re-reading one costs about as much as checking a cache entry.
+
         Format determined by file extension:
         - .json: JSON format
         - .yaml/.yml: YAML format
@@ -171,14 +247,14 @@ class ConfigManager:
 
         # Read and parse config with context manager
         try:
-            with open(validated_path, 'r') as f:
+            with open(validated_path, 'rb') as f:
                 if suffix in ['.yaml', '.yml']:
                     # SECURITY: Use safe_load to prevent code execution
                     # Do NOT use yaml.load() - it can execute arbitrary Python code
                     data = safe_load(f)
                 else:
                     # Default to JSON (backward compatibility)
-                    data = json.load(f)
+                    data = _json_loads(f.read())
 
             # Handle empty YAML files
             if data is None:
@@ -203,3 +279,188 @@ class ConfigManager:
             raise Exception(
                 f"Failed to load config from {filepath} using {model_class.__name__}: {str(e)}"
             ) from e
+
+    def config_exists(self, filepath: str, allow_external_path: bool = False) -> bool:
+        """
+        Check whether a configuration file exists, without creating it.
+
+        Unlike load_config, a missing file is not replaced with a saved default.
+
+        Args:
+            filepath: Path to config file (relative to config directory or absolute within config)
+            allow_external_path: If True, validates against project directory instead of config/
+
+        Returns:
+            True if the file exists
+
+        Raises:
+            ValueError: If filepath is invalid or outside allowed boundary
+        """
+        return self._validate_filepath(filepath, allow_external_path).is_file()
+
+    def append_records(
+        self,
+        records: List[Dict[str, Any]],
+        filepath: str,
+        truncate: bool = False,
+        header: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Append records to a JSON Lines log file, one JSON object per line.
+
+        Appending costs O(records written) regardless of how large the log already
+        is, unlike save_config which rewrites the whole file. If the log ends in a
+        partial line (an interrupted append), it is terminated first so the new
+        records start on their own lines.
+
+        Args:
+            records: JSON-serializable dicts to append
+            filepath: Path to .jsonl file (relative to config directory or absolute within config)
+            truncate: If True, empty the log before writing (e.g. after compaction)
+            header: Optional record written first when the log is new, empty or truncated
+
+        Raises:
+            ValueError: If filepath is invalid or outside config directory
+            PermissionError: If insufficient permissions to write file
+        """
+        validated_path = self._validate_filepath(filepath)
+        validated_path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = ''.join(json.dumps(record) + '\n' for record in records).encode('utf-8')
+        header_line = b'' if header is None else (json.dumps(header) + '\n').encode('utf-8')
+
+        try:
+            with open(validated_path, 'wb' if truncate else 'ab+') as f:
+                # Appends always go to the end; only the last byte is read back
+                if not truncate and f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        data = b'\n' + data
+                else:
+                    data = header_line + data
+                f.write(data)
+        except PermissionError:
+            raise PermissionError(
+                f"Cannot write to {filepath}: permission denied"
+            )
+
+    def load_records(self, filepath: str) -> List[Dict[str, Any]]:
+        """
+        Load all records from a JSON Lines log file.
+
+        A missing file is an empty log. Lines that are not valid JSON (e.g. left
+        by an interrupted append) are skipped with a warning, so one torn record
+        does not hide the rest of the log.
+
+        Args:
+            filepath: Path to .jsonl file (relative to config directory or absolute within config)
+
+        Returns:
+            List of record dicts in the order they were appended
+
+        Raises:
+            ValueError: If filepath is invalid or outside config directory
+            PermissionError: If insufficient permissions to read file
+        """
+        validated_path = self._validate_filepath(filepath)
+        if not validated_path.exists():
+            return []
+
+        try:
+            with open(validated_path, 'rb') as f:
+                lines = [line for line in f if line.strip()]
+        except PermissionError:
+            raise PermissionError(
+                f"Cannot read {filepath}: permission denied"
+            )
+
+        records = []
+        for lineno, line in enumerate(lines, start=1):
+            try:
+                records.append(_json_loads(line))
+            except JSONDecodeError as e:
+                logger.warning(
+                    "Skipping invalid JSON in %s at line %d, column %d: %s",
+                    filepath, lineno, e.colno, e.msg
+                )
+        return records
+
+    def load_anomaly_annotations(self) -> AnomalyAnnotationModel:
+        """
+        Load saved anomaly annotations with every logged add/delete folded in.
+
+        Annotation saves append to ANOMALY_ANNOTATION_LOG_FILEPATH instead of
+        rewriting ANOMALY_ANNOTATIONS_FILEPATH. Once the log grows past
+        ANOMALY_ANNOTATION_LOG_COMPACT_THRESHOLD records, the folded model is written
+        back to ANOMALY_ANNOTATIONS_FILEPATH and the log is emptied. Missing files
+        load as an empty model and are not created.
+
+        Each compaction bumps the model's log_generation and restarts the log with a
+        {'__generation__': n} header (a log without one predates the first
+        compaction). A log whose generation differs from the model's was already
+        folded in by a compaction that crashed before truncating it, so it is
+        skipped; every other record is replayed as logged, duplicates included.
+
+        Returns:
+            AnomalyAnnotationModel with all logged changes applied
+
+        Raises:
+            ValueError: If a config path is invalid
+            PermissionError: If insufficient permissions to read or write a file
+            Exception: If the annotations file cannot be parsed
+        """
+        model = AnomalyAnnotationModel()
+        if self.config_exists(self.ANOMALY_ANNOTATIONS_FILEPATH):
+            model = self.load_config(self.ANOMALY_ANNOTATIONS_FILEPATH, AnomalyAnnotationModel)
+
+        records = self.load_records(self.ANOMALY_ANNOTATION_LOG_FILEPATH)
+        generation = model.parameters.get('log_generation', 0)
+        log_generation = 0
+        if records and '__generation__' in records[0]:
+            log_generation = records.pop(0)['__generation__']
+
+        if log_generation != generation:
+            # Finish the interrupted compaction
+            self.append_records(
+                [], self.ANOMALY_ANNOTATION_LOG_FILEPATH, truncate=True,
+                header={'__generation__': generation}
+            )
+            return model
+
+        for record in records:
+            model.apply_log_record(record)
+
+        if len(records) > self.ANOMALY_ANNOTATION_LOG_COMPACT_THRESHOLD:
+            model.set_parameter('log_generation', generation + 1)
+            self.save_config(model, self.ANOMALY_ANNOTATIONS_FILEPATH)
+            self.append_records(
+                [], self.ANOMALY_ANNOTATION_LOG_FILEPATH, truncate=True,
+                header={'__generation__': generation + 1}
+            )
+        return model
+
+    def append_anomaly_annotation_records(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Append annotation adds ({...}) or deletes ({'__delete__': {...}}) to the log.
+
+        Costs O(records written). Only a new or empty log reads
+        ANOMALY_ANNOTATIONS_FILEPATH, to start the log with its generation header.
+
+        Args:
+            records: Annotation log records, folded in by load_anomaly_annotations
+
+        Raises:
+            ValueError: If a config path is invalid
+            PermissionError: If insufficient permissions to write file
+        """
+        log_path = self._validate_filepath(self.ANOMALY_ANNOTATION_LOG_FILEPATH)
+        header = None
+        if not log_path.is_file() or log_path.stat().st_size == 0:
+            generation = 0
+            if self.config_exists(self.ANOMALY_ANNOTATIONS_FILEPATH):
+                generation = self.load_config(
+                    self.ANOMALY_ANNOTATIONS_FILEPATH, AnomalyAnnotationModel
+                ).parameters.get('log_generation', 0)
+            header = {'__generation__': generation}
+
+        self.append_records(records, self.ANOMALY_ANNOTATION_LOG_FILEPATH, header=header)
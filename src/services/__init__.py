@@ -3,7 +3,13 @@ Services for business logic and defaults calculation.
 
 Services provide separation between GUI presentation layer and business logic,
 enabling independent testing and reusability.
+
+TimeSeriesVisualizer is exported lazily (PEP 562) because it imports matplotlib;
+importing this package does not load matplotlib until the visualizer is used.
 """
+import importlib
+from typing import TYPE_CHECKING
+
 from .budget_defaults import BudgetDefaultsService
 from .budget_calculator import BudgetCalculator
 from .budget_variance_calculator import BudgetVarianceCalculator
@@ -12,9 +18,16 @@ from .cash_flow_forecast_calculator import CashFlowForecastCalculator
 from .pl_forecast_calculator import PLForecastCalculator
 from .ytd_aggregator import YTDAggregator
 from .anomaly_detector import AnomalyDetector
-from .time_series_visualizer import TimeSeriesVisualizer
 from .scenario_forecast_orchestrator import ScenarioForecastOrchestrator
 
+if TYPE_CHECKING:
+    from .time_series_visualizer import TimeSeriesVisualizer
+
+# Lazily exported service class -> submodule that defines it
+_LAZY = {
+    'TimeSeriesVisualizer': '.time_series_visualizer',
+}
+
 __all__ = [
     'AnomalyDetector',
     'BudgetCalculator',
@@ -27,3 +40,24 @@ __all__ = [
     'TimeSeriesVisualizer',
     'YTDAggregator',
 ]
+
+
+def __getattr__(name):
+    """
+    Import the submodule defining a lazily exported service on first access.
+
+    Args:
+        name: Attribute being looked up on the package
+
+    Returns:
+        Service class named by ``name``
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily exported service
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -3,9 +3,95 @@ Statistical anomaly detection service using 2-sigma threshold.
 
 Implements conservative anomaly detection to minimize false positives,
 flagging values that deviate >2σ from the historical mean.
+
+The n-sigma kernel is compiled with Numba when it is installed (optional
+dependency); otherwise an equivalent vectorized NumPy implementation is used.
+Numba is imported lazily on first detection so it does not slow app startup.
 """
-import math
-from typing import List, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def _nsigma_loops(x: np.ndarray, k: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find values more than k sample standard deviations from the mean (loop kernel).
+
+    Written as explicit loops so Numba can compile it: one Welford pass for the
+    mean and variance, then one pass that fills preallocated result arrays.
+
+    Args:
+        x: 1-D float64 array with at least 2 values
+        k: Sigma multiplier threshold
+
+    Returns:
+        Tuple of (indices, deviation magnitudes in sigmas); empty if σ is 0
+    """
+    n = x.size
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        delta = x[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x[i] - mean)
+
+    indices = np.empty(n, dtype=np.int64)
+    magnitudes = np.empty(n, dtype=np.float64)
+    std_dev = np.sqrt(m2 / (n - 1))
+    if std_dev == 0.0:
+        return indices[:0], magnitudes[:0]
+
+    count = 0
+    for i in range(n):
+        deviation = abs(x[i] - mean)
+        if deviation > k * std_dev:
+            indices[count] = i
+            magnitudes[count] = deviation / std_dev
+            count += 1
+
+    return indices[:count], magnitudes[:count]
+
+
+def _nsigma_numpy(x: np.ndarray, k: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find values more than k sample standard deviations from the mean (NumPy kernel).
+
+    Args:
+        x: 1-D float64 array with at least 2 values
+        k: Sigma multiplier threshold
+
+    Returns:
+        Tuple of (indices, deviation magnitudes in sigmas); empty if σ is 0
+    """
+    std_dev = x.std(ddof=1)
+    if std_dev == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    deviations = np.abs(x - x.mean())
+    indices = np.flatnonzero(deviations > k * std_dev)
+    return indices, deviations[indices] / std_dev
+
+
+_nsigma: Optional[Callable[[np.ndarray, float], Tuple[np.ndarray, np.ndarray]]] = None
+
+
+def _get_nsigma_kernel() -> Callable[[np.ndarray, float], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Resolve the n-sigma kernel on first use.
+
+    Returns:
+        Numba-compiled loop kernel (cached on disk) if numba is installed,
+        otherwise the NumPy kernel
+    """
+    global _nsigma
+    if _nsigma is None:
+        try:
+            from numba import njit
+        except ImportError:  # Optional dependency: fall back to the NumPy kernel
+            _nsigma = _nsigma_numpy
+        else:
+            _nsigma = njit(cache=True)(_nsigma_loops)
+    return _nsigma
 
 
 class AnomalyDetector:
@@ -15,13 +101,25 @@ class AnomalyDetector:
     Uses 2-sigma threshold: flags values where |value - μ| > 2σ
     """
 
+    SIGMA_THRESHOLD = 2.0
+
+    @staticmethod
+    def warm_up() -> None:
+        """
+        Resolve and run the n-sigma kernel once on a tiny array.
+
+        With Numba installed this pays the JIT compile (or on-disk cache load)
+        up front, so the first real detect_anomalies call does not.
+        """
+        _get_nsigma_kernel()(np.zeros(3, dtype=np.float64), AnomalyDetector.SIGMA_THRESHOLD)
+
     @staticmethod
-    def detect_anomalies(values: List[float]) -> List[Tuple[int, float, float]]:
+    def detect_anomalies(values: Union[Sequence[float], np.ndarray]) -> List[Tuple[int, float, float]]:
         """
         Detect anomalies in time-series data using 2-sigma threshold.
 
         Args:
-            values: List of numeric values (time-series data)
+            values: Numeric values (time-series data) as a list or 1-D ndarray
 
         Returns:
             List of tuples: [(period_index, value, deviation_magnitude), ...]
@@ -32,29 +130,15 @@ class AnomalyDetector:
             - Standard deviation is 0 (all values identical)
             - No values exceed 2σ threshold
         """
-        # Edge case: insufficient data for standard deviation
-        if len(values) < 3:
-            return []
-
-        # Calculate mean: μ = sum(values) / n
-        n = len(values)
-        mean = sum(values) / n
+        arr = np.ascontiguousarray(values, dtype=np.float64)
 
-        # Calculate sample standard deviation: σ = sqrt(sum((value - μ)²) / (n - 1))
-        variance = sum((value - mean) ** 2 for value in values) / (n - 1)
-        std_dev = math.sqrt(variance)
-
-        # Edge case: zero standard deviation (all values identical)
-        if std_dev == 0:
+        # Edge case: insufficient data for standard deviation
+        if arr.size < 3:
             return []
 
-        # Detect anomalies: flag values where |value - μ| > 2σ
-        anomalies = []
-        for idx, value in enumerate(values):
-            deviation = abs(value - mean)
-            if deviation > 2 * std_dev:
-                # Calculate deviation magnitude (how many sigmas away)
-                deviation_magnitude = deviation / std_dev
-                anomalies.append((idx, value, deviation_magnitude))
+        indices, magnitudes = _get_nsigma_kernel()(arr, AnomalyDetector.SIGMA_THRESHOLD)
 
-        return anomalies
+        return [
+            (int(idx), float(arr[idx]), float(magnitude))
+            for idx, magnitude in zip(indices, magnitudes)
+        ]
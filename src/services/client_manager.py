@@ -4,10 +4,14 @@ Client manager service for client folder discovery, creation, deletion, and vali
 Handles client folder structure (clients/[name]/) with security-first design to
 prevent path traversal attacks and ensure safe filesystem operations.
 """
+import os
 import re
 import shutil
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Tuple
+
+# Strict whitelist for client names: alphanumeric, hyphens, underscores only
+_CLIENT_NAME_RE = re.compile(r'[a-zA-Z0-9_-]+')
 
 
 class ClientManager:
@@ -18,6 +22,9 @@ class ClientManager:
     validation with strict security controls to prevent directory traversal.
     """
 
+    # clients/ directory -> (st_mtime_ns, sorted client names) from the last scan
+    _discover_cache: Dict[Path, Tuple[int, List[str]]] = {}
+
     @staticmethod
     def validate_client_name(name: str) -> str:
         """
@@ -47,7 +54,7 @@ class ClientManager:
             raise ValueError("Client name too long (max 100 characters)")
 
         # Strict whitelist: alphanumeric, hyphens, underscores only
-        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+        if not _CLIENT_NAME_RE.fullmatch(name):
             raise ValueError(
                 f"Client name contains invalid characters. "
                 f"Only letters, numbers, hyphens, and underscores allowed."
@@ -59,11 +66,40 @@ class ClientManager:
 
         return name
 
+    @staticmethod
+    def iter_client_names(project_root: Path) -> Iterator[str]:
+        """
+        Yield client folder names in directory order as clients/ is scanned.
+
+        DirEntry.is_dir() uses the file type from the directory listing instead of
+        a stat per entry. Not cached; use discover_clients for the sorted list.
+
+        Args:
+            project_root: Project root path
+
+        Yields:
+            Client folder names (nothing if clients/ doesn't exist)
+        """
+        try:
+            entries = os.scandir(project_root / "clients")
+        except FileNotFoundError:
+            return
+
+        # Scan for directories only (ignore files)
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield entry.name
+
     @staticmethod
     def discover_clients(project_root: Path) -> List[str]:
         """
         Discover existing client folders by scanning clients/ directory.
 
+        The scan result is cached per clients/ directory and reused while the
+        directory's modification time is unchanged (adding, removing or renaming a
+        client folder updates it). create_client and delete_client also drop it.
+
         Args:
             project_root: Project root path
 
@@ -73,16 +109,19 @@ class ClientManager:
         clients_dir = project_root / "clients"
 
         # Return empty list if clients directory doesn't exist
-        if not clients_dir.exists():
+        try:
+            mtime_ns = os.stat(clients_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        # Scan for directories only (ignore files)
-        client_names = []
-        for item in clients_dir.iterdir():
-            if item.is_dir():
-                client_names.append(item.name)
+        cached = ClientManager._discover_cache.get(clients_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+
+        client_names = sorted(ClientManager.iter_client_names(project_root))
 
-        return sorted(client_names)
+        ClientManager._discover_cache[clients_dir] = (mtime_ns, client_names)
+        return list(client_names)
 
     @staticmethod
     def create_client(name: str, project_root: Path) -> None:
@@ -125,6 +164,7 @@ class ClientManager:
             client_path.mkdir(parents=False, exist_ok=False)
         except FileExistsError:
             raise ValueError(f"Client '{name}' already exists")
+        ClientManager._discover_cache.pop(clients_dir, None)
 
         # Step 6: Create subdirectories and config
         input_path.mkdir(parents=False, exist_ok=False)
@@ -181,3 +221,4 @@ class ClientManager:
 
         # Step 5: Safe to delete
         shutil.rmtree(resolved_path)
+        ClientManager._discover_cache.pop(clients_dir, None)
@@ -269,7 +269,7 @@ class PipelineOrchestrator:
                     pl_model=pl_model,
                     scenarios_collection=scenarios_collection,
                     global_config=global_config,
-                    anomaly_annotations=None  # Optional - could be loaded from config
+                    anomaly_annotations=None  # Optional - see config_manager.load_anomaly_annotations()
                 )
                 print("Forecast orchestrator initialized")
 
@@ -3,9 +3,9 @@ Time-series visualization service using matplotlib.
 
 Generates line charts with anomaly highlighting for historical data review.
 """
-from typing import List, Dict, Any
-import matplotlib.pyplot as plt
+from typing import List, Dict, Any, Optional
 from matplotlib.figure import Figure
+from matplotlib.patches import Patch
 
 
 class TimeSeriesVisualizer:
@@ -13,8 +13,17 @@ class TimeSeriesVisualizer:
     Service for creating time-series charts with anomaly highlighting.
 
     Uses matplotlib to generate static charts suitable for embedding in tkinter.
+    Figures are standalone (not managed by pyplot), so they are freed with their
+    canvas and may be rendered to an Agg buffer from a worker thread.
     """
 
+    # Shading color per annotation exclusion type
+    EXCLUSION_COLORS = {
+        'baseline': '#BBDEFB',      # Light blue
+        'volatility': '#FFF9C4',    # Light yellow
+        'both': '#FFE0B2'           # Light orange
+    }
+
     @staticmethod
     def create_chart(
         period_labels: List[str],
@@ -37,14 +46,16 @@ class TimeSeriesVisualizer:
         if anomaly_indices is None:
             anomaly_indices = []
 
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Create figure and axis (not via pyplot, so the figure is not tracked in
+        # pyplot's global figure list and can be rendered off the Tk thread)
+        fig = Figure(figsize=(10, 6))
+        ax = fig.add_subplot()
 
         # Plot time series as line
         ax.plot(period_labels, values, marker='o', linestyle='-', linewidth=2, markersize=6)
 
         # Overlay anomaly markers with higher zorder
-        if anomaly_indices:
+        if len(anomaly_indices) > 0:
             anomaly_labels = [period_labels[i] for i in anomaly_indices]
             anomaly_values = [values[i] for i in anomaly_indices]
             ax.scatter(
@@ -66,7 +77,8 @@ class TimeSeriesVisualizer:
         # Rotate x-axis labels if more than 12 periods
         if len(period_labels) > 12:
             ax.tick_params(axis='x', rotation=45)
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+            for label in ax.xaxis.get_majorticklabels():
+                label.set_horizontalalignment('right')
 
         # Add grid for readability
         ax.grid(True, alpha=0.3)
@@ -102,46 +114,19 @@ class TimeSeriesVisualizer:
         if annotation_ranges is None:
             annotation_ranges = []
 
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Create figure and axis (not via pyplot, so the figure is not tracked in
+        # pyplot's global figure list and can be rendered off the Tk thread)
+        fig = Figure(figsize=(10, 6))
+        ax = fig.add_subplot()
 
         # Draw annotation ranges FIRST (lowest z-order)
-        # Map period labels to indices for position lookup
-        period_to_index = {label: idx for idx, label in enumerate(period_labels)}
-
-        # Define color scheme for exclusion types
-        exclusion_colors = {
-            'baseline': '#BBDEFB',      # Light blue
-            'volatility': '#FFF9C4',    # Light yellow
-            'both': '#FFE0B2'           # Light orange
-        }
-
-        for annotation in annotation_ranges:
-            start_date = annotation.get('start_date')
-            end_date = annotation.get('end_date')
-            exclude_from = annotation.get('exclude_from', 'both')
-
-            # Find indices for start and end dates
-            if start_date in period_to_index and end_date in period_to_index:
-                start_idx = period_to_index[start_date]
-                end_idx = period_to_index[end_date]
-
-                # Draw shaded region using axvspan
-                # Use -0.5 and +0.5 to extend to edges of bar positions
-                color = exclusion_colors.get(exclude_from, '#E0E0E0')
-                ax.axvspan(
-                    start_idx - 0.5,
-                    end_idx + 0.5,
-                    alpha=0.25,
-                    color=color,
-                    zorder=1
-                )
+        TimeSeriesVisualizer.add_annotation_spans(ax, period_labels, annotation_ranges)
 
         # Plot time series as line (zorder=2 by default)
         ax.plot(period_labels, values, marker='o', linestyle='-', linewidth=2, markersize=6)
 
         # Overlay anomaly markers with higher zorder
-        if anomaly_indices:
+        if len(anomaly_indices) > 0:
             anomaly_labels = [period_labels[i] for i in anomaly_indices]
             anomaly_values = [values[i] for i in anomaly_indices]
             ax.scatter(
@@ -163,7 +148,8 @@ class TimeSeriesVisualizer:
         # Rotate x-axis labels if more than 12 periods
         if len(period_labels) > 12:
             ax.tick_params(axis='x', rotation=45)
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+            for label in ax.xaxis.get_majorticklabels():
+                label.set_horizontalalignment('right')
 
         # Add grid for readability
         ax.grid(True, alpha=0.3)
@@ -172,3 +158,56 @@ class TimeSeriesVisualizer:
         fig.tight_layout()
 
         return fig
+
+    @staticmethod
+    def add_annotation_spans(
+        ax,
+        period_labels: List[str],
+        annotation_ranges: List[Dict[str, Any]],
+        animated: bool = False,
+        period_index: Optional[Dict[str, int]] = None
+    ) -> List[Patch]:
+        """
+        Shade annotated date ranges on an existing axes.
+
+        Annotations whose start or end date is not in period_labels are skipped.
+
+        Args:
+            ax: matplotlib Axes to draw on
+            period_labels: List of period label strings on the x-axis
+            annotation_ranges: List of annotation dicts with start_date, end_date, exclude_from fields
+            animated: Mark spans as animated so they are left out of full redraws
+                      and can be blitted over a saved background (default: False)
+            period_index: Prebuilt period label -> index map for period_labels, so
+                          callers adding spans one at a time skip rebuilding it
+                          (default: built from period_labels)
+
+        Returns:
+            List of shaded span patches, in annotation order
+        """
+        if period_index is None:
+            period_index = {label: idx for idx, label in enumerate(period_labels)}
+
+        spans = []
+        for annotation in annotation_ranges:
+            start_date = annotation.get('start_date')
+            end_date = annotation.get('end_date')
+            exclude_from = annotation.get('exclude_from', 'both')
+
+            start_idx = period_index.get(start_date)
+            end_idx = period_index.get(end_date)
+
+            # Skip annotations whose dates are not on this chart
+            if start_idx is not None and end_idx is not None:
+                # Use -0.5 and +0.5 to extend to edges of bar positions
+                color = TimeSeriesVisualizer.EXCLUSION_COLORS.get(exclude_from, '#E0E0E0')
+                spans.append(ax.axvspan(
+                    start_idx - 0.5,
+                    end_idx + 0.5,
+                    alpha=0.25,
+                    color=color,
+                    zorder=1,
+                    animated=animated
+                ))
+
+        return spans
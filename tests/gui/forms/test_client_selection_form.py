@@ -0,0 +1,41 @@
+"""
+Unit tests for ClientSelectionForm.
+
+Tests incremental client list updates.
+"""
+import pytest
+
+from src.gui.forms.client_selection_form import ClientSelectionForm
+
+
+class TestSingleEditIndex:
+    """Test suite for patching the client list in place."""
+
+    @pytest.mark.parametrize('old, new, expected', [
+        ([], ['acme'], 0),
+        (['acme', 'widgets'], ['acme', 'beta', 'widgets'], 1),
+        (['acme', 'beta'], ['acme', 'beta', 'widgets'], 2),
+        (['acme', 'beta', 'widgets'], ['acme', 'widgets'], 1),
+        (['acme'], [], 0),
+    ])
+    def test_single_insert_or_remove_returns_index(self, old, new, expected):
+        """
+        Given: Client lists differing by one added or removed name
+        When: single_edit_index called
+        Then: Returns the index of that name
+        """
+        assert ClientSelectionForm.single_edit_index(old, new) == expected
+
+    @pytest.mark.parametrize('old, new', [
+        (['acme', 'beta'], ['acme', 'beta']),
+        (['acme', 'beta'], ['beta', 'widgets']),
+        (['acme'], ['beta', 'widgets']),
+        (['acme', 'beta', 'widgets'], ['widgets']),
+    ])
+    def test_other_changes_return_none(self, old, new):
+        """
+        Given: Client lists that are equal or differ by more than one name
+        When: single_edit_index called
+        Then: Returns None (full rebuild)
+        """
+        assert ClientSelectionForm.single_edit_index(old, new) is None
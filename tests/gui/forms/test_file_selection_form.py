@@ -153,6 +153,9 @@ class TestValidation:
         mock_filedialog.return_value = '/test/historical.csv'
         form._on_browse_historical_data()
 
+        # Validation runs once on the next idle pass
+        form.update_idletasks()
+
         # Verify proceed button enabled
         assert form.proceed_btn.cget('state') == 'normal'
         assert form.proceed_btn.cget('bg') == '#2196F3'
@@ -173,10 +176,29 @@ class TestValidation:
 
         mock_filedialog.return_value = '/test/cash_flow.xlsx'
         form._on_browse_cash_flow()
+        form.update_idletasks()
 
         # Verify proceed button still disabled
         assert form.proceed_btn.cget('state') == 'disabled'
 
+    @patch('tkinter.filedialog.askopenfilename')
+    def test_multiple_selections_validate_once(self, mock_filedialog, form):
+        """
+        Given: User selects several files before Tk goes idle
+        When: The idle pass runs
+        Then: Selections are validated once
+        """
+        form.update_idletasks()
+        form._validate_selections = Mock()
+
+        mock_filedialog.return_value = '/test/balance_sheet.xlsx'
+        form._on_browse_balance_sheet()
+        form._on_browse_profit_loss()
+        form._on_browse_cash_flow()
+        form.update_idletasks()
+
+        form._validate_selections.assert_called_once()
+
 
 class TestClearSelections:
     """Test suite for clear selections functionality."""
@@ -6,12 +6,21 @@ and initialization from templates and saved configurations.
 """
 import pytest
 import tkinter as tk
+from concurrent.futures import wait
 from unittest.mock import Mock, MagicMock, patch
 
 from src.gui.forms.forecast_params_form import ForecastParamsForm
 from src.models.forecast_scenario import ForecastScenarioModel, ForecastScenariosCollection
 
 
+def save_and_wait(form):
+    """Click save and report the background save once it finishes."""
+    form.on_save_clicked()
+    if form._save_future is not None:
+        wait([form._save_future], timeout=5)
+        form.poll_save()
+
+
 @pytest.fixture
 def tk_root():
     """Create Tk root for GUI tests."""
@@ -63,6 +72,7 @@ def forecast_form(mock_parent, mock_collection):
     mock_parent.get_config_manager.return_value = mock_config_mgr
 
     form = ForecastParamsForm(mock_parent, 'test-scenario-1')
+    form.build_pending_sections()
     return form
 
 
@@ -299,6 +309,7 @@ class TestExternalEventsInitialization:
         mock_parent.get_config_manager.return_value = mock_config_mgr
 
         form = ForecastParamsForm(mock_parent, 'test-scenario-1')
+        form.build_pending_sections()
 
         # Check listbox is empty
         assert len(form.external_events_list) == 0
@@ -323,6 +334,7 @@ class TestExternalEventsInitialization:
         mock_parent.get_config_manager.return_value = mock_config_mgr
 
         form = ForecastParamsForm(mock_parent, 'test-scenario-1')
+        form.build_pending_sections()
 
         # Check events loaded
         assert len(form.external_events_list) == 2
@@ -359,7 +371,7 @@ class TestExternalEventsParameterCollection:
 
         # Mock messagebox to avoid popup
         with patch('tkinter.messagebox.showinfo'):
-            forecast_form.on_save_clicked()
+            save_and_wait(forecast_form)
 
         # Verify set_parameter was called for external_events
         set_parameter_calls = mock_scenario.set_parameter.call_args_list
@@ -391,7 +403,7 @@ class TestExternalEventsParameterCollection:
 
         # Mock messagebox to avoid popup
         with patch('tkinter.messagebox.showinfo'):
-            forecast_form.on_save_clicked()
+            save_and_wait(forecast_form)
 
         # Verify set_parameter was called for external_events with empty list
         set_parameter_calls = mock_scenario.set_parameter.call_args_list
@@ -418,7 +430,7 @@ class TestExternalEventsParameterCollection:
 
         # Mock messagebox to avoid popup
         with patch('tkinter.messagebox.showinfo'):
-            forecast_form.on_save_clicked()
+            save_and_wait(forecast_form)
 
         # Verify reload happened (load_config called)
         mock_config_mgr.load_config.assert_called()
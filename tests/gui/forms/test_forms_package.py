@@ -0,0 +1,111 @@
+"""
+Unit tests for the src.gui.forms package.
+
+Tests that the package is a single module that loads form submodules lazily
+and resolves each exported form class on first access.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import src.gui.forms as forms
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _run_in_fresh_interpreter(code: str) -> str:
+    """Run code in a new interpreter from the project root and return stdout."""
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+
+def test_package_import_loads_single_module_and_only_eager_forms():
+    """Test importing the package registers one forms module and only the eager forms."""
+    output = _run_in_fresh_interpreter(
+        "import sys\n"
+        "import src.gui.forms\n"
+        "print(len([m for m in sys.modules if m.endswith('gui.forms')]))\n"
+        "print(sorted(m for m in sys.modules if m.startswith('src.gui.forms.')))\n"
+    )
+
+    assert output.splitlines() == [
+        '1',
+        "['src.gui.forms.budget_params_form', 'src.gui.forms.sample_params_form']",
+    ]
+
+
+def test_all_exports_resolve_to_form_classes():
+    """Test every name in __all__ resolves to a class defined in its submodule."""
+    for name in forms.__all__:
+        form_class = getattr(forms, name)
+        assert form_class.__name__ == name
+        assert form_class.__module__.startswith('src.gui.forms.')
+
+
+def test_dir_lists_unloaded_forms():
+    """Test dir() includes all exported forms."""
+    assert set(forms.__all__) <= set(dir(forms))
+
+
+def test_unknown_attribute_raises_attribute_error():
+    """Test unknown names raise AttributeError so hasattr() works."""
+    assert not hasattr(forms, 'NotAForm')
+
+
+def test_load_defers_module_execution_until_attribute_access():
+    """Test load() returns a module whose code runs on first attribute access."""
+    output = _run_in_fresh_interpreter(
+        "import sys\n"
+        "import src.gui.forms as forms\n"
+        "module = forms.load('anomaly_review_form')\n"
+        "print(type(module).__name__ == 'module')\n"
+        "print(module.AnomalyReviewForm.__name__)\n"
+        "print(type(module).__name__ == 'module')\n"
+        "print(forms.AnomalyReviewForm is module.AnomalyReviewForm)\n"
+    )
+
+    assert output.splitlines() == ['False', 'AnomalyReviewForm', 'True', 'True']
+
+
+def test_submodules_resolve_as_package_attributes():
+    """Test form submodules are reachable as attributes before explicit import."""
+    output = _run_in_fresh_interpreter(
+        "import src.gui.forms as forms\n"
+        "print(forms.scenario_list_form.ScenarioListForm is forms.ScenarioListForm)\n"
+    )
+
+    assert output == 'True'
+
+
+def test_preload_resolves_lazy_forms():
+    """Test preload() imports the requested lazy forms and caches them on the package."""
+    output = _run_in_fresh_interpreter(
+        "import sys\n"
+        "import src.gui.forms as forms\n"
+        "forms.preload('ScenarioListForm')\n"
+        "print('ScenarioListForm' in vars(forms))\n"
+        "print('src.gui.forms.anomaly_review_form' in sys.modules)\n"
+        "forms.preload()\n"
+        "print(all(name in vars(forms) for name in forms.__all__))\n"
+    )
+
+    assert output.splitlines() == ['True', 'False', 'True']
+
+
+def test_anomaly_review_form_import_defers_matplotlib():
+    """Test importing the anomaly review form does not load matplotlib until a chart is drawn."""
+    output = _run_in_fresh_interpreter(
+        "import sys\n"
+        "import src.gui.forms as forms\n"
+        "forms.preload('AnomalyReviewForm')\n"
+        "print('matplotlib' in sys.modules)\n"
+    )
+
+    assert output.splitlines() == ['False']
@@ -169,6 +169,7 @@ class TestTextColorFix(unittest.TestCase):
         parent.get_config_manager = Mock()
 
         form = MainMenuForm(parent)
+        form.update_idletasks()
 
         # Find all buttons
         buttons = self._find_widgets_by_type(form, tk.Button)
@@ -7,6 +7,7 @@ Tests cover:
 - TimeSeriesVisualizer chart generation
 - AnomalyReviewForm GUI integration
 """
+import numpy as np
 import pytest
 import tkinter as tk
 from unittest.mock import Mock, MagicMock, patch
@@ -44,6 +45,7 @@ def mock_cash_flow_model():
             }
         }
     ])
+    mock.get_row_by_name_substring = Mock(return_value=mock.get_operating.return_value[0])
     return mock
 
 
@@ -65,6 +67,7 @@ def mock_pl_model():
             }
         }
     ]
+    mock.get_row_by_name_substring = Mock(return_value=mock.calculated_rows[0])
     return mock
 
 
@@ -134,6 +137,30 @@ def test_anomaly_annotation_model_from_dict_deserialization():
     assert annotations[0]['confirmed'] is True
 
 
+def test_anomaly_annotation_model_remove_annotation_by_value():
+    """Removing an annotation matches by value and removes only the first match."""
+    model = AnomalyAnnotationModel()
+    first = {'start_date': 'Jan', 'end_date': 'Jan', 'exclude_from': 'both'}
+    second = {'start_date': 'Feb', 'end_date': 'Mar', 'exclude_from': 'baseline'}
+    model.add_annotation(first)
+    model.add_annotation(second)
+    model.add_annotation(dict(first))
+
+    assert model.remove_annotation(dict(first)) is True
+    assert model.get_annotations() == [second, first]
+    assert model.remove_annotation({'start_date': 'Dec'}) is False
+
+
+def test_anomaly_annotation_model_annotations_property_is_stored_list():
+    """The annotations property and get_annotations alias return the same stored list."""
+    model = AnomalyAnnotationModel()
+    annotations = model.annotations
+    model.add_annotation({'start_date': 'Jan', 'end_date': 'Jan', 'exclude_from': 'both'})
+
+    assert annotations is model.get_annotations()
+    assert len(annotations) == 1
+
+
 # Task 2: AnomalyDetector tests
 def test_anomaly_detector_detects_outlier():
     """Values >2σ from mean are flagged."""
@@ -178,6 +205,44 @@ def test_anomaly_detector_no_outliers():
     assert anomalies == []
 
 
+def test_anomaly_detector_accepts_ndarray():
+    """NumPy arrays give the same anomalies as lists, as plain Python numbers."""
+    detector = AnomalyDetector()
+    values = [100.0, 102.0, 98.0, 101.0, 99.0, 200.0]
+
+    anomalies = detector.detect_anomalies(np.array(values))
+
+    assert anomalies == detector.detect_anomalies(values)
+    assert type(anomalies[0][0]) is int
+    assert type(anomalies[0][2]) is float
+
+
+def test_anomaly_detector_loop_kernel_matches_numpy_kernel():
+    """The Numba loop kernel (run here as plain Python) agrees with the NumPy fallback."""
+    from src.services.anomaly_detector import _nsigma_loops, _nsigma_numpy
+
+    values = np.array([100.0, 102.0, 98.0, 101.0, 99.0, 200.0, -150.0, 100.5])
+
+    loop_indices, loop_magnitudes = _nsigma_loops(values, 1.5)
+    numpy_indices, numpy_magnitudes = _nsigma_numpy(values, 1.5)
+
+    assert loop_indices.tolist() == numpy_indices.tolist()
+    assert np.allclose(loop_magnitudes, numpy_magnitudes)
+    assert _nsigma_loops(np.full(4, 50.0), 2.0)[0].size == 0
+
+
+def test_anomaly_detector_warm_up_resolves_kernel():
+    """warm_up resolves the n-sigma kernel once and later detections reuse it."""
+    from src.services import anomaly_detector
+
+    AnomalyDetector.warm_up()
+    kernel = anomaly_detector._nsigma
+
+    assert kernel is not None
+    assert AnomalyDetector.detect_anomalies([100, 100, 100, 100, 100, 100, 500]) != []
+    assert anomaly_detector._nsigma is kernel
+
+
 # Task 3: TimeSeriesVisualizer tests
 def test_time_series_visualizer_basic_chart():
     """Chart without anomalies renders line plot."""
@@ -224,8 +289,47 @@ def test_time_series_visualizer_long_labels():
         assert rotation == 45.0
 
 
+def test_time_series_visualizer_add_annotation_spans_animated():
+    """Annotation spans can be added to existing axes as animated artists for blitting."""
+    visualizer = TimeSeriesVisualizer()
+    period_labels = ['Jan', 'Feb', 'Mar']
+    values = [100.0, 110.0, 105.0]
+    annotations = [
+        {'start_date': 'Jan', 'end_date': 'Feb', 'exclude_from': 'baseline'},
+        {'start_date': 'Jan', 'end_date': 'Dec', 'exclude_from': 'both'}  # Unknown period
+    ]
+
+    fig = visualizer.create_chart(period_labels, values, 'Test Metric')
+    axes = fig.axes[0]
+    spans = visualizer.add_annotation_spans(axes, period_labels, annotations, animated=True)
+
+    assert len(spans) == 1
+    assert spans[0].get_animated()
+    assert list(axes.patches) == spans
+
+
+def test_time_series_visualizer_spans_use_given_period_index():
+    """A prebuilt period_index positions spans; dates missing from it are skipped."""
+    visualizer = TimeSeriesVisualizer()
+    period_labels = ['Jan', 'Feb', 'Mar', 'Apr']
+    values = [100.0, 110.0, 105.0, 120.0]
+    period_index = {label: idx for idx, label in enumerate(period_labels)}
+    annotations = [
+        {'start_date': 'Feb', 'end_date': 'Mar'},
+        {'start_date': 'Jan', 'end_date': 'May'}  # End date not on chart
+    ]
+
+    fig = visualizer.create_chart(period_labels, values, 'Test Metric')
+    spans = visualizer.add_annotation_spans(
+        fig.axes[0], period_labels, annotations, period_index=period_index
+    )
+
+    x_ranges = [(span.get_x(), span.get_x() + span.get_width()) for span in spans]
+    assert x_ranges == [(0.5, 2.5)]
+
+
 # Task 4: AnomalyReviewForm integration tests
-@patch('src.gui.forms.anomaly_review_form.FigureCanvasTkAgg')
+@patch('matplotlib.backends.backend_tkagg.FigureCanvasTkAgg')
 def test_anomaly_review_form_displays_anomalies(mock_canvas, tk_root, mock_config_manager, mock_cash_flow_model, mock_pl_model):
     """Form renders charts and lists detected anomalies."""
     from src.gui.forms.anomaly_review_form import AnomalyReviewForm
@@ -249,10 +353,10 @@ def test_anomaly_review_form_displays_anomalies(mock_canvas, tk_root, mock_confi
 
     # Verify anomalies were detected
     assert len(form.anomalies_data) > 0
-    assert 'Net Cash Provided by Operating Activities' in [a[0] for a in form.anomalies_data]
+    assert 'Net Cash Provided by Operating Activities' in [a[0] for a in form.anomalies_data.values()]
 
 
-@patch('src.gui.forms.anomaly_review_form.FigureCanvasTkAgg')
+@patch('matplotlib.backends.backend_tkagg.FigureCanvasTkAgg')
 def test_anomaly_review_form_confirm_anomaly(mock_canvas, tk_root, mock_config_manager, mock_cash_flow_model, mock_pl_model):
     """Confirm button saves annotation with confirmed=True."""
     from src.gui.forms.anomaly_review_form import AnomalyReviewForm
@@ -281,11 +385,11 @@ def test_anomaly_review_form_confirm_anomaly(mock_canvas, tk_root, mock_config_m
         form.anomaly_listbox.selection_set(0)
         form.on_confirm_clicked()
 
-        # Verify save_config was called
-        assert mock_config_manager.save_config.called
+        # Verify the annotation was appended to the annotation log
+        assert mock_config_manager.append_anomaly_annotation_records.called
 
 
-@patch('src.gui.forms.anomaly_review_form.FigureCanvasTkAgg')
+@patch('matplotlib.backends.backend_tkagg.FigureCanvasTkAgg')
 def test_anomaly_review_form_dismiss_anomaly(mock_canvas, tk_root, mock_config_manager, mock_cash_flow_model, mock_pl_model):
     """Dismiss button saves annotation with confirmed=False."""
     from src.gui.forms.anomaly_review_form import AnomalyReviewForm
@@ -314,11 +418,11 @@ def test_anomaly_review_form_dismiss_anomaly(mock_canvas, tk_root, mock_config_m
         form.anomaly_listbox.selection_set(0)
         form.on_dismiss_clicked()
 
-        # Verify save_config was called
-        assert mock_config_manager.save_config.called
+        # Verify the annotation was appended to the annotation log
+        assert mock_config_manager.append_anomaly_annotation_records.called
 
 
-@patch('src.gui.forms.anomaly_review_form.FigureCanvasTkAgg')
+@patch('matplotlib.backends.backend_tkagg.FigureCanvasTkAgg')
 def test_anomaly_review_form_no_anomalies(mock_canvas, tk_root, mock_config_manager):
     """No anomalies displays appropriate message."""
     from src.gui.forms.anomaly_review_form import AnomalyReviewForm
@@ -332,6 +436,7 @@ def test_anomaly_review_form_no_anomalies(mock_canvas, tk_root, mock_config_mana
             'values': {'Jan': 100.0, 'Feb': 101.0, 'Mar': 99.0}
         }
     ])
+    mock_cf.get_row_by_name_substring = Mock(return_value=mock_cf.get_operating.return_value[0])
 
     mock_pl = Mock()
     mock_pl.get_periods = Mock(return_value=['Jan', 'Feb', 'Mar'])
@@ -341,6 +446,7 @@ def test_anomaly_review_form_no_anomalies(mock_canvas, tk_root, mock_config_mana
             'values': {'Jan': 50.0, 'Feb': 51.0, 'Mar': 49.0}
         }
     ]
+    mock_pl.get_row_by_name_substring = Mock(return_value=mock_pl.calculated_rows[0])
 
     # Setup mock parent
     parent = tk.Frame(tk_root)
@@ -362,7 +468,7 @@ def test_anomaly_review_form_no_anomalies(mock_canvas, tk_root, mock_config_mana
     assert len(form.anomalies_data) == 0
 
 
-@patch('src.gui.forms.anomaly_review_form.FigureCanvasTkAgg')
+@patch('matplotlib.backends.backend_tkagg.FigureCanvasTkAgg')
 def test_anomaly_review_form_missing_data(mock_canvas, tk_root, mock_config_manager):
     """Missing financial models displays error message."""
     from src.gui.forms.anomaly_review_form import AnomalyReviewForm
@@ -380,3 +486,63 @@ def test_anomaly_review_form_missing_data(mock_canvas, tk_root, mock_config_mana
     # Form should handle missing data gracefully
     # (visual inspection would show error message)
     assert form is not None
+
+
+def test_anomaly_review_form_period_values_fills_missing_periods():
+    """period_values aligns row values with periods and fills missing periods with 0.0."""
+    from src.gui.forms.anomaly_review_form import AnomalyReviewForm
+
+    values = {'Jan': 100.0, 'Feb': 102.0, 'Mar': 98.0}
+
+    assert AnomalyReviewForm.period_values(values, ['Jan', 'Feb', 'Mar']).tolist() == [100.0, 102.0, 98.0]
+    assert AnomalyReviewForm.period_values(values, ['Mar', 'Apr']).tolist() == [98.0, 0.0]
+    assert AnomalyReviewForm.period_values(values, ['Feb']).tolist() == [102.0]
+
+
+def test_anomaly_annotation_form_cache_key_includes_threshold():
+    """Changing the detection threshold misses the anomaly cache."""
+    from collections import OrderedDict
+    from types import SimpleNamespace
+    from src.gui.forms.anomaly_annotation_form import AnomalyAnnotationForm
+
+    class StrictDetector(AnomalyDetector):
+        SIGMA_THRESHOLD = 1.0
+
+    periods = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
+    values = np.array([100.0, 101.0, 99.0, 100.0, 104.0, 100.0])
+    form = SimpleNamespace(
+        detector=AnomalyDetector(),
+        ANOMALY_CACHE_SIZE=AnomalyAnnotationForm.ANOMALY_CACHE_SIZE,
+        ANOMALY_CACHE_VERSION=AnomalyAnnotationForm.ANOMALY_CACHE_VERSION,
+    )
+
+    with patch.object(AnomalyAnnotationForm, '_anomaly_cache', OrderedDict()), \
+            patch.object(AnomalyAnnotationForm, '_anomaly_cache_loaded', True):
+        default = AnomalyAnnotationForm.detect_anomalies_cached(form, periods, values)
+        form.detector = StrictDetector()
+        strict = AnomalyAnnotationForm.detect_anomalies_cached(form, periods, values)
+
+        assert default == AnomalyDetector().detect_anomalies(values)
+        assert strict == StrictDetector().detect_anomalies(values)
+        assert len(AnomalyAnnotationForm._anomaly_cache) == 2
+
+
+def test_anomaly_annotation_form_load_cache_missing_file_not_created(tmp_path):
+    """Loading the anomaly cache without a cache file leaves it empty and writes nothing."""
+    from collections import OrderedDict
+    from types import SimpleNamespace
+    from src.gui.forms.anomaly_annotation_form import AnomalyAnnotationForm
+    from src.persistence.config_manager import ConfigManager
+
+    config_mgr = ConfigManager(tmp_path)
+    form = SimpleNamespace(
+        _config_mgr=config_mgr,
+        ANOMALY_CACHE_FILEPATH=AnomalyAnnotationForm.ANOMALY_CACHE_FILEPATH,
+    )
+    with patch.object(AnomalyAnnotationForm, '_anomaly_cache_loaded', False), \
+            patch.object(AnomalyAnnotationForm, '_anomaly_cache', OrderedDict()):
+        AnomalyAnnotationForm.load_anomaly_cache(form)
+
+        assert AnomalyAnnotationForm._anomaly_cache_loaded is True
+        assert not AnomalyAnnotationForm._anomaly_cache
+    assert not config_mgr.config_exists(AnomalyAnnotationForm.ANOMALY_CACHE_FILEPATH)
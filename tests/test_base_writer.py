@@ -204,6 +204,25 @@ class TestBaseExcelWriter:
         # Column C should be at least as wide as the text length * 1.2
         assert width_c >= len('Very Long Text Content That Should Make Column Wide') * 1.2
 
+    def test_collected_column_widths_match_auto_adjust(self, sample_workbook):
+        """Test track/apply_column_widths() match auto_adjust_column_widths() sizing."""
+        writer, ws = sample_workbook
+        rows = [
+            ['Short', 'Medium Length', None],
+            ['Very Long Text Content That Should Make Column Wide', 1234567.5, 3],
+        ]
+
+        col_widths = [0, 0, 0]
+        for row in rows:
+            ws.append(row)
+            writer.track_column_widths(col_widths, row)
+        writer.apply_column_widths(ws, col_widths)
+        collected = {col: ws.column_dimensions[col].width for col in 'ABC'}
+
+        writer.auto_adjust_column_widths(ws)
+        for col in 'ABC':
+            assert collected[col] == ws.column_dimensions[col].width
+
     def test_save_workbook(self):
         """Test save() creates .xlsx file loadable by openpyxl."""
         writer = BaseExcelWriter()
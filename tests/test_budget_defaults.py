@@ -293,3 +293,15 @@ class TestBudgetDefaultsService:
         assert defaults['revenue_growth_rate'] > 0
         # bs_model not used, so no calls expected
         assert not mock_bs_model.called
+
+    def test_calculate_defaults_returns_independent_dicts(self):
+        """
+        Given: No PLModel
+        When: calculate_defaults() called twice and the first result mutated
+        Then: Mutation does not leak into the second result
+        """
+        first = BudgetDefaultsService.calculate_defaults(pl_model=None)
+        first['category_growth_rates']['Sales'] = 99.0
+        second = BudgetDefaultsService.calculate_defaults(pl_model=None)
+
+        assert second['category_growth_rates'] == {}
@@ -81,6 +81,19 @@ class TestCashFlowModel:
         assert operating[0]['name'] == 'Net Income'
         assert operating[1].get('parent') is True
 
+    def test_get_row_by_name_substring(self, cash_flow_model):
+        """
+        Given: Model with hierarchy items ('name') and calculated rows ('account_name')
+        When: get_row_by_name_substring() called with differently-cased substrings
+        Then: Returns first matching row from either source, same object on repeat calls
+        """
+        row = cash_flow_model.get_row_by_name_substring('Net Cash Provided by Operating')
+
+        assert row['account_name'] == 'Net cash provided by operating activities'
+        assert cash_flow_model.get_row_by_name_substring('net cash provided by operating') is row
+        assert cash_flow_model.get_row_by_name_substring('notes payable')['name'] == 'Notes Payable'
+        assert cash_flow_model.get_row_by_name_substring('Missing Account') is None
+
     def test_get_investing(self, cash_flow_model):
         """
         Given: Model with empty INVESTING ACTIVITIES section
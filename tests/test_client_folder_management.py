@@ -135,6 +135,46 @@ def test_client_manager_discover_multiple(tmp_path):
     assert len(clients) == 3
 
 
+def test_client_manager_discover_reuses_scan_until_folder_changes(tmp_path):
+    """
+    Test: discover_clients reuses its cached scan until clients/ changes
+    """
+    clients_dir = tmp_path / 'clients'
+    clients_dir.mkdir()
+    (clients_dir / 'acme-corp').mkdir()
+
+    assert ClientManager.discover_clients(tmp_path) == ['acme-corp']
+    assert ClientManager._discover_cache[clients_dir][1] == ['acme-corp']
+
+    # Returned list is a copy; mutating it does not affect the cache
+    ClientManager.discover_clients(tmp_path).append('bogus')
+    assert ClientManager.discover_clients(tmp_path) == ['acme-corp']
+
+    ClientManager.create_client('widgets-inc', tmp_path)
+    assert ClientManager.discover_clients(tmp_path) == ['acme-corp', 'widgets-inc']
+
+    ClientManager.delete_client('acme-corp', tmp_path)
+    assert ClientManager.discover_clients(tmp_path) == ['widgets-inc']
+
+
+def test_client_manager_iter_client_names(tmp_path):
+    """
+    Test: iter_client_names yields client folders as clients/ is scanned
+    """
+    assert list(ClientManager.iter_client_names(tmp_path)) == []
+
+    clients_dir = tmp_path / 'clients'
+    clients_dir.mkdir()
+    (clients_dir / 'acme-corp').mkdir()
+    (clients_dir / 'widgets-inc').mkdir()
+    (clients_dir / 'not_a_client.txt').touch()
+
+    names = ClientManager.iter_client_names(tmp_path)
+
+    assert iter(names) is names
+    assert sorted(names) == ['acme-corp', 'widgets-inc']
+
+
 def test_client_manager_validate_path_traversal(tmp_path):
     """
     Test: validate_client_name rejects path traversal attempts
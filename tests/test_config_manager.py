@@ -4,10 +4,13 @@ Unit tests for ConfigManager class.
 Tests save/load operations, error handling, and path validation security.
 """
 import json
+import threading
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.persistence.config_manager import ConfigManager
+from src.models.anomaly_annotation import AnomalyAnnotationModel
 from src.models.parameters import ParameterModel
 
 
@@ -261,3 +264,229 @@ class TestConfigManager:
         assert loaded.get_parameter('bool_param') is True
         assert loaded.get_parameter('list_param') == [1, 2, 3]
         assert loaded.get_parameter('nested_dict') == {'key': 'value'}
+
+    def test_append_records_round_trip(self, config_manager):
+        """
+        Given: Records appended to a JSON Lines log in two writes
+        When: load_records
+        Then: All records returned in append order
+        """
+        filepath = 'log.jsonl'
+        config_manager.append_records([{'a': 1}], filepath)
+        config_manager.append_records([{'b': 2}, {'c': [3]}], filepath)
+
+        assert config_manager.load_records(filepath) == [{'a': 1}, {'b': 2}, {'c': [3]}]
+
+    def test_append_records_truncate_empties_log(self, config_manager):
+        """
+        Given: Existing log with records
+        When: append_records with truncate=True
+        Then: Log only contains the new records
+        """
+        filepath = 'log.jsonl'
+        config_manager.append_records([{'a': 1}], filepath)
+        config_manager.append_records([], filepath, truncate=True)
+
+        assert config_manager.load_records(filepath) == []
+
+    def test_load_records_missing_file_returns_empty(self, config_manager):
+        """
+        Given: No log file
+        When: load_records
+        Then: Empty list returned
+        """
+        assert config_manager.load_records('missing.jsonl') == []
+
+    def test_load_records_skips_partial_trailing_line(self, config_manager, temp_project_root):
+        """
+        Given: Log whose last line was cut off mid-write
+        When: load_records
+        Then: Complete records returned, partial line ignored
+        """
+        config_dir = Path(temp_project_root) / 'config'
+        config_dir.mkdir()
+        (config_dir / 'log.jsonl').write_text('{"a": 1}\n{"b": ')
+
+        assert config_manager.load_records('log.jsonl') == [{'a': 1}]
+
+    def test_append_records_after_partial_line_starts_new_line(self, config_manager, temp_project_root):
+        """
+        Given: Log whose last line was cut off mid-write
+        When: Records appended twice, then load_records
+        Then: Appended records are intact on their own lines; the torn line is skipped
+        """
+        config_dir = Path(temp_project_root) / 'config'
+        config_dir.mkdir()
+        (config_dir / 'log.jsonl').write_text('{"a": 1}\n{"b": 2')
+
+        config_manager.append_records([{'c': 3}], 'log.jsonl')
+        config_manager.append_records([{'d': 4}], 'log.jsonl')
+
+        assert config_manager.load_records('log.jsonl') == [{'a': 1}, {'c': 3}, {'d': 4}]
+
+    def test_append_records_rejects_traversal(self, config_manager):
+        """
+        Given: Log path outside config directory
+        When: append_records
+        Then: ValueError raised
+        """
+        with pytest.raises(ValueError, match="must be within config directory"):
+            config_manager.append_records([{'a': 1}], '../outside.jsonl')
+
+    def test_load_anomaly_annotations_folds_review_form_log(self, config_manager):
+        """
+        Given: Annotations appended to the log with no annotations file yet
+        When: load_anomaly_annotations
+        Then: Logged annotations are returned and no annotations file is created
+        """
+        first = {'start_date': 'Jan', 'end_date': 'Jan', 'reason': 'Spike'}
+        second = {'start_date': 'Feb', 'end_date': 'Mar', 'reason': 'Promo'}
+        config_manager.append_anomaly_annotation_records([first])
+        config_manager.append_anomaly_annotation_records([second])
+
+        model = config_manager.load_anomaly_annotations()
+
+        assert isinstance(model, AnomalyAnnotationModel)
+        assert model.get_annotations() == [first, second]
+        assert config_manager.config_exists(ConfigManager.ANOMALY_ANNOTATIONS_FILEPATH) is False
+
+    def test_load_anomaly_annotations_keeps_duplicate_adds(self, config_manager):
+        """
+        Given: Log adding one annotation twice, then deleting one copy
+        When: load_anomaly_annotations
+        Then: One copy remains
+        """
+        annotation = {'start_date': 'Jan', 'end_date': 'Jan', 'reason': 'Spike'}
+        config_manager.append_anomaly_annotation_records(
+            [annotation, annotation, {'__delete__': annotation}]
+        )
+
+        assert config_manager.load_anomaly_annotations().get_annotations() == [annotation]
+
+    def test_load_anomaly_annotations_compacts_log(self, config_manager):
+        """
+        Given: Log longer than the compaction threshold
+        When: load_anomaly_annotations twice, then another record appended
+        Then: The folded model is saved once, the log restarts at the next generation
+        """
+        threshold = ConfigManager.ANOMALY_ANNOTATION_LOG_COMPACT_THRESHOLD
+        annotations = [{'start_date': f'P{i}', 'end_date': f'P{i}'} for i in range(threshold + 1)]
+        config_manager.append_anomaly_annotation_records(annotations)
+
+        assert config_manager.load_anomaly_annotations().get_annotations() == annotations
+        assert config_manager.load_records(ConfigManager.ANOMALY_ANNOTATION_LOG_FILEPATH) == [{'__generation__': 1}]
+        assert config_manager.load_anomaly_annotations().get_annotations() == annotations
+
+        extra = {'start_date': 'Q1', 'end_date': 'Q1'}
+        config_manager.append_anomaly_annotation_records([extra])
+        assert config_manager.load_anomaly_annotations().get_annotations() == annotations + [extra]
+
+    def test_load_anomaly_annotations_after_compaction_crash(self, config_manager):
+        """
+        Given: Compaction saved the folded model but crashed before truncating the log
+        When: load_anomaly_annotations
+        Then: The stale log is not replayed again and is truncated
+        """
+        first = {'start_date': 'Jan', 'end_date': 'Jan', 'reason': 'Spike'}
+        second = {'start_date': 'Feb', 'end_date': 'Mar', 'reason': 'Promo'}
+        config_manager.append_anomaly_annotation_records([first, second, {'__delete__': first}])
+        config_manager.save_config(
+            AnomalyAnnotationModel(parameters={'annotations': [second], 'log_generation': 1}),
+            ConfigManager.ANOMALY_ANNOTATIONS_FILEPATH
+        )
+
+        assert config_manager.load_anomaly_annotations().get_annotations() == [second]
+        assert config_manager.load_records(ConfigManager.ANOMALY_ANNOTATION_LOG_FILEPATH) == [{'__generation__': 1}]
+
+    def test_config_exists_does_not_create_file(self, config_manager, sample_model):
+        """
+        Given: No config file yet
+        When: config_exists, then save_config
+        Then: False without creating the file, then True once saved
+        """
+        filepath = 'exists.json'
+        assert config_manager.config_exists(filepath) is False
+        assert not (config_manager.config_dir / filepath).exists()
+
+        config_manager.save_config(sample_model, filepath)
+        assert config_manager.config_exists(filepath) is True
+
+    def test_load_config_returns_independent_models_reflecting_saves(self, config_manager, sample_model):
+        """
+        Given: Saved config loaded once
+        When: Loaded again after mutating a result, and after re-saving
+        Then: Mutations do not leak into later loads, and a save is picked up
+        """
+        filepath = 'reload.json'
+        config_manager.save_config(sample_model, filepath)
+
+        first = config_manager.load_config(filepath)
+        first.set_parameter('revenue_growth_rate', 0.5)
+        second = config_manager.load_config(filepath)
+
+        assert second is not first
+        assert second.get_parameter('revenue_growth_rate') == 0.05
+
+        config_manager.save_config(ParameterModel(parameters={'revenue_growth_rate': 0.2}), filepath)
+        assert config_manager.load_config(filepath).get_parameter('revenue_growth_rate') == 0.2
+
+    def test_load_config_accepts_non_finite_floats(self, config_manager):
+        """
+        Given: Saved config containing NaN (written by json.dump as a bare NaN literal)
+        When: load_config
+        Then: Value round-trips as NaN
+        """
+        config_manager.save_config(ParameterModel(parameters={'rate': float('nan')}), 'nan.json')
+
+        loaded = config_manager.load_config('nan.json')
+
+        assert loaded.get_parameter('rate') != loaded.get_parameter('rate')
+
+    def test_save_config_unserializable_keeps_existing_file(self, config_manager, sample_model):
+        """
+        Given: Saved config
+        When: save_config called with a value JSON cannot encode
+        Then: TypeError raised and the existing file is left intact
+        """
+        config_manager.save_config(sample_model, 'keep.json')
+
+        with pytest.raises(TypeError):
+            config_manager.save_config(ParameterModel(parameters={'bad': object()}), 'keep.json')
+
+        loaded = config_manager.load_config('keep.json')
+        assert loaded.get_parameter('revenue_growth_rate') == 0.05
+
+    def test_save_config_write_failure_keeps_existing_file(self, config_manager, sample_model):
+        """
+        Given: Saved config
+        When: Writing the replacement fails part-way
+        Then: Error raised, existing file intact and no temp file left behind
+        """
+        config_manager.save_config(sample_model, 'atomic.json')
+
+        with patch('src.persistence.config_manager.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                config_manager.save_config(ParameterModel(parameters={'revenue_growth_rate': 0.2}), 'atomic.json')
+
+        loaded = config_manager.load_config('atomic.json')
+        assert loaded.get_parameter('revenue_growth_rate') == 0.05
+        assert [p.name for p in config_manager.config_dir.iterdir()] == ['atomic.json']
+
+    def test_save_config_concurrent_saves_leave_valid_file(self, config_manager):
+        """
+        Given: Two threads saving the same config repeatedly
+        When: Both finish
+        Then: File holds one complete save and no temp files are left behind
+        """
+        def save_many(rate):
+            for _ in range(20):
+                config_manager.save_config(ParameterModel(parameters={'rate': rate}), 'shared.json')
+
+        threads = [threading.Thread(target=save_many, args=(rate,)) for rate in (0.1, 0.2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert config_manager.load_config('shared.json').get_parameter('rate') in (0.1, 0.2)
+        assert [p.name for p in config_manager.config_dir.iterdir()] == ['shared.json']
@@ -5,13 +5,23 @@ Tests form initialization, field population, save operations, back navigation,
 and error handling with mocked ConfigManager.
 """
 import pytest
+import threading
 import tkinter as tk
+from concurrent.futures import wait
 from unittest.mock import Mock, patch
 
 from src.gui.forms.forecast_params_form import ForecastParamsForm
 from src.models.forecast_scenario import ForecastScenarioModel, ForecastScenariosCollection
 
 
+def save_and_wait(form):
+    """Click save and report the background save once it finishes."""
+    form.on_save_clicked()
+    if form._save_future is not None:
+        wait([form._save_future], timeout=5)
+        form.poll_save()
+
+
 @pytest.fixture
 def tk_root():
     """Create Tk root for GUI tests."""
@@ -114,6 +124,7 @@ class TestForecastParamsForm:
         mock_parent.get_config_manager.return_value = mock_config_manager
 
         form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+        form.build_pending_sections()
 
         # Verify all required fields exist
         assert 'monthly_rate' in form.fields
@@ -125,6 +136,42 @@ class TestForecastParamsForm:
         assert 'planned_capex' in form.fields
         assert 'debt_payments' in form.fields
 
+    def test_forecast_params_form_builds_tabs_on_demand(self, mock_parent, mock_config_manager):
+        """
+        Given: ForecastParamsForm initialized
+        When: Expenses tab selected
+        Then: Only the revenue section exists until its tab is shown
+        """
+        mock_parent.get_config_manager.return_value = mock_config_manager
+
+        form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+
+        assert 'monthly_rate' in form.fields
+        assert 'cogs_trend' not in form.fields
+
+        form.notebook.select(1)
+        form.update()
+
+        assert form.fields['cogs_trend'].get_value() == 0.04
+        assert 'collection_period_days' not in form.fields
+
+    @patch('src.gui.forms.forecast_params_form.messagebox')
+    def test_save_builds_unshown_sections(self, mock_messagebox, mock_parent, mock_config_manager):
+        """
+        Given: Only the first tab was ever shown
+        When: Save clicked
+        Then: Loaded values of the other sections are saved unchanged
+        """
+        mock_parent.get_config_manager.return_value = mock_config_manager
+
+        form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+        save_and_wait(form)
+
+        saved_collection = mock_config_manager.save_config.call_args[0][0]
+        saved_scenario = saved_collection.get_scenario('test-scenario-id')
+        assert saved_scenario.get_parameter('expense_trend_adjustments')['cogs_trend'] == 0.04
+        assert saved_scenario.get_parameter('cash_flow_timing_params')['payment_terms_days'] == 35
+
     def test_forecast_params_form_field_population(self, mock_parent, mock_config_manager):
         """
         Given: Scenario with various parameter values
@@ -134,6 +181,7 @@ class TestForecastParamsForm:
         mock_parent.get_config_manager.return_value = mock_config_manager
 
         form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+        form.build_pending_sections()
 
         # Verify revenue section fields
         assert form.fields['monthly_rate'].get_value() == 0.07
@@ -162,12 +210,13 @@ class TestForecastParamsForm:
         mock_parent.get_config_manager.return_value = mock_config_manager
 
         form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+        form.build_pending_sections()
 
         # Modify cogs_trend field
         form.fields['cogs_trend'].set_value("0.05")
 
         # Click save button
-        form.on_save_clicked()
+        save_and_wait(form)
 
         # Verify save_config was called
         mock_config_manager.save_config.assert_called()
@@ -204,6 +253,55 @@ class TestForecastParamsForm:
         # Verify no kwargs passed (back to list with no context)
         assert len(call_args[1]) == 0
 
+    @patch('src.gui.forms.forecast_params_form.messagebox')
+    def test_back_waits_for_pending_save(self, mock_messagebox, mock_parent, mock_config_manager):
+        """
+        Given: A save still running in the background
+        When: Back button clicked
+        Then: The save finishes and is reported before the scenario list is shown
+        """
+        mock_parent.get_config_manager.return_value = mock_config_manager
+        release = threading.Event()
+        saved = []
+
+        def slow_save(*args, **kwargs):
+            release.wait(timeout=5)
+            saved.append(True)
+
+        mock_config_manager.save_config.side_effect = slow_save
+
+        form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+        form.on_save_clicked()
+        threading.Timer(0.05, release.set).start()
+
+        form.on_back_clicked()
+
+        assert saved == [True]
+        mock_messagebox.showinfo.assert_called_once()
+        mock_parent.show_form.assert_called_once()
+        assert form._save_poll_after is None
+
+    @patch('src.gui.forms.forecast_params_form.messagebox')
+    def test_destroy_cancels_pending_save_poll(self, mock_messagebox, mock_parent, mock_config_manager):
+        """
+        Given: A save still running in the background
+        When: The form is destroyed
+        Then: The scheduled save poll is cancelled
+        """
+        mock_parent.get_config_manager.return_value = mock_config_manager
+        release = threading.Event()
+        mock_config_manager.save_config.side_effect = lambda *args, **kwargs: release.wait(timeout=5)
+
+        form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+        form.on_save_clicked()
+        poll_after = form._save_poll_after
+        form.destroy()
+        release.set()
+
+        assert poll_after is not None
+        assert form._save_poll_after is None
+        assert poll_after not in mock_parent.tk.call('after', 'info')
+
     @patch('src.gui.forms.forecast_params_form.messagebox')
     def test_save_operation_updates_all_parameter_categories(
         self,
@@ -219,6 +317,7 @@ class TestForecastParamsForm:
         mock_parent.get_config_manager.return_value = mock_config_manager
 
         form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
+        form.build_pending_sections()
 
         # Modify fields in all sections
         form.fields['monthly_rate'].set_value("0.08")
@@ -227,7 +326,7 @@ class TestForecastParamsForm:
         form.fields['planned_capex'].set_value("200000, 100000")
 
         # Save
-        form.on_save_clicked()
+        save_and_wait(form)
 
         # Verify all categories updated
         call_args = mock_config_manager.save_config.call_args
@@ -272,7 +371,7 @@ class TestForecastParamsForm:
         form = ForecastParamsForm(mock_parent, scenario_id='test-scenario-id')
 
         # Click save button
-        form.on_save_clicked()
+        save_and_wait(form)
 
         # Verify error message shown
         assert mock_messagebox.showerror.call_count >= 1
@@ -308,7 +407,7 @@ class TestForecastParamsForm:
         form.fields['use_averaged'].set(0)
 
         # Save
-        form.on_save_clicked()
+        save_and_wait(form)
 
         # Verify checkbox state saved
         call_args = mock_config_manager.save_config.call_args
@@ -316,3 +415,22 @@ class TestForecastParamsForm:
         saved_scenario = saved_collection.get_scenario('test-scenario-id')
 
         assert saved_scenario.get_parameter('revenue_growth_rates')['use_averaged'] is False
+
+    def test_split_comma_list_strips_and_drops_empty_items(self):
+        """
+        Given: Comma-separated entry text with spaces and empty items
+        When: split_comma_list called
+        Then: Returns stripped, non-empty items in order
+        """
+        assert ForecastParamsForm.split_comma_list(' 100000, ,50000 ,') == ['100000', '50000']
+        assert ForecastParamsForm.split_comma_list('') == []
+
+    def test_format_event_display_string(self):
+        """
+        Given: External event dict
+        When: format_event called
+        Then: Returns the listbox row text
+        """
+        event = {'month': 3, 'impact_type': 'revenue', 'magnitude': -10.0, 'description': 'Lost client'}
+
+        assert ForecastParamsForm.format_event(event) == 'Month 3 | revenue | -10.0% | Lost client'
@@ -3,10 +3,13 @@ Unit tests for reusable form field components.
 
 Tests data binding (get_value/set_value) and validation for GUI components.
 """
+import numpy as np
 import pytest
 import tkinter as tk
 
 from src.gui.components.form_fields import LabeledEntry, NumericEntry, LabeledDropdown
+from src.gui.components.fonts import get_font
+from src.gui.components.images import png_to_photo_image, rgba_to_photo_image, rgba_to_png, rgba_to_ppm
 
 
 @pytest.fixture
@@ -340,3 +343,74 @@ class TestLabeledDropdown:
         value = dropdown.get_value()
 
         assert value == "Gamma"
+
+
+class TestGetFont:
+    """Test suite for shared form fonts."""
+
+    def test_font_shared_per_root(self, tk_root):
+        """
+        Given: Two widgets under the same Tk root
+        When: get_font called with the same size and weight
+        Then: The same named font is returned and applies to widgets
+        """
+        label = tk.Label(tk_root, text="A", font=get_font(tk_root, 10, 'bold'))
+
+        font = get_font(label, 10, 'bold')
+
+        assert font is get_font(tk_root, 10, 'bold')
+        assert font is not get_font(tk_root, 10)
+        assert font.actual('weight') == 'bold'
+        assert label['font'] == str(font)
+
+
+class TestChartImages:
+    """Test suite for converting rendered chart pixels to Tk images."""
+
+    def test_rgba_to_ppm_drops_alpha(self):
+        """
+        Given: 2x3 RGBA buffer
+        When: rgba_to_ppm called
+        Then: Returns a P6 header followed by the RGB bytes in row order
+        """
+        buffer = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+
+        data = rgba_to_ppm(buffer)
+
+        header = b'P6 3 2 255\n'
+        assert data.startswith(header)
+        assert data[len(header):] == buffer[..., :3].tobytes()
+
+    def test_photo_image_matches_buffer(self, tk_root):
+        """
+        Given: RGBA buffer
+        When: rgba_to_photo_image called
+        Then: PhotoImage has the buffer's size and pixel colors
+        """
+        buffer = np.zeros((4, 5, 4), dtype=np.uint8)
+        buffer[..., 3] = 255
+        buffer[1, 2, :3] = (255, 0, 0)
+
+        photo = rgba_to_photo_image(buffer, tk_root)
+
+        assert (photo.width(), photo.height()) == (5, 4)
+        assert tuple(photo.get(2, 1)) == (255, 0, 0)
+        assert tuple(photo.get(0, 0)) == (0, 0, 0)
+
+    def test_png_photo_image_matches_buffer(self, tk_root):
+        """
+        Given: RGBA buffer encoded with rgba_to_png
+        When: png_to_photo_image called
+        Then: PhotoImage has the buffer's size and pixel colors
+        """
+        buffer = np.zeros((4, 5, 4), dtype=np.uint8)
+        buffer[..., 3] = 255
+        buffer[1, 2, :3] = (255, 0, 0)
+
+        data = rgba_to_png(buffer)
+        photo = png_to_photo_image(data, tk_root)
+
+        assert data.startswith(b'\x89PNG')
+        assert (photo.width(), photo.height()) == (5, 4)
+        assert tuple(photo.get(2, 1)) == (255, 0, 0)
+        assert tuple(photo.get(0, 0)) == (0, 0, 0)
@@ -294,6 +294,7 @@ class TestMainMenuFormHorizonSelector(unittest.TestCase):
 
         # Create main menu form
         form = MainMenuForm(app)
+        form.update_idletasks()
 
         # Verify horizon_var is set to "6" (default)
         self.assertEqual(form.horizon_var.get(), "6")
@@ -316,6 +317,7 @@ class TestMainMenuFormHorizonSelector(unittest.TestCase):
         # Create app
         app = App(self.temp_dir)
         form = MainMenuForm(app)
+        form.update_idletasks()
 
         # Simulate changing horizon to 12 months
         form.horizon_var.set("12")
@@ -340,6 +342,7 @@ class TestMainMenuFormHorizonSelector(unittest.TestCase):
         # Create new app session (simulates restart)
         app2 = App(self.temp_dir)
         form2 = MainMenuForm(app2)
+        form2.update_idletasks()
 
         # Verify horizon is still 12 months (persisted)
         self.assertEqual(form2.horizon_var.get(), "12")
@@ -356,6 +359,7 @@ class TestMainMenuFormHorizonSelector(unittest.TestCase):
         # Create app and form
         app = App(self.temp_dir)
         form = MainMenuForm(app)
+        form.update_idletasks()
 
         # Search for widgets containing help text
         help_text_found = False
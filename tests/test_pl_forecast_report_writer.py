@@ -235,3 +235,18 @@ def test_pl_currency_formatting(mock_pl_forecast_model_6month):
     currency_calls = writer.format_currency.call_args_list
 
     assert len(currency_calls) >= 1, "Currency formatting should be applied to value columns"
+
+
+def test_pl_margin_rows_keep_percentage_format(mock_pl_forecast_model_6month):
+    """Test that margin rows are not overwritten by currency formatting."""
+    writer = PLForecastReportWriter()
+    writer.write(mock_pl_forecast_model_6month)
+
+    ws = writer.workbook['P&L Forecast']
+
+    for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
+        label = str(row[0].value or '')
+        if 'Gross Margin %' in label:
+            assert all(cell.number_format == '0.00%' for cell in row[1:])
+        elif 'Gross Profit' in label:
+            assert all(cell.number_format == '$#,##0.00' for cell in row[1:])
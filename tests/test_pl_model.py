@@ -426,3 +426,13 @@ class TestPLModel:
 
         assert isinstance(df, pd.DataFrame)
         assert df.shape == sample_dataframe.shape
+
+    def test_get_row_by_name_substring(self, pl_model):
+        """
+        Given: PLModel with calculated rows
+        When: get_row_by_name_substring() called
+        Then: returns first calculated row containing the substring, ignoring case
+        """
+        assert pl_model.get_row_by_name_substring('net income')['account_name'] == 'Net Income'
+        assert pl_model.get_row_by_name_substring('OPERATING')['account_name'] == 'Net Operating Income'
+        assert pl_model.get_row_by_name_substring('Net Loss') is None